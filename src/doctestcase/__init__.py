@@ -1,12 +1,25 @@
 from .__version__ import __version__ as __version__
 from .case import doctestcase
-from .format import get_body, get_title, to_markdown, to_rest
+from .format import (
+    get_body,
+    get_title,
+    iter_cases,
+    iter_markdown,
+    iter_rest,
+    to_markdown,
+    to_rest,
+)
+from .globs import lazy
 
 
 __all__ = [
     'doctestcase',
     'get_body',
     'get_title',
+    'iter_cases',
+    'iter_markdown',
+    'iter_rest',
+    'lazy',
     'to_markdown',
     'to_rest',
 ]
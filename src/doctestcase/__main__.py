@@ -0,0 +1,257 @@
+import argparse
+from functools import partial
+import json
+import os
+import sys
+import unittest
+
+from .cache import ENV_VAR, ResultCache, write_atomic
+from .index import Index
+from .parallel import ParallelSuite, discover
+from .render import Renderer
+from .report import JSONLReport, JUnitReport, ReportingTestResult
+from .shard import (
+    TimingReport,
+    load_timings,
+    merge_timings,
+    parse_shard,
+    save_timings,
+    split_shards,
+)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m doctestcase',
+        description='Run test cases decorated with doctestcase.',
+    )
+    commands = parser.add_subparsers(dest='command')
+
+    run = commands.add_parser('run', help='run test cases in parallel')
+    run.add_argument(
+        'targets',
+        nargs='*',
+        default=['.'],
+        help='directories or dotted names of modules, classes or methods',
+    )
+    run.add_argument(
+        '-j',
+        '--jobs',
+        type=int,
+        default=None,
+        help='number of worker processes; defaults to number of CPUs',
+    )
+    run.add_argument(
+        '-p', '--pattern', default='test*.py', help='test module file name pattern'
+    )
+    run.add_argument(
+        '-t', '--top-level-directory', default=None, help='top level directory'
+    )
+    run.add_argument('-f', '--failfast', action='store_true', help='stop on failure')
+    run.add_argument(
+        '--maxfail',
+        type=int,
+        default=None,
+        metavar='N',
+        help='stop after N failed tests',
+    )
+    run.add_argument(
+        '--cache-dir',
+        default=None,
+        help='skip test cases unchanged since their last successful run',
+    )
+    run.add_argument(
+        '--cache-clear', action='store_true', help='clear cache before the run'
+    )
+    run.add_argument(
+        '--shard',
+        type=parse_shard,
+        default=None,
+        metavar='I/N',
+        help='run only I-th of N shards of equal expected runtime',
+    )
+    run.add_argument(
+        '--timings',
+        metavar='FILE',
+        default=None,
+        help='balance shards by durations from FILE, which is not changed',
+    )
+    run.add_argument(
+        '--timings-out',
+        metavar='FILE',
+        default=None,
+        help='record durations to FILE; must differ from --timings with --shard',
+    )
+    run.add_argument(
+        '--jsonl', metavar='FILE', help='write example results as JSON lines'
+    )
+    run.add_argument(
+        '--junit-xml', metavar='FILE', help='write example results as JUnit XML'
+    )
+    run.add_argument(
+        '-v', '--verbose', dest='verbosity', action='store_const', const=2, default=1
+    )
+    run.add_argument('-q', '--quiet', dest='verbosity', action='store_const', const=0)
+
+    index = commands.add_parser(
+        'index', help='list test cases found in source files without importing'
+    )
+    index.add_argument(
+        'paths', nargs='*', default=['.'], help='source files or directories'
+    )
+    index.add_argument(
+        '-o', '--output', default=None, help='update index in JSON file instead'
+    )
+
+    render = commands.add_parser(
+        'render', help='render docstrings of test cases without importing'
+    )
+    render.add_argument(
+        'locations',
+        nargs='+',
+        help='qualified names, their patterns, or path/to/file.py:ClassName',
+    )
+    render.add_argument(
+        '-s',
+        '--source',
+        dest='sources',
+        action='append',
+        default=None,
+        help='source file or directory to index; defaults to current directory',
+    )
+    render.add_argument(
+        '--index', metavar='FILE', default=None, help='reuse and update index file'
+    )
+    render.add_argument(
+        '-f', '--format', choices=['markdown', 'rest'], default='markdown'
+    )
+    render.add_argument('--title-depth', type=int, default=2, help='for markdown')
+    render.add_argument('--title-char', default='-', help='for rest')
+    render.add_argument(
+        '--no-title',
+        dest='include_title',
+        action='store_false',
+        help='omit docstring titles',
+    )
+    render.add_argument(
+        '--cache-dir', default=None, help='cache rendered docstrings on disk'
+    )
+    render.add_argument(
+        '-o',
+        '--output-dir',
+        default=None,
+        help='write every test case to its own file instead of stdout',
+    )
+
+    timings = commands.add_parser(
+        'timings', help='merge timings files recorded by shards'
+    )
+    timings.add_argument('paths', nargs='+', help='timings files to merge')
+    timings.add_argument(
+        '-o', '--output', default=None, help='write to file instead of stdout'
+    )
+
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        # every shard must be split by the same timings
+        paths = [os.path.abspath(p) for p in (args.timings, args.timings_out) if p]
+        if args.shard is not None and len(paths) == 2 and paths[0] == paths[1]:
+            parser.error('--timings-out must differ from --timings with --shard')
+        return run_tests(args)
+    elif args.command == 'index':
+        return update_index(args)
+    elif args.command == 'render':
+        return render_docs(args)
+    elif args.command == 'timings':
+        return write_timings(args)
+    parser.print_help()
+    return 2
+
+
+def run_tests(args):
+    if args.cache_dir:
+        os.environ[ENV_VAR] = args.cache_dir  # inherited by worker processes
+    if args.cache_clear and os.environ.get(ENV_VAR):
+        ResultCache(os.environ[ENV_VAR]).clear()
+
+    sys.path.insert(0, '.')
+    tests = discover(args.targets, args.pattern, args.top_level_directory)
+    if args.shard is not None:
+        index, count = args.shard
+        timings = load_timings(args.timings) if args.timings else {}
+        tests = split_shards(tests, count, timings)[index]
+    suite = ParallelSuite(tests, processes=args.jobs, maxfail=args.maxfail)
+    reports, streams = [], []
+    try:
+        if args.jsonl:
+            streams.append(open(args.jsonl, 'w'))
+            reports.append(JSONLReport(streams[-1]))
+        if args.junit_xml:
+            streams.append(open(args.junit_xml, 'w'))
+            reports.append(JUnitReport(streams[-1]))
+        if args.timings_out:
+            reports.append(TimingReport(args.timings_out))
+        runner = unittest.TextTestRunner(
+            verbosity=args.verbosity,
+            failfast=args.failfast,
+            resultclass=partial(ReportingTestResult, reports=reports),
+        )
+        result = runner.run(suite)
+    finally:
+        for report in reports:
+            report.close()
+        for stream in streams:
+            stream.close()
+    return 0 if result.wasSuccessful() else 1
+
+
+def write_timings(args):
+    timings = merge_timings(args.paths)
+    if args.output:
+        save_timings(args.output, timings)
+    else:
+        print(json.dumps(timings, indent=1, sort_keys=True))
+    return 0
+
+
+def update_index(args):
+    if args.output:
+        Index.load(args.output).update(args.paths).save(args.output)
+        return 0
+    for entry in Index().update(args.paths):
+        path = os.path.relpath(entry.path)
+        print('{} {}:{} {}'.format(entry.name, path, entry.lineno, entry.examples))
+    return 0
+
+
+def render_docs(args):
+    index = Index.load(args.index) if args.index else None
+    renderer = Renderer(args.sources or ['.'], index=index, cache_dir=args.cache_dir)
+    if args.index:
+        renderer.index.save(args.index)
+    kwargs = {'include_title': args.include_title}
+    if args.format == 'markdown':
+        kwargs['title_depth'] = args.title_depth
+    else:
+        kwargs['title_char'] = args.title_char
+    chunks = []
+    for location in args.locations:
+        try:
+            entries = renderer.find(location)
+        except ValueError as exc:
+            sys.stderr.write('{}\n'.format(exc))
+            return 1
+        for entry in entries:
+            text = renderer.render(entry.doc, args.format, **kwargs)
+            if args.output_dir:
+                ext = '.md' if args.format == 'markdown' else '.rst'
+                path = os.path.join(args.output_dir, entry.name + ext)
+                write_atomic(path, text)
+            elif text:
+                chunks.append(text)
+    sys.stdout.write('\n'.join(chunks))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,9 @@
+from argparse import Namespace
+from collections.abc import Sequence
+from typing import Optional
+
+def main(argv: Optional[Sequence[str]] = ...) -> int: ...
+def run_tests(args: Namespace) -> int: ...
+def write_timings(args: Namespace) -> int: ...
+def update_index(args: Namespace) -> int: ...
+def render_docs(args: Namespace) -> int: ...
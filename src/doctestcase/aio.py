@@ -0,0 +1,136 @@
+import ast
+from doctest import Example
+import sys
+from types import CodeType
+
+try:
+    import asyncio
+except ImportError:  # Python 2
+    asyncio = None
+
+# Python 3.8+
+TOP_LEVEL_AWAIT = getattr(ast, 'PyCF_ALLOW_TOP_LEVEL_AWAIT', 0)
+CO_COROUTINE = 0x80
+
+# name of `Awaiter` in doctest globals
+NAME = '__doctestcase_await__'
+
+# Code objects of rewritten examples, referenced by index from example source.
+# Like parsed examples, they are only created on first parse of docstring, and are
+# shared by all classes with the same docstring.
+CODES = []
+
+# code objects renamed after doctest example that runs them, by index and filename
+_renamed = {}
+
+
+class Awaiter(object):
+    """
+    Callable that runs precompiled coroutine code of doctest example in ``loop``.
+
+    Code is renamed after the example that calls the awaiter, so that tracebacks
+    show its source.
+    """
+
+    def __init__(self, loop, globs):
+        self.loop = loop
+        self.globs = globs
+
+    def __call__(self, index):
+        code = get_code(index, sys._getframe(1).f_code.co_filename)
+        self.loop.run_until_complete(eval(code, self.globs))  # noqa: S307
+
+
+_call_code = Awaiter.__call__.__code__
+
+
+def check_supported():
+    if not TOP_LEVEL_AWAIT:
+        raise ValueError('Top level await in doctests requires Python 3.8+')
+
+
+def rewrite(examples):
+    """
+    Return ``examples`` with top level ``await`` replaced by `Awaiter` calls.
+
+    Examples are compiled in ``'single'`` mode, like `doctest` does, so the value of
+    awaited expression is printed by the coroutine itself. Rewritten examples keep
+    the original example under ``original`` attribute.
+    """
+    ret = []
+    for example in examples:
+        try:
+            code = compile(example.source, '<doctest>', 'single', TOP_LEVEL_AWAIT, True)
+        except SyntaxError:
+            code = None  # reported by doctest on run
+        if code is None or not code.co_flags & CO_COROUTINE:
+            ret.append(example)
+            continue
+        CODES.append(code)
+        source = '{}({})\n'.format(NAME, len(CODES) - 1)
+        new = Example(
+            source,
+            example.want,
+            example.exc_msg,
+            example.lineno,
+            example.indent,
+            example.options,
+        )
+        new.original = example
+        ret.append(new)
+    return ret
+
+
+def get_code(index, filename):
+    key = (index, filename)
+    if key not in _renamed:
+        _renamed[key] = rename(CODES[index], filename)
+    return _renamed[key]
+
+
+def rename(code, filename):
+    consts = tuple(
+        rename(c, filename) if isinstance(c, CodeType) else c for c in code.co_consts
+    )
+    return code.replace(co_filename=filename, co_consts=consts)
+
+
+def strip_traceback(tb):
+    """
+    Remove frames of `Awaiter` call and event loop from traceback ``tb`` of
+    rewritten example, in place.
+    """
+    while tb is not None and tb.tb_next is not None:
+        caller, awaiter = tb.tb_next, tb.tb_next.tb_next
+        if awaiter is not None and awaiter.tb_frame.f_code is _call_code:
+            filename = caller.tb_frame.f_code.co_filename
+            example = awaiter.tb_next
+            while (
+                example is not None and example.tb_frame.f_code.co_filename != filename
+            ):
+                example = example.tb_next
+            if example is not None:  # otherwise raised by event loop itself
+                tb.tb_next = example
+            return
+        tb = caller
+
+
+def get_loop(case):
+    """
+    Return event loop of `unittest.IsolatedAsyncioTestCase` ``case``, shared with
+    ``asyncSetUp`` and ``asyncTearDown``, or ``None`` for other test cases.
+    """
+    runner = getattr(case, '_asyncioRunner', None)  # Python 3.11+
+    if runner is not None:
+        return runner.get_loop()
+    return getattr(case, '_asyncioTestLoop', None)  # Python 3.8-3.10
+
+
+def close_loop(loop):
+    tasks = asyncio.all_tasks(loop)
+    for task in tasks:
+        task.cancel()
+    if tasks:
+        loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+    loop.run_until_complete(loop.shutdown_asyncgens())
+    loop.close()
@@ -0,0 +1,28 @@
+from asyncio import AbstractEventLoop
+from doctest import Example
+from types import CodeType, ModuleType, TracebackType
+from typing import Any, Optional
+from unittest import TestCase
+
+asyncio: Optional[ModuleType]
+TOP_LEVEL_AWAIT: int
+CO_COROUTINE: int
+NAME: str
+CODES: list[CodeType]
+_renamed: dict[tuple[int, str], CodeType]
+
+class Awaiter:
+    loop: AbstractEventLoop
+    globs: dict[str, Any]
+    def __init__(self, loop: AbstractEventLoop, globs: dict[str, Any]) -> None: ...
+    def __call__(self, index: int) -> None: ...
+
+_call_code: CodeType
+
+def check_supported() -> None: ...
+def rewrite(examples: list[Example]) -> list[Example]: ...
+def get_code(index: int, filename: str) -> CodeType: ...
+def rename(code: CodeType, filename: str) -> CodeType: ...
+def strip_traceback(tb: Optional[TracebackType]) -> None: ...
+def get_loop(case: TestCase) -> Optional[AbstractEventLoop]: ...
+def close_loop(loop: AbstractEventLoop) -> None: ...
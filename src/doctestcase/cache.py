@@ -0,0 +1,247 @@
+from hashlib import sha256
+import inspect
+import json
+import os
+import sys
+import tempfile
+
+from .__version__ import __version__
+
+
+ENV_VAR = 'DOCTESTCASE_CACHE'
+
+
+class ResultCache(object):
+    """
+    On-disk record of ``test_docstring`` runs that passed, used to skip test cases
+    whose inputs did not change since then.
+
+    Every entry holds a fingerprint of the test case (docstring, `doctestcase`
+    parameters, Python and `doctestcase` versions) and hashes of source files of
+    all modules imported when the test case passed, except the standard library,
+    so changes of modules used indirectly, e.g. through dependencies of the test
+    case or other packages, are not missed. Modules imported by other test cases
+    in the same process are recorded too, which only makes the cache stricter.
+
+    The cache is turned on by setting environment variable ``DOCTESTCASE_CACHE``
+    to the cache directory, or by ``--cache-dir`` command line option.
+
+    Args:
+        path (``str``):
+            cache directory; created on first write.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.files = {}
+
+    def is_fresh(self, case):
+        """
+        Return ``True`` if ``case`` passed and none of its inputs changed since.
+        """
+        entry = self.read(case.id())
+        if entry is None or entry.get('fingerprint') != fingerprint(case):
+            return False
+        deps = entry.get('deps', {})
+        return all(self.hash_file(path) == digest for path, digest in deps.items())
+
+    def record(self, case, paths=()):
+        """
+        Record successful run of ``case`` that also depends on source files at
+        ``paths``, e.g. of modules imported by forked child processes, see
+        `get_loaded_paths`.
+        """
+        paths = get_dependencies(case, paths)
+        entry = {
+            'fingerprint': fingerprint(case),
+            'deps': dict((p, self.hash_file(p)) for p in paths),
+        }
+        self.write(case.id(), entry)
+
+    def discard(self, case):
+        """
+        Remove record of ``case``, if any.
+        """
+        try:
+            os.remove(self.entry_path(case.id()))
+        except OSError:
+            pass
+
+    def clear(self):
+        """
+        Remove all records.
+        """
+        if not os.path.isdir(self.path):
+            return
+        for name in os.listdir(self.path):
+            if name.endswith('.json'):
+                os.remove(os.path.join(self.path, name))
+
+    def entry_path(self, key):
+        name = sha256(key.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, name + '.json')
+
+    def read(self, key):
+        try:
+            with open(self.entry_path(key)) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def write(self, key, entry):
+        write_atomic(self.entry_path(key), json.dumps(entry, sort_keys=True))
+
+    def hash_file(self, path):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        state = (stat.st_mtime, stat.st_size)
+        if path not in self.files or self.files[path][0] != state:
+            with open(path, 'rb') as f:
+                self.files[path] = (state, sha256(f.read()).hexdigest())
+        return self.files[path][1]
+
+
+class RenderCache(object):
+    """
+    On-disk cache of docstrings rendered by `~doctestcase.format` functions, keyed
+    by docstring, formatter name and its arguments.
+
+    Args:
+        path (``str``):
+            cache directory; created on first write.
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    def get(self, doc, formatter, kwargs):
+        """
+        Return cached text, or ``None``.
+        """
+        try:
+            with open(self.entry_path(doc, formatter, kwargs)) as f:
+                return f.read()
+        except (IOError, OSError):
+            return None
+
+    def set(self, doc, formatter, kwargs, text):
+        """
+        Store rendered ``text``.
+        """
+        write_atomic(self.entry_path(doc, formatter, kwargs), text)
+
+    def entry_path(self, doc, formatter, kwargs):
+        data = json.dumps([__version__, doc, formatter, sorted(kwargs.items())])
+        name = sha256(data.encode('utf-8')).hexdigest()
+        return os.path.join(self.path, name + '.txt')
+
+
+_caches = {}
+
+
+def get_cache():
+    """
+    Return `ResultCache` for directory from environment variable, or ``None``.
+    """
+    path = os.environ.get(ENV_VAR)
+    if not path:
+        return None
+    if path not in _caches:
+        _caches[path] = ResultCache(path)
+    return _caches[path]
+
+
+def fingerprint(case):
+    props = case.__doctestcase__
+    data = [
+        sys.version,
+        __version__,
+        case.__class__.__doc__,
+        sorted(props.globals),
+        props.options,
+        props.layered,
+        props.asyncio,
+        props.sections,
+        stable_repr(props.checker),
+        props.max_output,
+        props.timeout,
+        props.isolate,
+        sorted((k, stable_json(v)) for k, v in props.kwargs.items()),
+    ]
+    return sha256(json.dumps(data).encode('utf-8')).hexdigest()
+
+
+def write_atomic(path, text):
+    dirname = os.path.dirname(path)
+    if not os.path.isdir(dirname):
+        try:
+            os.makedirs(dirname)
+        except OSError:  # created concurrently
+            pass
+    fd, tmp = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        f.write(text)
+    # atomic on POSIX, so concurrent processes never see partial entries
+    getattr(os, 'replace', os.rename)(tmp, path)
+
+
+def stable_repr(value):
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    if inspect.isclass(value):
+        return '{}.{}'.format(value.__module__, value.__name__)
+    return type(value).__name__
+
+
+def stable_json(value):
+    # by content; only values that can't be serialized are reduced to type names
+    try:
+        return json.dumps(value, sort_keys=True, default=stable_repr)
+    except (TypeError, ValueError):  # keys of mixed types, circular references
+        return stable_repr(value)
+
+
+def get_dependencies(case, paths=()):
+    # the test case module and modules of globals are imported too
+    return sorted(set(paths) | set(get_loaded_paths()))
+
+
+def get_loaded_paths():
+    """
+    Return source files of all imported modules, except standard library.
+    """
+    return [p for p in get_module_paths(list(sys.modules)) if not is_stdlib(p)]
+
+
+def get_module_paths(names):
+    """
+    Return source files of modules ``names`` that are imported.
+    """
+    paths = set()
+    for name in names:
+        path = getattr(sys.modules.get(name), '__file__', None)
+        if path:
+            if path.endswith(('.pyc', '.pyo')):
+                path = path[:-1]
+            paths.add(os.path.abspath(path))
+    return sorted(paths)
+
+
+_stdlib_dirs = None
+
+
+def is_stdlib(path):
+    global _stdlib_dirs
+    if _stdlib_dirs is None:
+        import sysconfig  # only needed when the cache is on
+
+        dirs = sysconfig.get_paths()
+        _stdlib_dirs = (
+            [os.path.join(dirs[k], '') for k in ('stdlib', 'platstdlib')],
+            [os.path.join(dirs[k], '') for k in ('purelib', 'platlib')],
+        )
+    stdlib, site = _stdlib_dirs
+    # site-packages may be inside of stdlib directory
+    return path.startswith(tuple(stdlib)) and not path.startswith(tuple(site))
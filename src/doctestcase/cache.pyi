@@ -0,0 +1,44 @@
+from collections.abc import Iterable
+from typing import Any, Optional
+from unittest import TestCase
+
+ENV_VAR: str
+
+class ResultCache:
+    path: str
+    files: dict[str, tuple[tuple[float, int], str]]
+    def __init__(self, path: str) -> None: ...
+    def is_fresh(self, case: TestCase) -> bool: ...
+    def record(self, case: TestCase, paths: Iterable[str] = ...) -> None: ...
+    def discard(self, case: TestCase) -> None: ...
+    def clear(self) -> None: ...
+    def entry_path(self, key: str) -> str: ...
+    def read(self, key: str) -> Optional[dict[str, Any]]: ...
+    def write(self, key: str, entry: dict[str, Any]) -> None: ...
+    def hash_file(self, path: str) -> Optional[str]: ...
+
+class RenderCache:
+    path: str
+    def __init__(self, path: str) -> None: ...
+    def get(
+        self, doc: str, formatter: str, kwargs: dict[str, Any]
+    ) -> Optional[str]: ...
+    def set(
+        self, doc: str, formatter: str, kwargs: dict[str, Any], text: str
+    ) -> None: ...
+    def entry_path(self, doc: str, formatter: str, kwargs: dict[str, Any]) -> str: ...
+
+_caches: dict[str, ResultCache]
+
+def get_cache() -> Optional[ResultCache]: ...
+def fingerprint(case: TestCase) -> str: ...
+def write_atomic(path: str, text: str) -> None: ...
+def stable_repr(value: Any) -> str: ...
+def stable_json(value: Any) -> str: ...
+def get_dependencies(case: TestCase, paths: Iterable[str] = ...) -> list[str]: ...
+def get_loaded_paths() -> list[str]: ...
+def get_module_paths(names: Iterable[str]) -> list[str]: ...
+
+_stdlib_dirs: Optional[tuple[list[str], list[str]]]
+
+def is_stdlib(path: str) -> bool: ...
@@ -1,6 +1,3 @@
-from doctest import DocTestFinder, DocTestRunner
-
-
 class doctestcase:
     """
     Class decorator that turns on evaluation of docstring doctests in subclasses of
@@ -10,17 +7,78 @@ class doctestcase:
 
         globals (``dict`` | ``None``, optional):
             dictionary of globals passed to the doctest; defaults to ``None``
-            (no additional globals).
+            (no additional globals). Values wrapped with `~doctestcase.globs.lazy`
+            are created on first use.
 
         options (``int``, optional):
             `doctest` options, passed to `doctest.DocTestRunner`; defaults to
-            ``0`` (no options).
+            ``0`` (no options). Use `doctest.FAIL_FAST` (Python 3.4+) to skip
+            the rest of the docstring after the first failed example.
+
+        layered (``bool`` | ``None``, optional):
+            if ``True``, every run of the doctest gets thin
+            `~doctestcase.globs.LayeredGlobals` on top of `globals` instead of
+            their full copy; defaults to ``None`` (same as ``False``). Requires
+            Python 3, ignored on Python 2.
+
+        asyncio (``bool`` | ``None``, optional):
+            if ``True``, doctest examples can use top level ``await``, and all
+            awaited examples of one ``test_docstring`` run share one event loop;
+            defaults to ``None`` (same as ``False``). If decorated class is
+            `unittest.IsolatedAsyncioTestCase`, its event loop is used, shared
+            with ``asyncSetUp`` and ``asyncTearDown``. Requires Python 3.8+.
+
+        listeners (``list`` of `~doctestcase.listener.Listener` | ``None``, optional):
+            objects notified before and after every doctest example is executed,
+            e.g. `~doctestcase.timing.Timer`; defaults to ``None`` (no listeners).
+
+        sections (``bool`` | ``int`` | ``None``, optional):
+            if set, every block of examples separated by text is run as an
+            independent section, with its own fresh copy of `globals`, in a forked
+            process; defaults to ``None`` (all examples of the docstring share
+            globals). If ``True``, up to number of CPUs sections run at once;
+            integer sets the number of processes, ``1`` runs sections one by one
+            in the test process. Listeners and `~doctestcase.globs.lazy` values
+            are used in child processes, so their state is not returned to the
+            test process. Without `os.fork`, sections run in the test process.
+
+        checker (``type`` | ``None``, optional):
+            `doctest.OutputChecker` subclass used to compare expected and actual
+            output, e.g. `~doctestcase.checker.FastOutputChecker`; defaults to
+            ``None`` (`doctest.OutputChecker`).
+
+        max_output (``int`` | ``None``, optional):
+            maximum number of characters printed by one example; defaults to
+            ``None`` (not limited). The example fails with truncated output as soon
+            as the limit is exceeded, or, if expected output can only match
+            exactly, as soon as a printed line differs from expected.
+
+        timeout (``float`` | ``None``, optional):
+            time limit for all examples of one ``test_docstring`` run, in seconds;
+            defaults to ``None`` (not limited). Single example can be limited with
+            ``# doctestcase: timeout=SECONDS`` comment in its source. Example that
+            runs out of time fails with stack traces of all threads, see
+            `~doctestcase.timeout.Timeout`.
+
+        isolate (``bool`` | ``None``, optional):
+            if ``True``, every run of ``test_docstring`` executes examples in a
+            process forked from the test process, so that changes of module state,
+            environment or working directory made by examples don't affect other
+            tests; defaults to ``None`` (same as ``False``). Modules, `globals` and
+            fixtures of :py:meth:`~unittest.TestCase.setUp` are already in place in
+            the test process, and are shared with the child copy-on-write. As with
+            `sections`, state of listeners and `~doctestcase.globs.lazy` values is
+            not returned to the test process. Without `os.fork`, examples run in
+            the test process.
 
         kwargs (``dict``, optional):
             additional keyword arguments that will be stored under
             ``__doctestcase__.kwargs`` and can be used in
             :py:meth:`~unittest.TestCase.setUp`, :py:meth:`~unittest.TestCase.tearDown`,
-            and custom test methods of `~unittest.TestCase`.
+            and custom test methods of `~unittest.TestCase`. Names of other parameters
+            can't be used; ``layered``, ``asyncio``, ``listeners``, ``sections``,
+            ``checker``, ``max_output``, ``timeout`` and ``isolate`` were stored
+            in ``kwargs`` by versions before they were added.
 
     Attributes:
 
@@ -30,18 +88,62 @@ class doctestcase:
         options (``int``):
             ``options`` passed to decorator.
 
+        layered (``bool`` | ``None``):
+            ``layered`` passed to decorator.
+
+        asyncio (``bool`` | ``None``):
+            ``asyncio`` passed to decorator.
+
+        listeners (``list`` of `~doctestcase.listener.Listener`):
+            ``listeners`` passed to decorator.
+
+        sections (``bool`` | ``int`` | ``None``):
+            ``sections`` passed to decorator.
+
+        checker (``type`` | ``None``):
+            ``checker`` passed to decorator.
+
+        max_output (``int`` | ``None``):
+            ``max_output`` passed to decorator.
+
+        timeout (``float`` | ``None``):
+            ``timeout`` passed to decorator.
+
+        isolate (``bool`` | ``None``):
+            ``isolate`` passed to decorator.
+
         kwargs (``dict``):
             ``**kwargs`` passed to decorator.
 
+        doctests (``list`` of `doctest.DocTest`):
+            doctests parsed from the decorated class docstring; empty for the
+            decorator object itself.
+
     The decorator object, after being applied to the decorated class, stores its copy
     under attribute ``__doctestcase__``, including `options` and shallow copies of
-    original `globals` and `kwargs`.
+    original `globals`, `listeners` and `kwargs`.
 
     New test method ``test_docstring``, implementing
     docstring evaluation, is added to the decorated class.
+    The docstring is parsed once, on the first run of ``test_docstring`` or
+    access to `doctests`; every run of ``test_docstring`` only executes parsed
+    examples against a fresh copy of `globals`. Classes with identical docstrings
+    share parsed examples. `doctest` and the rest of execution machinery are not
+    imported until then, so that importing decorated test cases, e.g. to render
+    their docstrings, stays fast.
     If the decorated class has no docstring or the docstring is blank,
     ``test_docstring`` does nothing.
 
+    If `~doctestcase.cache.ResultCache` is turned on, ``test_docstring`` is
+    skipped when the docstring, decorator parameters and source files of
+    dependencies did not change since the last successful run.
+
+    Every run of ``test_docstring`` stores results of executed examples, as a
+    list of `~doctestcase.report.ExampleResult`, under ``doctest_results``
+    attribute of the test case instance. When examples fail, the `doctest`
+    report is used as the test failure message; with `sections`, reports of all
+    failed sections are joined.
+
     The decorated class, as a subclass of `unittest.TestCase`, can define
     :py:meth:`~unittest.TestCase.setUp`, `~unittest.TestCase.tearDown`,
     and its own test methods (exept ``test_docstring``) that are executed
@@ -50,7 +152,10 @@ class doctestcase:
     If decorated class already has ``__doctestcase__`` attribute (obtained from
     decoration or inherited from parent classes), it is replaced with a copy;
     `globals` and `kwargs` are updated with values from the decorator,
-    and `options` is OR'ed with decorator's `options`.
+    `options` is OR'ed with decorator's `options`, `layered`, `asyncio`,
+    `sections`, `checker`, `max_output`, `timeout` and `isolate` are replaced
+    unless decorator's value is ``None``, and decorator's `listeners` are appended
+    unless already present.
     This allows to extend test cases with multiple decoration and inheritance.
     This also ensures that ``__doctestcase__`` attributes of subsequent classes are
     independent, but *values* of `globals` and `kwargs` dictionaries reference the
@@ -94,11 +199,45 @@ class doctestcase:
          :ref:`usage` documentation section  contains more examples and use cases.
     """
 
-    def __init__(self, globals=None, options=0, **kwargs):
+    # fmt: off
+    def __init__(
+        self,
+        globals=None,
+        options=0,
+        layered=None,
+        asyncio=None,
+        listeners=None,
+        sections=None,
+        checker=None,
+        max_output=None,
+        timeout=None,
+        isolate=None,
+        **kwargs  # Python 2 and 3.5 don't allow trailing comma
+    ):
+        # fmt: on
         self.globals = globals or {}
         self.options = options
+        self.layered = layered
+        self.asyncio = asyncio
+        self.listeners = list(listeners or ())
+        self.sections = sections
+        self.checker = checker
+        self.max_output = max_output
+        self.timeout = timeout
+        self.isolate = isolate
         self.kwargs = kwargs
         self.bind = None
+        self._doctests = None
+
+    @property
+    def doctests(self):
+        if self._doctests is None:
+            if self.bind is None:
+                return []
+            from .execute import get_doctests
+
+            self._doctests = get_doctests(self.bind, self.asyncio)
+        return self._doctests
 
     def __call__(self, cls):
         if not hasattr(cls, '__doctestcase__'):
@@ -114,32 +253,53 @@ class doctestcase:
     def _assign(self, cls):
         cls.__doctestcase__ = self._copy()
         cls.__doctestcase__.bind = cls
+        if self.asyncio:
+            from .aio import check_supported
+
+            check_supported()  # fail when decorated rather than when run
         cls.test_docstring = test_docstring
 
     def _copy(self):
-        return doctestcase(
-            globals=self.globals.copy(), options=self.options, **self.kwargs
+        params = dict(
+            self.kwargs,
+            options=self.options,
+            layered=self.layered,
+            asyncio=self.asyncio,
+            listeners=self.listeners,
+            sections=self.sections,
+            checker=self.checker,
+            max_output=self.max_output,
+            timeout=self.timeout,
+            isolate=self.isolate,
         )
+        return doctestcase(globals=self.globals.copy(), **params)
 
     def _update(self, other):
         self.globals.update(other.globals)
         self.options |= other.options
+        if other.layered is not None:
+            self.layered = other.layered
+        if other.asyncio is not None:
+            self.asyncio = other.asyncio
+        if other.sections is not None:
+            self.sections = other.sections
+        if other.checker is not None:
+            self.checker = other.checker
+        if other.max_output is not None:
+            self.max_output = other.max_output
+        if other.timeout is not None:
+            self.timeout = other.timeout
+        if other.isolate is not None:
+            self.isolate = other.isolate
+        for listener in other.listeners:
+            if listener not in self.listeners:
+                self.listeners.append(listener)
         self.kwargs.update(other.kwargs)
+        self._doctests = None  # parsed again, `asyncio` may have changed
 
 
 def test_docstring(self):
-    if self.__doctestcase__.bind is not self.__class__:
-        errmsg = 'Class {}, inherited from {}, must be decorated'.format(
-            self.__class__.__name__,
-            self.__doctestcase__.bind.__name__,
-        )
-        raise ValueError(errmsg)
-
-    props = self.__doctestcase__
-    finder = DocTestFinder(recurse=False)
-    runner = DocTestRunner(optionflags=props.options)
-    if getattr(self, '__doc__', ''):
-        name = self.__class__.__name__
-        for test in finder.find(self.__doc__, name, globs=props.globals):
-            ret = runner.run(test)
-            self.assertFalse(ret.failed)
+    # doctest and execution machinery are imported on first run
+    from .execute import test_docstring
+
+    test_docstring(self)
@@ -1,6 +1,10 @@
+from collections.abc import Iterable
+from doctest import DocTest, OutputChecker
 from typing import Any, ClassVar, Optional, Type, TypeVar, Union
 from unittest import TestCase
 
+from .listener import Listener
+
 T = TypeVar('T', bound=Type[TestCase])
 
 class DocTestCase(TestCase):
@@ -11,11 +15,30 @@ class doctestcase:
     bind: Optional[TestCase]
     globals: dict[str, Any]
     options: int
+    layered: Optional[bool]
+    asyncio: Optional[bool]
+    listeners: list[Listener]
+    sections: Union[bool, int, None]
+    checker: Optional[type[OutputChecker]]
+    max_output: Optional[int]
+    timeout: Optional[float]
+    isolate: Optional[bool]
     kwargs: dict[str, Any]
+    _doctests: Optional[list[DocTest]]
+    @property
+    def doctests(self) -> list[DocTest]: ...
     def __init__(
         self,
         globals: dict[str, Any] = ...,
         options: int = ...,
+        layered: Optional[bool] = ...,
+        asyncio: Optional[bool] = ...,
+        listeners: Optional[Iterable[Listener]] = ...,
+        sections: Union[bool, int, None] = ...,
+        checker: Optional[type[OutputChecker]] = ...,
+        max_output: Optional[int] = ...,
+        timeout: Optional[float] = ...,
+        isolate: Optional[bool] = ...,
         **kwargs: Any,
     ) -> None: ...
     def __call__(self: Union[T, type[T]], cls: T) -> Union[T, DocTestCase]: ...
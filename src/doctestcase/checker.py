@@ -0,0 +1,127 @@
+from doctest import (
+    BLANKLINE_MARKER,
+    DONT_ACCEPT_BLANKLINE,
+    DONT_ACCEPT_TRUE_FOR_1,
+    ELLIPSIS,
+    ELLIPSIS_MARKER,
+    NORMALIZE_WHITESPACE,
+    OutputChecker,
+)
+import re
+
+from .format import LRUCache
+
+
+class FastOutputChecker(OutputChecker):
+    """
+    `doctest.OutputChecker` that prepares expected output of every example once,
+    instead of on every comparison, with the same results as the standard checker.
+
+    ``<BLANKLINE>`` marker substitution, `doctest.NORMALIZE_WHITESPACE`
+    normalization and splitting on `doctest.ELLIPSIS` marker are applied to
+    expected output when it is compared for the first time, and the result is kept
+    in bounded cache shared by all checkers. Whitespace-only lines of actual output
+    are found by faster regular expression, and are not removed when output is
+    normalized anyway.
+
+    Example:
+
+        .. code:: python
+
+            @doctestcase(options=ELLIPSIS, checker=FastOutputChecker)
+            class LargeTable(TestCase):
+                ...
+    """
+
+    def check_output(self, want, got, optionflags):
+        if got == want:
+            return True
+        if not optionflags & DONT_ACCEPT_TRUE_FOR_1:
+            if (got, want) in (('True\n', '1\n'), ('False\n', '0\n')):
+                return True
+        return get_matcher(want, optionflags).match(got, optionflags)
+
+
+class Matcher(object):
+    """Internal expected output of example, prepared for given option flags"""
+
+    __slots__ = ('blank', 'normalized', 'pieces')
+
+    def __init__(self, want, optionflags):
+        self.blank = None
+        self.normalized = None
+        if not optionflags & DONT_ACCEPT_BLANKLINE:
+            want = self.blank = RX_BLANKLINE_WANT.sub('', want)
+        if optionflags & NORMALIZE_WHITESPACE:
+            want = self.normalized = ' '.join(want.split())
+        self.pieces = want.split(ELLIPSIS_MARKER)
+
+    def match(self, got, optionflags):
+        # whitespace-only lines don't change normalized output, and if output
+        # matches without them, it matches when normalized
+        if self.blank is not None and self.normalized is None:
+            got = strip_blank_lines(got)
+            if got == self.blank:
+                return True
+        if self.normalized is not None:
+            got = ' '.join(got.split())
+            if got == self.normalized:
+                return True
+        if optionflags & ELLIPSIS:
+            return ellipsis_match(self.pieces, got)
+        return False
+
+
+# helpers
+
+
+RX_BLANKLINE_WANT = re.compile(r'(?m)^{}\s*?$'.format(re.escape(BLANKLINE_MARKER)))
+# same as r'(?m)^[^\S\n]+$' used by doctest, but starts with literal newline,
+# which is searched for much faster than line start
+RX_BLANK_LINE = re.compile(r'\n[^\S\n]+(?=\n|\Z)')
+RX_BLANK_FIRST_LINE = re.compile(r'[^\S\n]+(?=\n|\Z)')
+
+# flags that change the prepared expected output
+PREPARE_FLAGS = DONT_ACCEPT_BLANKLINE | NORMALIZE_WHITESPACE
+
+MATCHERS = LRUCache(maxsize=4096)
+
+
+def get_matcher(want, optionflags):
+    key = (want, optionflags & PREPARE_FLAGS)
+    matcher = MATCHERS.get(key)
+    if matcher is None:
+        matcher = Matcher(want, key[1])
+        MATCHERS.set(key, matcher)
+    return matcher
+
+
+def strip_blank_lines(got):
+    got = RX_BLANK_LINE.sub('\n', got)
+    match = RX_BLANK_FIRST_LINE.match(got)
+    return got if match is None else got[match.end() :]
+
+
+def ellipsis_match(pieces, got):
+    # same as doctest._ellipsis_match, with expected output split in advance
+    if len(pieces) == 1:
+        return pieces[0] == got
+    startpos, endpos = 0, len(got)
+    first, last = pieces[0], pieces[-1]
+    if first:
+        if not got.startswith(first):
+            return False
+        startpos = len(first)
+    if last:
+        if not got.endswith(last):
+            return False
+        endpos -= len(last)
+    if startpos > endpos:
+        # exact end matches required more characters than we have
+        return False
+    for piece in pieces[1:-1]:
+        startpos = got.find(piece, startpos, endpos)
+        if startpos < 0:
+            return False
+        startpos += len(piece)
+    return True
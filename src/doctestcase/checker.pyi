@@ -0,0 +1,25 @@
+from doctest import OutputChecker
+import re
+from typing import Optional
+
+from .format import LRUCache
+
+class FastOutputChecker(OutputChecker):
+    def check_output(self, want: str, got: str, optionflags: int) -> bool: ...
+
+class Matcher:
+    blank: Optional[str]
+    normalized: Optional[str]
+    pieces: list[str]
+    def __init__(self, want: str, optionflags: int) -> None: ...
+    def match(self, got: str, optionflags: int) -> bool: ...
+
+RX_BLANKLINE_WANT: re.Pattern[str]
+RX_BLANK_LINE: re.Pattern[str]
+RX_BLANK_FIRST_LINE: re.Pattern[str]
+PREPARE_FLAGS: int
+MATCHERS: LRUCache[Matcher]
+
+def get_matcher(want: str, optionflags: int) -> Matcher: ...
+def strip_blank_lines(got: str) -> str: ...
+def ellipsis_match(pieces: list[str], got: str) -> bool: ...
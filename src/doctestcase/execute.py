@@ -0,0 +1,155 @@
+from doctest import DocTest, DocTestParser, OutputChecker
+from functools import partial
+
+from . import aio
+from .cache import get_cache, get_loaded_paths
+from .fork import fork_call, fork_map
+from .globs import Fixtures, make_globals
+from .report import Collector
+from .runner import RUNNERS
+from .timeout import Timeout, has_timeouts
+
+
+# Parsed examples are shared between all classes with identical docstrings, e.g.
+# parametrized classes generated from one template. The cache only holds what is
+# already referenced by decorated classes, so it is not bounded.
+_examples = {}
+
+
+def get_doctests(cls, asyncio=False):
+    doc = getattr(cls, '__doc__', None)
+    if not doc:
+        return []
+    if asyncio:
+        aio.check_supported()
+    key = (doc, bool(asyncio))
+    examples = _examples.get(key)
+    if examples is None:
+        examples = DocTestParser().get_examples(doc, cls.__name__)
+        if asyncio:
+            examples = aio.rewrite(examples)
+        _examples[key] = examples
+    if not examples:
+        return []
+    return [DocTest(examples, {}, cls.__name__, None, None, doc)]
+
+
+def test_docstring(self):
+    if self.__doctestcase__.bind is not self.__class__:
+        errmsg = 'Class {}, inherited from {}, must be decorated'.format(
+            self.__class__.__name__,
+            self.__doctestcase__.bind.__name__,
+        )
+        raise ValueError(errmsg)
+
+    props = self.__doctestcase__
+    cache = get_cache()
+    if cache is not None:
+        if cache.is_fresh(self):
+            self.skipTest('unchanged since last successful run')
+        cache.discard(self)
+
+    self.doctest_results = []
+    paths = set()  # of modules imported by forked children
+    if props.sections:
+        sections = [[s] for t in props.doctests for s in split_sections(t)]
+        processes = None if props.sections is True else props.sections
+        outcomes = fork_map(partial(run_section, self), sections, processes)
+        self.doctest_results = [r for results, _, _ in outcomes for r in results]
+        failures = [f for _, f, _ in outcomes if f is not None]
+        paths.update(p for _, _, found in outcomes for p in found)
+    elif props.isolate:
+        outcome = fork_call(partial(run_section, self), props.doctests)
+        self.doctest_results, failure, found = outcome
+        failures = [] if failure is None else [failure]
+        paths.update(found)
+    else:
+        _, failure = run_doctests(self, props.doctests, self.doctest_results)
+        failures = [] if failure is None else [failure]
+    if failures:
+        self.fail(''.join(failures))
+    if cache is not None:
+        cache.record(self, paths)
+
+
+def run_doctests(case, doctests, results=None):
+    """
+    Run ``doctests`` of ``case`` against fresh globals, stopping at the first
+    failed doctest; return example results and failure report, or ``None``.
+    """
+    props = case.__doctestcase__
+    fixtures = Fixtures()
+    collector = Collector()
+    if results is not None:
+        collector.results = results
+    listeners = [fixtures, collector] + props.listeners
+    timeout = None
+    if props.timeout is not None or any(has_timeouts(t) for t in doctests):
+        timeout = Timeout(props.timeout)
+        listeners.append(timeout)  # armed last, right before the example runs
+    checker = props.checker or OutputChecker
+    runner = RUNNERS.acquire(
+        listeners,
+        optionflags=props.options,
+        checker=checker,
+        max_output=props.max_output,
+    )
+    loop = owned_loop = None
+    if props.asyncio:
+        # forked children have event loops of their own
+        forked = props.sections or props.isolate
+        loop = None if forked else aio.get_loop(case)
+        if loop is None:
+            loop = owned_loop = aio.asyncio.new_event_loop()
+    try:
+        for parsed in doctests:
+            test = DocTest(
+                parsed.examples,
+                {},
+                parsed.name,
+                parsed.filename,
+                parsed.lineno,
+                parsed.docstring,
+            )
+            # DocTest copies globs
+            test.globs = make_globals(props.globals, props.layered, fixtures)
+            if loop is not None:
+                test.globs[aio.NAME] = aio.Awaiter(loop, test.globs)
+            out = []
+            ret = runner.run(test, out=out.append)
+            if ret.failed:
+                return collector.results, ''.join(out)
+        return collector.results, None
+    finally:
+        if timeout is not None:
+            timeout.close()
+        fixtures.close()
+        RUNNERS.release(runner)
+        if owned_loop is not None:
+            aio.close_loop(owned_loop)
+
+
+def run_section(case, doctests):
+    # modules may be imported in forked child only, so they are looked up here
+    results, failure = run_doctests(case, doctests)
+    return results, failure, get_loaded_paths()
+
+
+def split_sections(test):
+    """
+    Split ``test`` into doctests of example blocks separated by text.
+    """
+    lines = (test.docstring or '').split('\n')
+    sections, end = [], None
+    for example in test.examples:
+        original = getattr(example, 'original', example)
+        between = lines[end : original.lineno] if end is not None else ['text']
+        if any(line.strip() for line in between):
+            sections.append([])
+        sections[-1].append(example)
+        end = original.lineno + original.source.count('\n')
+        end += original.want.count('\n')
+    return [
+        DocTest(examples, {}, test.name, test.filename, test.lineno, test.docstring)
+        for examples in sections
+    ]
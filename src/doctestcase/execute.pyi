@@ -0,0 +1,22 @@
+from collections.abc import Iterable
+from doctest import DocTest, Example
+from typing import Optional, Tuple, Type
+from unittest import TestCase
+
+from .report import ExampleResult
+
+_examples: dict[tuple[str, bool], list[Example]]
+
+def get_doctests(
+    cls: Type[TestCase], asyncio: Optional[bool] = ...
+) -> list[DocTest]: ...
+def test_docstring(self: TestCase) -> None: ...
+def run_doctests(
+    case: TestCase,
+    doctests: Iterable[DocTest],
+    results: Optional[list[ExampleResult]] = ...,
+) -> Tuple[list[ExampleResult], Optional[str]]: ...
+def run_section(
+    case: TestCase, doctests: Iterable[DocTest]
+) -> Tuple[list[ExampleResult], Optional[str], list[str]]: ...
+def split_sections(test: DocTest) -> list[DocTest]: ...
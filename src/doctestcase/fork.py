@@ -0,0 +1,111 @@
+import os
+import pickle
+import sys
+import traceback
+
+
+CAN_FORK = hasattr(os, 'fork')
+
+
+class ChildError(Exception):
+    """Error raised in forked child process; the message holds original traceback."""
+
+
+def fork_map(func, items, processes=None):
+    """
+    Call ``func`` for every item in forked child processes, and return results in
+    order of items.
+
+    Every child gets copy-on-write memory of the parent, so changes made by
+    ``func`` are not visible to the parent and to other items. Results are
+    returned over pipes and must be picklable. If ``func`` raises, `ChildError`
+    with formatted traceback is raised in the parent after all children exit.
+
+    Args:
+        func (callable):
+            function of one argument.
+        items (iterable):
+            arguments of ``func``.
+        processes (``int`` | ``None``, optional):
+            maximum number of children running at once; defaults to ``None``
+            (number of CPUs). If ``1``, or if `os.fork` is not available, items
+            are processed one by one in the calling process.
+    """
+    items = list(items)
+    processes = processes or cpu_count()
+    if processes == 1 or not CAN_FORK:
+        return [func(item) for item in items]
+
+    results, running = [], []
+    for item in items:
+        if len(running) >= processes:
+            results.append(wait_child(*running.pop(0)))
+        running.append(start_child(func, item))
+    while running:
+        results.append(wait_child(*running.pop(0)))
+    for ok, value in results:
+        if not ok:
+            raise ChildError(value)
+    return [value for _, value in results]
+
+
+def fork_call(func, item):
+    """
+    Call ``func`` for one item in forked child process, and return the result;
+    see `fork_map`. If `os.fork` is not available, ``func`` is called in the
+    calling process.
+    """
+    if not CAN_FORK:
+        return func(item)
+    ok, value = wait_child(*start_child(func, item))
+    if not ok:
+        raise ChildError(value)
+    return value
+
+
+def cpu_count():
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not on Linux or Python 2
+        import multiprocessing
+
+        return multiprocessing.cpu_count()
+
+
+# helpers
+
+
+def start_child(func, item):
+    sys.stdout.flush()
+    sys.stderr.flush()
+    rfd, wfd = os.pipe()
+    pid = os.fork()
+    if pid != 0:
+        os.close(wfd)
+        return pid, rfd
+
+    # child
+    os.close(rfd)
+    status = 1
+    try:
+        try:
+            data = pickle.dumps((True, func(item)), pickle.HIGHEST_PROTOCOL)
+        except BaseException:
+            data = pickle.dumps((False, traceback.format_exc()))
+        with os.fdopen(wfd, 'wb') as f:
+            f.write(data)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        status = 0
+    finally:
+        os._exit(status)
+
+
+def wait_child(pid, rfd):
+    # read the pipe before waiting, so that large results don't block the child
+    with os.fdopen(rfd, 'rb') as f:
+        data = f.read()
+    _, status = os.waitpid(pid, 0)
+    if not data:
+        return False, 'Child process {} exited with status {}'.format(pid, status)
+    return pickle.loads(data)  # noqa: S301  # written by our own child process
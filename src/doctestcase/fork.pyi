@@ -0,0 +1,17 @@
+from collections.abc import Callable, Iterable
+from typing import Any, Optional, Tuple, TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+CAN_FORK: bool
+
+class ChildError(Exception): ...
+
+def fork_map(
+    func: Callable[[T], R], items: Iterable[T], processes: Optional[int] = ...
+) -> list[R]: ...
+def fork_call(func: Callable[[T], R], item: T) -> R: ...
+def cpu_count() -> int: ...
+def start_child(func: Callable[[T], Any], item: T) -> Tuple[int, int]: ...
+def wait_child(pid: int, rfd: int) -> Tuple[bool, Any]: ...
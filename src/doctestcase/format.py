@@ -1,28 +1,9 @@
-import re
+from array import array
+from collections import OrderedDict
+import importlib
+import sys
 import textwrap
-
-
-RX_DOCSTRING = re.compile(
-    r"""\A
-    (?P<title> (?!\s*>>> ) .+?)           # not PS1 line
-    ( (?:\n[ \t]*$)+ \n (?P<body>.*?) )?
-    \Z""",
-    flags=re.DOTALL | re.MULTILINE | re.VERBOSE,
-)
-RX_EXAMPLE_BLOCK = re.compile(
-    r"""
-    # Example block consists of a PS1 line followed by non-blank line
-    #   or a series of blank lines followed by PS1 line.
-    ^(?= [ ]* >>> )  # starts with PS1 line
-    (?:
-       [ ]* >>> .*                       $  # PS1 line
-      |\n (?![ ]*$) .+                   $  # non-blank line
-      |(?: \n [ ]* $)+ (?= \n [ ]* >>> ) $  # blank lines followed by PS1 line
-    )*
-    \n
-    """,
-    flags=re.MULTILINE | re.VERBOSE,
-)
+from types import ModuleType
 
 
 def get_title(item):
@@ -41,8 +22,7 @@ def get_title(item):
     Returns:
         ``str``: may be empty string.
     """
-    title, _ = parse_title_body(get_doc(item, dedent=True), parse_title=True)
-    return title or ''
+    return parse_doc(item, dedent=True, parse_title=True).title
 
 
 def get_body(item, remove_title=True, dedent=True):
@@ -65,8 +45,7 @@ def get_body(item, remove_title=True, dedent=True):
     Returns:
         `str`: may be empty string.
     """
-    _, body = parse_title_body(get_doc(item, dedent=dedent), parse_title=remove_title)
-    return body or ''
+    return parse_doc(item, dedent=dedent, parse_title=remove_title).body
 
 
 def to_markdown(item, title_depth=2, dedent=True, include_title=True):
@@ -123,25 +102,7 @@ def to_markdown(item, title_depth=2, dedent=True, include_title=True):
             True
             ```
     """
-    doc = get_doc(item, dedent=dedent)
-    title, body = parse_title_body(doc, parse_title=title_depth is not None)
-    if not title and not body:
-        return ''
-
-    chunks = []
-    if title and include_title:
-        chunks.append('{} {}\n'.format('#' * title_depth, title))
-
-    if body:
-        if title and include_title:
-            chunks.append('\n')
-        for item in parse_body_items(body):
-            if isinstance(item, ExampleBlock):
-                chunks.extend(('```pycon\n', item, '```\n'))
-            else:
-                chunks.append(item)
-
-    return ''.join(chunks)
+    return ''.join(markdown_chunks(item, title_depth, dedent, include_title))
 
 
 def to_rest(item, title_char='-', dedent=True, include_title=True):
@@ -196,33 +157,173 @@ def to_rest(item, title_char='-', dedent=True, include_title=True):
             >>> True
             True
     """
-    doc = get_doc(item, dedent=dedent)
-    title, body = parse_title_body(doc, parse_title=title_char is not None)
-    if not title and not body:
-        return ''
+    return ''.join(rest_chunks(item, title_char, dedent, include_title))
+
+
+def iter_markdown(items, title_depth=2, dedent=True, include_title=True):
+    """
+    Convert multiple docstrings to Markdown, chunk by chunk.
+
+    Every item is converted as by :py:func:`to_markdown`, non-empty results are
+    separated with blank line. Nothing is rendered or imported in advance, so the
+    whole document is never held in memory.
+
+    Args:
+        items (iterable of ``object`` | ``str`` | ``None`` | ``module``):
+            inputs to be converted; modules are replaced with test cases returned
+            by :py:func:`iter_cases`.
+        title_depth (``int`` | ``None``, optional):
+            same as for :py:func:`to_markdown`.
+        dedent (``bool``, optional):
+            same as for :py:func:`to_markdown`.
+        include_title (``bool``, optional):
+            same as for :py:func:`to_markdown`.
+
+    Yields:
+        ``str``: chunks of Markdown formatted text.
 
-    chunks = []
-    if title and include_title:
-        chunks.append('{}\n{}\n'.format(title, title_char * max(3, len(title))))
+    Example:
+
+        .. code:: python
+
+            with open('usage.md', 'w') as f:
+                f.writelines(iter_markdown([tests.usage, OtherCase]))
+    """
+    return join_chunks(
+        markdown_chunks(i, title_depth, dedent, include_title)
+        for i in iter_items(items)
+    )
+
+
+def iter_rest(items, title_char='-', dedent=True, include_title=True):
+    """
+    Convert multiple docstrings to reStructuredText, chunk by chunk.
+
+    Same as :py:func:`iter_markdown`, but items are converted as by
+    :py:func:`to_rest`.
+
+    Yields:
+        ``str``: chunks of reST formatted text.
+    """
+    return join_chunks(
+        rest_chunks(i, title_char, dedent, include_title) for i in iter_items(items)
+    )
 
-    if body:
-        if title and include_title:
-            chunks.append('\n')
-        chunks.append(body)
 
-    return ''.join(chunks)
+def iter_cases(module):
+    """
+    Iterate over test cases decorated with `~doctestcase.case.doctestcase`.
+
+    Args:
+        module (``module`` | ``str``):
+            module object or its dotted name. If module is a package, its
+            submodules are imported and searched recursively.
+
+    Yields:
+        ``type``: decorated test cases in order of definition (by name on Python
+        below 3.6), module by module.
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+    objects = list(vars(module).values())
+    if sys.version_info < (3, 6):  # dicts are not ordered
+        objects.sort(key=lambda obj: str(getattr(obj, '__name__', '')))
+    for obj in objects:
+        props = getattr(obj, '__doctestcase__', None)
+        if isinstance(obj, type) and props is not None and props.bind is obj:
+            if obj.__module__ == module.__name__:
+                yield obj
+    if hasattr(module, '__path__'):
+        import pkgutil  # not imported with the package, it is rarely needed
+
+        prefix = module.__name__ + '.'
+        for _, name, _ in pkgutil.iter_modules(module.__path__, prefix):
+            for case in iter_cases(name):
+                yield case
 
 
 # helpers
 
 
-class ExampleBlock(str):
-    """Internal marker type to represent lines of block of examples"""
+class ParsedDoc(object):
+    """Internal representation of docstring components, shared by all formatters"""
 
+    __slots__ = ('title', 'body', '_bounds')
 
-def get_doc(item, dedent):
+    def __init__(self, title, body):
+        self.title = title or ''
+        self.body = body or ''
+        self._bounds = None
+
+    @property
+    def bounds(self):
+        # offsets in body where text and example blocks alternate, starting with
+        # text; items are never copied out of the body until formatted
+        if self._bounds is None:
+            self._bounds = parse_body_bounds(self.body)
+        return self._bounds
+
+    def spans(self):
+        """Yield ``(start, end, is_example)`` of non-empty body items"""
+        bounds = self.bounds
+        for i in range(len(bounds) - 1):
+            if bounds[i] != bounds[i + 1]:
+                yield bounds[i], bounds[i + 1], i % 2 == 1
+
+
+class LRUCache(object):
+    """Internal mapping that keeps up to ``maxsize`` recently used items"""
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.data = OrderedDict()
+
+    def __len__(self):
+        return len(self.data)
+
+    def get(self, key):
+        try:
+            value = self.data.pop(key)
+        except KeyError:
+            return None
+        self.data[key] = value
+        return value
+
+    def set(self, key, value):
+        self.data[key] = value
+        while len(self.data) > self.maxsize:
+            try:
+                self.data.popitem(last=False)
+            except KeyError:  # pragma: nocover  # emptied by another thread
+                break
+
+    def clear(self):
+        self.data.clear()
+
+
+# Formatters may be called many times for the same docstring, e.g. to get title,
+# body and Markdown of the test case; docstrings are parsed only once.
+PARSED = LRUCache(maxsize=1024)
+
+
+def parse_doc(item, dedent, parse_title):
+    raw = get_raw(item)
+    key = (raw, dedent, parse_title)
+    parsed = PARSED.get(key)
+    if parsed is None:
+        doc = get_doc(raw, dedent=dedent)
+        parsed = ParsedDoc(*parse_title_body(doc, parse_title=parse_title))
+        PARSED.set(key, parsed)
+    return parsed
+
+
+def get_raw(item):
     item = item or ''
-    item = item if isinstance(item, str) else item.__doc__
+    return item if isinstance(item, str) else item.__doc__ or ''
+
+
+def get_doc(item, dedent):
+    item = get_raw(item)
     if not item:
         return ''
     if dedent:
@@ -231,17 +332,19 @@ def get_doc(item, dedent):
 
 
 def parse_title_body(doc, parse_title):
-    if parse_title:
-        match = RX_DOCSTRING.match(doc)
-        if match is not None:
-            title = ' '.join((t.strip() for t in match.group('title').splitlines()))
-            body = match.group('body')
+    title, body = '', doc
+    if parse_title and doc and not doc.lstrip().startswith('>>>'):
+        # title is the text before the first blank line, not counting first char
+        pos = doc.find('\n', 1)
+        while pos != -1:
+            nxt = doc.find('\n', pos + 1)
+            if nxt != -1 and not doc[pos + 1 : nxt].strip(' \t'):
+                title, body = doc[:pos], doc[nxt + 1 :]
+                break
+            pos = nxt
         else:
-            title = ''
-            body = doc
-    else:
-        title = ''
-        body = doc
+            title, body = doc, None
+        title = ' '.join((t.strip() for t in title.splitlines()))
 
     if body is not None:
         body = body.strip()
@@ -251,10 +354,103 @@ def parse_title_body(doc, parse_title):
     return title, body
 
 
-def parse_body_items(body):
-    charno = 0
-    for m in RX_EXAMPLE_BLOCK.finditer(body):
-        yield body[charno : m.start()]
-        yield ExampleBlock(body[m.start() : m.end()])
-        charno = m.end()
-    yield body[charno:]
+def parse_body_bounds(body):
+    bounds = array('l', [0])
+    for start, end in iter_example_blocks(body):
+        bounds.append(start)
+        bounds.append(end)
+    bounds.append(len(body))
+    return bounds
+
+
+def iter_example_blocks(body):
+    # Example block consists of a PS1 line followed by non-blank lines or series
+    # of blank lines followed by PS1 line, and must end with newline. Every line is
+    # visited once, so this is linear in the length of the body.
+    lines = body.split('\n')
+    starts = [0]
+    for line in lines:
+        starts.append(starts[-1] + len(line) + 1)
+
+    i, count = 0, len(lines)
+    while i < count:
+        if not is_ps1(lines[i]):
+            i += 1
+            continue
+        last = j = i
+        while j + 1 < count:
+            if not is_blank(lines[j + 1]):
+                last = j = j + 1
+                continue
+            k = j + 1
+            while k < count and is_blank(lines[k]):
+                k += 1
+            if k < count and is_ps1(lines[k]):
+                last = j = k
+            else:
+                break
+        if last < count - 1:  # last line is followed by newline
+            yield starts[i], starts[last + 1]
+            i = last + 1
+        elif last > i:  # last line ends the body without newline, exclude it
+            yield starts[i], starts[last]
+            i = last
+        else:
+            i += 1
+
+
+def is_ps1(line):
+    return line.lstrip(' ').startswith('>>>')
+
+
+def is_blank(line):
+    return not line.strip(' ')
+
+
+def iter_items(items):
+    for item in items:
+        if isinstance(item, ModuleType):
+            for case in iter_cases(item):
+                yield case
+        else:
+            yield item
+
+
+def join_chunks(items):
+    first = True
+    for chunks in items:
+        for i, chunk in enumerate(chunks):
+            if i == 0 and not first:
+                yield '\n'
+            first = False
+            yield chunk
+
+
+def markdown_chunks(item, title_depth, dedent, include_title):
+    parsed = parse_doc(item, dedent=dedent, parse_title=title_depth is not None)
+
+    if parsed.title and include_title:
+        yield '{} {}\n'.format('#' * title_depth, parsed.title)
+        if parsed.body:
+            yield '\n'
+
+    body = parsed.body
+    for start, end, is_example in parsed.spans():
+        if is_example:
+            yield '```pycon\n'
+            yield body[start:end]
+            yield '```\n'
+        else:
+            yield body[start:end]
+
+
+def rest_chunks(item, title_char, dedent, include_title):
+    parsed = parse_doc(item, dedent=dedent, parse_title=title_char is not None)
+
+    if parsed.title and include_title:
+        yield '{}\n{}\n'.format(parsed.title, title_char * max(3, len(parsed.title)))
+        if parsed.body:
+            yield '\n'
+
+    if parsed.body:
+        yield parsed.body
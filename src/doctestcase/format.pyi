@@ -1,5 +1,7 @@
-from collections.abc import Iterable
-from typing import Optional, Tuple, Union
+from array import array
+from collections.abc import Iterable, Iterator
+from types import ModuleType
+from typing import Generic, Hashable, Optional, Tuple, TypeVar, Union
 
 Item = Union[object, str, None]
 
@@ -17,11 +19,56 @@ def to_rest(
     dedent: bool = ...,
     include_title: bool = ...,
 ) -> str: ...
+def iter_markdown(
+    items: Iterable[Union[Item, ModuleType]],
+    title_depth: Optional[int] = ...,
+    dedent: bool = ...,
+    include_title: bool = ...,
+) -> Iterator[str]: ...
+def iter_rest(
+    items: Iterable[Union[Item, ModuleType]],
+    title_char: Optional[str] = ...,
+    dedent: bool = ...,
+    include_title: bool = ...,
+) -> Iterator[str]: ...
+def iter_cases(module: Union[ModuleType, str]) -> Iterator[type]: ...
+
+class ParsedDoc:
+    title: str
+    body: str
+    def __init__(self, title: Optional[str], body: Optional[str]) -> None: ...
+    @property
+    def bounds(self) -> array[int]: ...
+    def spans(self) -> Iterator[Tuple[int, int, bool]]: ...
+
+V = TypeVar('V')
+
+class LRUCache(Generic[V]):
+    maxsize: int
+    def __init__(self, maxsize: int) -> None: ...
+    def __len__(self) -> int: ...
+    def get(self, key: Hashable) -> Optional[V]: ...
+    def set(self, key: Hashable, value: V) -> None: ...
+    def clear(self) -> None: ...
 
-class ExampleBlock(list[str]): ...
+PARSED: LRUCache[ParsedDoc]
 
+def parse_doc(item: Item, dedent: bool, parse_title: bool) -> ParsedDoc: ...
+def get_raw(item: Item) -> str: ...
+def get_doc(item: Item, dedent: bool) -> str: ...
 def parse_title_body(
     doc: Optional[str],
     parse_title: bool = ...,
 ) -> Tuple[str, str]: ...
-def parse_body_items(body: str) -> Iterable[Union[str, ExampleBlock]]: ...
+def parse_body_bounds(body: str) -> array[int]: ...
+def iter_example_blocks(body: str) -> Iterator[Tuple[int, int]]: ...
+def is_ps1(line: str) -> bool: ...
+def is_blank(line: str) -> bool: ...
+def iter_items(items: Iterable[Union[Item, ModuleType]]) -> Iterator[Item]: ...
+def join_chunks(items: Iterable[Iterable[str]]) -> Iterator[str]: ...
+def markdown_chunks(
+    item: Item, title_depth: Optional[int], dedent: bool, include_title: bool
+) -> Iterator[str]: ...
+def rest_chunks(
+    item: Item, title_char: Optional[str], dedent: bool, include_title: bool
+) -> Iterator[str]: ...
@@ -0,0 +1,153 @@
+import atexit
+import sys
+
+from .listener import Listener
+
+
+# Python 2 looks up globals of functions with exact dict lookup that bypasses
+# ``__missing__``, so functions defined in doctests would not see base names.
+LAYERED = sys.version_info >= (3,)
+
+SCOPES = ('example', 'class', 'session')
+
+
+class lazy(object):
+    """
+    Value of doctest globals, created by ``factory`` on first name lookup.
+
+    Args:
+        factory (``callable``):
+            function without arguments that returns the value. If ``factory`` is
+            a generator function, the first yielded value is used, and the rest
+            of the generator is run on teardown.
+        scope (``str``, optional):
+            value lifetime; one of ``'example'`` (created for every example that
+            uses it), ``'class'`` (created once per ``test_docstring`` run), or
+            ``'session'`` (created once, torn down on interpreter exit);
+            defaults to ``'class'``.
+
+    Values are only created when used by doctest, so building expensive fixtures is
+    moved from test module import to test run, and skipped for test cases that are
+    not run. Like names of `LayeredGlobals`, names of ``lazy`` values are not
+    listed by ``globals()`` or ``dir()``, and can't be deleted with ``del``; other
+    globals are copied as usual unless ``layered`` is set. On Python 2, all ``lazy`` values of the test case are created when
+    ``test_docstring`` starts, and ``'example'`` scope is the same as ``'class'``.
+
+    Example:
+
+        .. code:: python
+
+            @doctestcase(globals={'data': lazy(load_data, scope='session')})
+            class DataCase(TestCase):
+                \"\"\"
+                >>> len(data)
+                1000
+                \"\"\"
+    """
+
+    def __init__(self, factory, scope='class'):
+        if scope not in SCOPES:
+            raise ValueError('Unknown scope {!r}'.format(scope))
+        self.factory = factory
+        self.scope = scope
+        self.session = None
+
+    def create(self):
+        import inspect  # imported when the first fixture is created
+
+        if inspect.isgeneratorfunction(self.factory):
+            gen = self.factory()
+            return next(gen), gen
+        return self.factory(), None
+
+    def get_session(self):
+        if self.session is None:
+            value, gen = self.create()
+            self.session = (value,)
+            if gen is not None:
+                atexit.register(teardown, gen)
+        return self.session[0]
+
+
+class Fixtures(Listener):
+    """
+    Values of `lazy` globals created during one ``test_docstring`` run.
+    """
+
+    def __init__(self):
+        self.values = {'example': {}, 'class': {}}
+        self.generators = {'example': [], 'class': []}
+
+    def get(self, key, value):
+        if value.scope == 'session':
+            return value.get_session()
+        values = self.values[value.scope]
+        if key not in values:
+            values[key], gen = value.create()
+            if gen is not None:
+                self.generators[value.scope].append(gen)
+        return values[key]
+
+    def start_example(self, test, example):
+        self.close('example')
+
+    def close(self, scope='class'):
+        scopes = ('example', 'class') if scope == 'class' else (scope,)
+        for scope in scopes:
+            self.values[scope].clear()
+            while self.generators[scope]:
+                teardown(self.generators[scope].pop())
+
+
+class LayeredGlobals(dict):
+    """
+    Doctest globals that store names assigned by the doctest, and look up all other
+    names in the shared ``base`` mapping, without copying it.
+
+    Names from ``base`` are visible to doctest code, including functions defined in
+    the doctest, but are not listed by ``globals()`` or ``dir()``, and can't be
+    deleted with ``del``. Values of `lazy` globals are obtained from ``fixtures``.
+
+    Args:
+        base (``dict``):
+            shared globals; never modified by the doctest.
+        fixtures (`Fixtures` | ``None``, optional):
+            storage for values of `lazy` globals; defaults to ``None`` (`lazy`
+            objects are returned as is).
+    """
+
+    def __init__(self, base, fixtures=None):
+        super(LayeredGlobals, self).__init__()
+        self.base = base
+        self.fixtures = fixtures
+
+    def __missing__(self, key):
+        value = self.base[key]
+        if self.fixtures is not None and isinstance(value, lazy):
+            return self.fixtures.get(key, value)
+        return value
+
+
+def make_globals(base, layered, fixtures):
+    if LAYERED and layered:
+        globs = LayeredGlobals(base, fixtures)
+    elif LAYERED:
+        # only `lazy` values are looked up, all other names are copied
+        values = dict((k, v) for k, v in base.items() if isinstance(v, lazy))
+        globs = LayeredGlobals(values, fixtures) if values else {}
+        globs.update((k, v) for k, v in base.items() if k not in values)
+    else:
+        globs = base.copy()
+        for key, value in base.items():  # Python 2 only, see `lazy`
+            if isinstance(value, lazy):
+                globs[key] = fixtures.get(key, value)
+    if '__name__' not in base:  # same as doctest.DocTestFinder
+        globs['__name__'] = '__main__'
+    return globs
+
+
+def teardown(gen):
+    try:
+        next(gen)
+    except StopIteration:
+        pass
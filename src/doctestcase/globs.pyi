@@ -0,0 +1,40 @@
+from collections.abc import Callable, Generator
+from doctest import DocTest, Example
+from typing import Any, Literal, Optional, Tuple, Union
+
+from .listener import Listener
+
+LAYERED: bool
+SCOPES: Tuple[str, ...]
+
+Scope = Literal['example', 'class', 'session']
+Factory = Callable[[], Union[Any, Generator[Any, None, None]]]
+
+class lazy:
+    factory: Factory
+    scope: Scope
+    session: Optional[Tuple[Any]]
+    def __init__(self, factory: Factory, scope: Scope = ...) -> None: ...
+    def create(self) -> Tuple[Any, Optional[Generator[Any, None, None]]]: ...
+    def get_session(self) -> Any: ...
+
+class Fixtures(Listener):
+    values: dict[str, dict[str, Any]]
+    generators: dict[str, list[Generator[Any, None, None]]]
+    def __init__(self) -> None: ...
+    def get(self, key: str, value: lazy) -> Any: ...
+    def start_example(self, test: DocTest, example: Example) -> None: ...
+    def close(self, scope: str = ...) -> None: ...
+
+class LayeredGlobals(dict[str, Any]):
+    base: dict[str, Any]
+    fixtures: Optional[Fixtures]
+    def __init__(
+        self, base: dict[str, Any], fixtures: Optional[Fixtures] = ...
+    ) -> None: ...
+    def __missing__(self, key: str) -> Any: ...
+
+def make_globals(
+    base: dict[str, Any], layered: Optional[bool], fixtures: Fixtures
+) -> dict[str, Any]: ...
+def teardown(gen: Generator[Any, None, None]) -> None: ...
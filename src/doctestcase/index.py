@@ -0,0 +1,233 @@
+import ast
+import fnmatch
+import json
+import os
+
+from .format import get_body, get_title
+
+
+class IndexEntry(object):
+    """
+    Docstring of `~doctestcase.case.doctestcase`-decorated class found by `Index`.
+
+    Attributes:
+        name (``str``):
+            qualified name of the class, e.g. ``'tests.usage.simple.SimpleCase'``.
+        path (``str``):
+            source file path.
+        lineno (``int``):
+            first line of the class definition, including decorators.
+        end_lineno (``int`` | ``None``):
+            last line of the class definition; ``None`` on Python below 3.8.
+        doc (``str``):
+            class docstring, as written in source file.
+        examples (``int``):
+            number of doctest examples in the docstring.
+        title (``str``):
+            docstring title, see `~doctestcase.format.get_title`.
+        body (``str``):
+            docstring body, see `~doctestcase.format.get_body`.
+    """
+
+    __slots__ = ('name', 'path', 'lineno', 'end_lineno', 'doc', 'examples')
+
+    def __init__(self, name, path, lineno, end_lineno, doc, examples):
+        self.name = name
+        self.path = path
+        self.lineno = lineno
+        self.end_lineno = end_lineno
+        self.doc = doc
+        self.examples = examples
+
+    def __repr__(self):
+        return '<IndexEntry {} {}:{}>'.format(self.name, self.path, self.lineno)
+
+    @property
+    def title(self):
+        return get_title(self.doc)
+
+    @property
+    def body(self):
+        return get_body(self.doc)
+
+    def to_json(self):
+        return dict((k, getattr(self, k)) for k in self.__slots__)
+
+
+class Index(object):
+    """
+    Index of docstrings of `~doctestcase.case.doctestcase`-decorated classes,
+    built from source files without importing them.
+
+    Classes are recognized by decorators: `~doctestcase.case.doctestcase` (also
+    under import alias), ``__doctestcase__`` attribute of other test case, and
+    names assigned with ``doctestcase(...)`` at module level. Classes created
+    dynamically are not found.
+
+    Index can be saved to JSON file and loaded back; :py:meth:`update` rescans
+    only changed files.
+
+    Example:
+
+        .. code:: python
+
+            index = Index.load('.cache/index.json')
+            index.update(['tests'])
+            index.save('.cache/index.json')
+            to_markdown(index['tests.usage.simple.SimpleCase'].doc)
+    """
+
+    def __init__(self):
+        self.entries = {}
+        self.files = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, name):
+        return name in self.entries
+
+    def __getitem__(self, name):
+        return self.entries[name]
+
+    def __iter__(self):
+        return iter(sorted(self.entries.values(), key=lambda e: (e.path, e.lineno)))
+
+    def get(self, name, default=None):
+        return self.entries.get(name, default)
+
+    def find(self, pattern):
+        """
+        Return entries with qualified names matching `fnmatch` ``pattern``.
+        """
+        return [e for e in self if fnmatch.fnmatchcase(e.name, pattern)]
+
+    def update(self, paths):
+        """
+        Scan source files and directories in ``paths`` for changes; forget files
+        that were deleted.
+        """
+        for path in [p for p in self.files if not os.path.exists(p)]:
+            for name in self.files.pop(path)['names']:
+                self.entries.pop(name, None)
+        for path in iter_sources(paths):
+            path = os.path.abspath(path)
+            stat = os.stat(path)
+            state = [stat.st_mtime, stat.st_size]
+            if self.files.get(path, {}).get('state') == state:
+                continue
+            for name in self.files.get(path, {}).get('names', ()):
+                self.entries.pop(name, None)
+            entries = scan_file(path)
+            for entry in entries:
+                self.entries[entry.name] = entry
+            self.files[path] = {'state': state, 'names': [e.name for e in entries]}
+        return self
+
+    @classmethod
+    def load(cls, path):
+        """
+        Load index saved with :py:meth:`save`; return empty index if file does not
+        exist.
+        """
+        index = cls()
+        if not os.path.exists(path):
+            return index
+        with open(path) as f:
+            data = json.load(f)
+        index.files = data['files']
+        for item in data['entries']:
+            entry = IndexEntry(**item)
+            index.entries[entry.name] = entry
+        return index
+
+    def save(self, path):
+        """
+        Save index to JSON file.
+        """
+        data = {'files': self.files, 'entries': [e.to_json() for e in self]}
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=1, sort_keys=True)
+
+
+def build_index(paths):
+    """
+    Build `Index` of source files and directories in ``paths``.
+    """
+    return Index().update(paths)
+
+
+# helpers
+
+
+def iter_sources(paths):
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            dirs[:] = sorted(d for d in dirs if not d.startswith(('.', '__')))
+            for name in sorted(files):
+                if name.endswith('.py'):
+                    yield os.path.join(root, name)
+
+
+def get_module_name(path):
+    parts = [os.path.splitext(os.path.basename(path))[0]]
+    if parts[0] == '__init__':
+        parts = []
+    root = os.path.dirname(path)
+    while os.path.exists(os.path.join(root, '__init__.py')):
+        root, name = os.path.split(root)
+        parts.insert(0, name)
+    return '.'.join(parts)
+
+
+def scan_file(path):
+    from doctest import DocTestParser  # not imported with the package, see case.py
+
+    with open(path, 'rb') as f:
+        try:
+            tree = ast.parse(f.read(), path)
+        except (SyntaxError, ValueError):
+            return []
+    names = get_decorator_names(tree)
+    module = get_module_name(path)
+    entries = []
+    stack = [(module, node) for node in tree.body]
+    while stack:
+        prefix, node = stack.pop(0)
+        if not isinstance(node, ast.ClassDef):
+            continue
+        name = '{}.{}'.format(prefix, node.name) if prefix else node.name
+        stack.extend((name, child) for child in node.body)
+        if not any(is_decorator(d, names) for d in node.decorator_list):
+            continue
+        doc = ast.get_docstring(node, clean=False) or ''
+        lineno = min([node.lineno] + [d.lineno for d in node.decorator_list])
+        end_lineno = getattr(node, 'end_lineno', None)  # Python 3.8+
+        examples = len(DocTestParser().get_examples(doc, name)) if doc else 0
+        entries.append(IndexEntry(name, path, lineno, end_lineno, doc, examples))
+    return entries
+
+
+def get_decorator_names(tree):
+    names = set(['doctestcase'])
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom):
+            if node.module in ('doctestcase', 'doctestcase.case'):
+                for alias in node.names:
+                    if alias.name == 'doctestcase' and alias.asname:
+                        names.add(alias.asname)
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and is_decorator(node.value, names):
+            names.update(t.id for t in node.targets if isinstance(t, ast.Name))
+    return names
+
+
+def is_decorator(node, names):
+    if isinstance(node, ast.Call):
+        node = node.func
+    if isinstance(node, ast.Attribute):
+        return node.attr in ('doctestcase', '__doctestcase__')
+    return isinstance(node, ast.Name) and node.id in names
@@ -0,0 +1,49 @@
+import ast
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+class IndexEntry:
+    name: str
+    path: str
+    lineno: int
+    end_lineno: Optional[int]
+    doc: str
+    examples: int
+    def __init__(
+        self,
+        name: str,
+        path: str,
+        lineno: int,
+        end_lineno: Optional[int],
+        doc: str,
+        examples: int,
+    ) -> None: ...
+    @property
+    def title(self) -> str: ...
+    @property
+    def body(self) -> str: ...
+    def to_json(self) -> dict[str, Any]: ...
+
+class Index:
+    entries: dict[str, IndexEntry]
+    files: dict[str, dict[str, Any]]
+    def __init__(self) -> None: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, name: object) -> bool: ...
+    def __getitem__(self, name: str) -> IndexEntry: ...
+    def __iter__(self) -> Iterator[IndexEntry]: ...
+    def get(
+        self, name: str, default: Optional[IndexEntry] = ...
+    ) -> Optional[IndexEntry]: ...
+    def find(self, pattern: str) -> list[IndexEntry]: ...
+    def update(self, paths: Iterable[str]) -> 'Index': ...
+    @classmethod
+    def load(cls, path: str) -> 'Index': ...
+    def save(self, path: str) -> None: ...
+
+def build_index(paths: Iterable[str]) -> Index: ...
+def iter_sources(paths: Iterable[str]) -> Iterator[str]: ...
+def get_module_name(path: str) -> str: ...
+def scan_file(path: str) -> list[IndexEntry]: ...
+def get_decorator_names(tree: ast.Module) -> set[str]: ...
+def is_decorator(node: ast.expr, names: set[str]) -> bool: ...
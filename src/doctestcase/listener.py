@@ -0,0 +1,15 @@
+class Listener(object):
+    """
+    Base class for objects notified by `~doctestcase.runner.Runner` about doctest
+    examples.
+    """
+
+    def start_example(self, test, example):
+        """Called before ``example`` of ``test`` is executed."""
+
+    def end_example(self, test, example, outcome, got):
+        """
+        Called after ``example`` of ``test`` is executed and its output is checked;
+        ``outcome`` is one of ``'success'``, ``'failure'`` or ``'error'``, ``got``
+        is example output, or formatted traceback for ``'error'``.
+        """
@@ -0,0 +1,10 @@
+from doctest import DocTest, Example
+from typing import Literal
+
+Outcome = Literal['success', 'failure', 'error']
+
+class Listener:
+    def start_example(self, test: DocTest, example: Example) -> None: ...
+    def end_example(
+        self, test: DocTest, example: Example, outcome: Outcome, got: str
+    ) -> None: ...
@@ -0,0 +1,247 @@
+from collections import OrderedDict
+import multiprocessing
+import os
+import sys
+import unittest
+
+try:
+    from StringIO import StringIO
+except ImportError:
+    from io import StringIO
+
+
+def discover(targets, pattern='test*.py', top_level_dir=None):
+    """
+    Load tests from directories or dotted names.
+
+    Args:
+        targets (``list`` of ``str``):
+            directories to discover test modules in, or dotted names of modules,
+            classes or methods, as accepted by `unittest.TestLoader`.
+        pattern (``str``, optional):
+            test module file name pattern used for directories; defaults to
+            ``'test*.py'``.
+        top_level_dir (``str`` | ``None``, optional):
+            top level directory of the project, passed to
+            `unittest.TestLoader.discover`; defaults to ``None``.
+
+    Returns:
+        `unittest.TestSuite`: loaded tests.
+    """
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite()
+    for target in targets:
+        if os.path.isdir(target):
+            suite.addTests(loader.discover(target, pattern, top_level_dir))
+        else:
+            suite.addTests(loader.loadTestsFromName(target))
+    return suite
+
+
+class ParallelSuite(object):
+    """
+    Test suite that runs `doctestcase`-decorated test cases in a process pool.
+
+    Tests are grouped by class, and every class is run in a worker process as a
+    separate `unittest.TestSuite`, so that ``setUpClass``, ``setUp``,
+    ``tearDown`` and ``tearDownClass`` are honored as usual. Results are merged
+    back into the `unittest.TestResult` passed to :py:meth:`run` in the original
+    test order, together with the output captured from every class, so that the
+    log does not depend on the number of processes.
+
+    Test cases that are not decorated with `doctestcase` are excluded, except
+    for module import errors. Classes that can't be imported by workers (e.g.
+    defined inside functions) are run in the main process.
+
+    Args:
+        tests (`unittest.TestSuite` | iterable of `unittest.TestCase`):
+            tests to run, usually obtained from :py:func:`discover`.
+        processes (``int`` | ``None``, optional):
+            number of worker processes; defaults to ``None`` (number of CPUs).
+            If ``1``, tests are run in the main process.
+        maxfail (``int`` | ``None``, optional):
+            stop the run when the number of failed tests and errors reaches
+            ``maxfail``; defaults to ``None`` (run all tests). The budget is checked
+            after every test class, results of classes that are already running
+            in worker processes are discarded.
+    """
+
+    def __init__(self, tests, processes=None, maxfail=None):
+        self.processes = processes
+        self.maxfail = maxfail
+        self.groups = OrderedDict()
+        for test in iter_tests(tests):
+            if is_loader_error(test) or hasattr(test, '__doctestcase__'):
+                self.groups.setdefault(test.__class__, []).append(test)
+
+    def __call__(self, result):
+        return self.run(result)
+
+    def __iter__(self):
+        for tests in self.groups.values():
+            for test in tests:
+                yield test
+
+    def countTestCases(self):
+        return sum(len(tests) for tests in self.groups.values())
+
+    def run(self, result):
+        remote, local = [], []
+        for cls, tests in self.groups.items():
+            (remote if is_importable(cls) else local).append((cls, tests))
+
+        if self.processes == 1 or len(remote) < 2:
+            local = remote + local
+            remote = []
+
+        if remote:
+            jobs = [
+                (cls.__module__, cls.__name__, [t._testMethodName for t in tests])
+                for cls, tests in remote
+            ]
+            pool = multiprocessing.Pool(self.processes)
+            try:
+                for i, ret in enumerate(pool.imap(run_job, jobs)):
+                    replay(result, remote[i][1], *ret)
+                    self.check_budget(result)
+                    if result.shouldStop:
+                        break
+            finally:
+                pool.terminate()
+                pool.join()
+
+        for _, tests in local:
+            if result.shouldStop:
+                break
+            unittest.TestSuite(tests).run(result)
+            self.check_budget(result)
+        return result
+
+    def check_budget(self, result):
+        if self.maxfail is None:
+            return
+        if len(result.failures) + len(result.errors) >= self.maxfail:
+            result.stop()
+
+
+class RemoteError(Exception):
+    """Error reported by worker process; the message holds original traceback."""
+
+
+# helpers
+
+
+def iter_tests(tests):
+    for test in tests:
+        if isinstance(test, unittest.TestCase):
+            yield test
+        else:
+            for t in iter_tests(test):
+                yield t
+
+
+def is_loader_error(test):
+    return test.__class__.__module__ == 'unittest.loader'
+
+
+def is_importable(cls):
+    module = sys.modules.get(cls.__module__)
+    return module is not None and getattr(module, cls.__name__, None) is cls
+
+
+def run_job(job):
+    module, name, methods = job
+    recorder = Recorder()
+    stdout, stderr = sys.stdout, sys.stderr
+    sys.stdout = sys.stderr = output = StringIO()
+    try:
+        __import__(module)
+        cls = getattr(sys.modules[module], name)
+        unittest.TestSuite([cls(m) for m in methods]).run(recorder)
+    except Exception:
+        recorder.addError(Placeholder('{}.{}'.format(module, name)), sys.exc_info())
+    finally:
+        sys.stdout, sys.stderr = stdout, stderr
+    return output.getvalue(), recorder.events
+
+
+def replay(result, tests, output, events):
+    if output:
+        sys.stdout.write(output)
+    tests = dict((t.id(), t) for t in tests)
+    for event, test_id, description, arg in events:
+        test = tests.get(test_id) or Placeholder(description)
+        if event == 'stopTest':
+            if arg is not None:
+                test.doctest_results = arg
+            result.stopTest(test)
+        elif event in ('startTest', 'addSuccess', 'addUnexpectedSuccess'):
+            getattr(result, event)(test)
+        elif event == 'addSkip':
+            result.addSkip(test, arg)
+        else:
+            getattr(result, event)(test, (RemoteError, RemoteError(arg), None))
+
+
+class Placeholder(object):
+    """Test reported by worker that has no counterpart in the main process."""
+
+    failureException = AssertionError
+
+    def __init__(self, description):
+        self.description = description
+
+    def __str__(self):
+        return self.description
+
+    def id(self):
+        return self.description
+
+    def shortDescription(self):
+        return None
+
+
+class Recorder(unittest.TestResult):
+    """Test result that records events to be replayed in the main process."""
+
+    def __init__(self):
+        super(Recorder, self).__init__()
+        self.events = []
+
+    def record(self, event, test, arg=None):
+        self.events.append((event, test.id(), str(test), arg))
+
+    def startTest(self, test):
+        super(Recorder, self).startTest(test)
+        self.record('startTest', test)
+
+    def stopTest(self, test):
+        super(Recorder, self).stopTest(test)
+        self.record('stopTest', test, getattr(test, 'doctest_results', None))
+
+    def addSuccess(self, test):
+        self.record('addSuccess', test)
+
+    def addFailure(self, test, err):
+        self.record('addFailure', test, self._exc_info_to_string(err, test))
+
+    def addError(self, test, err):
+        self.record('addError', test, self._exc_info_to_string(err, test))
+
+    def addSkip(self, test, reason):
+        self.record('addSkip', test, reason)
+
+    def addExpectedFailure(self, test, err):
+        self.record('addExpectedFailure', test, self._exc_info_to_string(err, test))
+
+    def addUnexpectedSuccess(self, test):
+        self.record('addUnexpectedSuccess', test)
+
+    def addSubTest(self, test, subtest, err):
+        if err is not None:
+            event = (
+                'addFailure'
+                if issubclass(err[0], test.failureException)
+                else 'addError'
+            )
+            self.record(event, subtest, self._exc_info_to_string(err, test))
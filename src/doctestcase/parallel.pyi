@@ -0,0 +1,54 @@
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Sequence
+from typing import Any, Optional, Tuple, Union
+from unittest import TestCase, TestResult, TestSuite
+
+Job = Tuple[str, str, list[str]]
+Event = Tuple[str, str, str, Optional[str]]
+
+def discover(
+    targets: Sequence[str],
+    pattern: str = ...,
+    top_level_dir: Optional[str] = ...,
+) -> TestSuite: ...
+
+class ParallelSuite:
+    processes: Optional[int]
+    maxfail: Optional[int]
+    groups: OrderedDict[type[TestCase], list[TestCase]]
+    def __init__(
+        self,
+        tests: Union[TestSuite, Iterable[TestCase]],
+        processes: Optional[int] = ...,
+        maxfail: Optional[int] = ...,
+    ) -> None: ...
+    def __call__(self, result: TestResult) -> TestResult: ...
+    def __iter__(self) -> Iterator[TestCase]: ...
+    def countTestCases(self) -> int: ...
+    def run(self, result: TestResult) -> TestResult: ...
+    def check_budget(self, result: TestResult) -> None: ...
+
+class RemoteError(Exception): ...
+
+def iter_tests(tests: Iterable[Any]) -> Iterator[TestCase]: ...
+def is_loader_error(test: TestCase) -> bool: ...
+def is_importable(cls: type[TestCase]) -> bool: ...
+def run_job(job: Job) -> Tuple[str, list[Event]]: ...
+def replay(
+    result: TestResult,
+    tests: list[TestCase],
+    output: str,
+    events: list[Event],
+) -> None: ...
+
+class Placeholder:
+    failureException: type[BaseException]
+    description: str
+    def __init__(self, description: str) -> None: ...
+    def id(self) -> str: ...
+    def shortDescription(self) -> None: ...
+
+class Recorder(TestResult):
+    events: list[Event]
+    def __init__(self) -> None: ...
+    def record(self, event: str, test: Any, arg: Optional[str] = ...) -> None: ...
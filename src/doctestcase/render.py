@@ -0,0 +1,75 @@
+import os
+
+from .cache import RenderCache
+from .format import to_markdown, to_rest
+from .index import Index, get_module_name
+
+
+FORMATTERS = {'markdown': to_markdown, 'rest': to_rest}
+
+
+class Renderer(object):
+    """
+    Renderer of test case docstrings found by static `~doctestcase.index.Index`,
+    for rendering many locations in one process without importing test modules.
+
+    Locations are qualified names of test cases, `fnmatch` patterns of qualified
+    names, or ``path/to/file.py:ClassName``.
+
+    Args:
+        paths (iterable of ``str``, optional):
+            source files and directories to index; defaults to current directory.
+            Files referred to by path locations are indexed on demand.
+        index (`~doctestcase.index.Index`, optional):
+            existing index to update and use.
+        cache_dir (``str``, optional):
+            directory of on-disk `~doctestcase.cache.RenderCache`; by default,
+            docstrings are rendered every time.
+
+    Example:
+
+        .. code:: python
+
+            renderer = Renderer(['tests'], cache_dir='.cache/render')
+            for entry in renderer.find('tests.usage.*'):
+                print(renderer.render(entry.doc, 'markdown', title_depth=3))
+    """
+
+    def __init__(self, paths=('.',), index=None, cache_dir=None):
+        self.index = Index() if index is None else index
+        self.index.update(paths)
+        self.cache = RenderCache(cache_dir) if cache_dir else None
+
+    def find(self, location):
+        """
+        Return `~doctestcase.index.IndexEntry` list for ``location``, sorted by
+        path and line number.
+
+        Raises:
+            ValueError: if nothing was found.
+        """
+        path, sep, qualname = location.rpartition(':')
+        if sep and path.endswith('.py'):
+            path = os.path.abspath(path)
+            self.index.update([path])
+            module = get_module_name(path)
+            name = '{}.{}'.format(module, qualname) if module else qualname
+            entries = [e for e in self.index if e.path == path and e.name == name]
+        else:
+            entries = self.index.find(location)
+        if not entries:
+            raise ValueError('No test cases found at {}'.format(location))
+        return entries
+
+    def render(self, doc, formatter='markdown', **kwargs):
+        """
+        Render docstring ``doc`` with ``formatter`` (``'markdown'`` or
+        ``'rest'``) called with ``kwargs``, using cache if enabled.
+        """
+        if self.cache is None:
+            return FORMATTERS[formatter](doc, **kwargs)
+        text = self.cache.get(doc, formatter, kwargs)
+        if text is None:
+            text = FORMATTERS[formatter](doc, **kwargs)
+            self.cache.set(doc, formatter, kwargs, text)
+        return text
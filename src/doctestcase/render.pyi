@@ -0,0 +1,19 @@
+from collections.abc import Callable, Iterable
+from typing import Any, Optional
+
+from .cache import RenderCache
+from .index import Index, IndexEntry
+
+FORMATTERS: dict[str, Callable[..., str]]
+
+class Renderer:
+    index: Index
+    cache: Optional[RenderCache]
+    def __init__(
+        self,
+        paths: Iterable[str] = ...,
+        index: Optional[Index] = ...,
+        cache_dir: Optional[str] = ...,
+    ) -> None: ...
+    def find(self, location: str) -> list[IndexEntry]: ...
+    def render(self, doc: str, formatter: str = ..., **kwargs: Any) -> str: ...
@@ -0,0 +1,136 @@
+from collections import namedtuple
+import json
+import unittest
+from xml.sax.saxutils import escape, quoteattr
+
+from .listener import Listener
+from .timing import wall_time
+
+
+ExampleResult = namedtuple('ExampleResult', 'lineno source want got outcome duration')
+
+
+class Collector(Listener):
+    """
+    Listener that collects `ExampleResult` of every executed doctest example.
+
+    Attributes:
+        results (``list`` of `ExampleResult`):
+            results of executed examples, in order of execution. Every result has
+            fields ``lineno`` (line number of the example in the docstring,
+            1-based), ``source``, ``want`` (expected output), ``got`` (actual
+            output, or formatted traceback for ``'error'``), ``outcome``
+            (``'success'``, ``'failure'`` or ``'error'``) and ``duration``
+            (seconds).
+    """
+
+    def __init__(self):
+        self.results = []
+        self.started = None
+
+    def start_example(self, test, example):
+        self.started = wall_time()
+
+    def end_example(self, test, example, outcome, got):
+        duration = wall_time() - self.started
+        example = getattr(example, 'original', example)
+        self.results.append(
+            ExampleResult(
+                example.lineno + 1,
+                example.source,
+                example.want,
+                got,
+                outcome,
+                duration,
+            )
+        )
+
+
+class JSONLReport(object):
+    """
+    Report that writes every doctest example result as a line of JSON object with
+    keys ``case`` (test id) and `ExampleResult` fields.
+
+    Args:
+        stream (file-like object):
+            text stream to write to; flushed after every test case.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+
+    def add(self, test, results):
+        for result in results:
+            data = dict(result._asdict(), case=test.id())
+            self.stream.write(json.dumps(data, sort_keys=True) + '\n')
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class JUnitReport(object):
+    """
+    Report that writes every doctest example result as JUnit XML ``<testcase>``
+    named after the example line number, with test id as class name.
+
+    Args:
+        stream (file-like object):
+            text stream to write to; flushed after every test case. The XML
+            document is complete after :py:meth:`close`.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.stream.write(
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<testsuites>\n<testsuite name="doctestcase">\n'
+        )
+
+    def add(self, test, results):
+        for result in results:
+            self.stream.write(
+                '<testcase classname={} name={} time="{:.6f}"'.format(
+                    quoteattr(test.id()),
+                    quoteattr('line {}'.format(result.lineno)),
+                    result.duration,
+                )
+            )
+            if result.outcome == 'success':
+                self.stream.write('/>\n')
+                continue
+            message = '{}Expected:\n{}Got:\n{}'.format(
+                result.source, result.want, result.got
+            )
+            self.stream.write(
+                '>\n<{0} message={1}>{2}</{0}>\n</testcase>\n'.format(
+                    result.outcome,
+                    quoteattr(result.source.strip()),
+                    escape(message),
+                )
+            )
+        self.stream.flush()
+
+    def close(self):
+        self.stream.write('</testsuite>\n</testsuites>\n')
+        self.stream.flush()
+
+
+class ReportingTestResult(unittest.TextTestResult):
+    """
+    `unittest.TextTestResult` that passes doctest example results of every
+    finished test to ``reports``.
+    """
+
+    def __init__(self, stream, descriptions, verbosity, reports=(), **kwargs):
+        super(ReportingTestResult, self).__init__(
+            stream, descriptions, verbosity, **kwargs
+        )
+        self.reports = list(reports)
+
+    def stopTest(self, test):
+        super(ReportingTestResult, self).stopTest(test)
+        results = getattr(test, 'doctest_results', None)
+        if results is not None:
+            for report in self.reports:
+                report.add(test, results)
@@ -0,0 +1,47 @@
+from collections.abc import Iterable
+from doctest import DocTest, Example
+from typing import IO, Any, NamedTuple, Optional, Union
+from unittest import TestCase, TextTestResult
+
+from .listener import Listener, Outcome
+
+class ExampleResult(NamedTuple):
+    lineno: int
+    source: str
+    want: str
+    got: str
+    outcome: Outcome
+    duration: float
+
+class Collector(Listener):
+    results: list[ExampleResult]
+    started: Optional[float]
+    def __init__(self) -> None: ...
+    def start_example(self, test: DocTest, example: Example) -> None: ...
+    def end_example(
+        self, test: DocTest, example: Example, outcome: Outcome, got: str
+    ) -> None: ...
+
+class JSONLReport:
+    stream: IO[str]
+    def __init__(self, stream: IO[str]) -> None: ...
+    def add(self, test: TestCase, results: list[ExampleResult]) -> None: ...
+    def close(self) -> None: ...
+
+class JUnitReport:
+    stream: IO[str]
+    def __init__(self, stream: IO[str]) -> None: ...
+    def add(self, test: TestCase, results: list[ExampleResult]) -> None: ...
+    def close(self) -> None: ...
+
+class ReportingTestResult(TextTestResult):
+    reports: list[Union[JSONLReport, JUnitReport]]
+    def __init__(
+        self,
+        stream: IO[str],
+        descriptions: bool,
+        verbosity: int,
+        reports: Iterable[Union[JSONLReport, JUnitReport]] = ...,
+        **kwargs: Any,
+    ) -> None: ...
+    def stopTest(self, test: TestCase) -> None: ...
@@ -0,0 +1,286 @@
+from doctest import (
+    BLANKLINE_MARKER,
+    DONT_ACCEPT_BLANKLINE,
+    DONT_ACCEPT_TRUE_FOR_1,
+    ELLIPSIS,
+    NORMALIZE_WHITESPACE,
+    REPORT_ONLY_FIRST_FAILURE,
+    DocTestRunner,
+    OutputChecker,
+    _SpoofOut,
+)
+import traceback
+
+from .aio import strip_traceback
+from .checker import FastOutputChecker
+from .listener import Listener as Listener
+
+
+class Runner(DocTestRunner):
+    """
+    `doctest.DocTestRunner` that notifies ``listeners`` about examples.
+
+    Args:
+        listeners (``list`` of `Listener`, optional):
+            objects to notify; defaults to empty list.
+        kwargs:
+            passed to `doctest.DocTestRunner`.
+
+    Listeners are notified about all examples, including examples that are not
+    reported after the first failure when `doctest.REPORT_ONLY_FIRST_FAILURE` is
+    set: the option is not passed to `doctest.DocTestRunner`, which would skip
+    them, and reports are suppressed by the runner itself. Option flags as given
+    are kept in ``options`` attribute.
+
+    If ``max_output`` is set with :py:meth:`reset`, example output is captured by
+    `CappedOut`, and the example fails with truncated output as soon as the limit
+    is exceeded, or the output diverges from expected.
+    """
+
+    def __init__(self, listeners=(), optionflags=0, **kwargs):
+        flags = optionflags & ~REPORT_ONLY_FIRST_FAILURE
+        DocTestRunner.__init__(self, optionflags=flags, **kwargs)
+        self.options = optionflags
+        self.listeners = list(listeners)
+        self.failed = 0  # examples of current test
+        self.quiet = False
+
+    def run(self, test, compileflags=None, out=None, clear_globs=True):
+        self.failed = 0
+        self.quiet = False
+        return DocTestRunner.run(self, test, compileflags, out, clear_globs)
+
+    def report_start(self, out, test, example):
+        if isinstance(self._fakeout, CappedOut):
+            self._fakeout.expect(example, self.optionflags, self._checker)
+        # listeners see examples as written, see `doctestcase.aio.rewrite`
+        original = getattr(example, 'original', example)
+        for listener in self.listeners:
+            listener.start_example(test, original)
+        if not self.quiet:
+            DocTestRunner.report_start(self, out, test, example)
+
+    def report_success(self, out, test, example, got):
+        quiet = self.end_example(test, example, 'success', got)
+        if not quiet:
+            DocTestRunner.report_success(self, out, test, example, got)
+
+    def report_failure(self, out, test, example, got):
+        quiet = self.end_example(test, example, 'failure', got)
+        if not quiet:
+            DocTestRunner.report_failure(self, out, test, example, got)
+
+    def report_unexpected_exception(self, out, test, example, exc_info):
+        if isinstance(exc_info[1], OutputLimitExceeded):
+            got = exc_info[1].got
+            if not self.end_example(test, example, 'failure', got):
+                out(
+                    self._failure_header(test, example)
+                    + self._checker.output_difference(example, got, self.optionflags)
+                    + '{}\n'.format(exc_info[1])
+                )
+            return
+        if hasattr(example, 'original'):
+            strip_traceback(exc_info[2])
+        got = ''.join(traceback.format_exception(*exc_info))
+        quiet = self.end_example(test, example, 'error', got)
+        if not quiet:
+            DocTestRunner.report_unexpected_exception(
+                self, out, test, example, exc_info
+            )
+
+    def end_example(self, test, example, outcome, got):
+        """
+        Notify listeners; return ``True`` if the example must not be reported.
+        """
+        original = getattr(example, 'original', example)
+        for listener in reversed(self.listeners):
+            listener.end_example(test, original, outcome, got)
+        quiet = self.quiet
+        if outcome != 'success':
+            self.failed += 1
+        # same as in doctest: example options decide about reporting the next one
+        flag = self.options & REPORT_ONLY_FIRST_FAILURE
+        flag = example.options.get(REPORT_ONLY_FIRST_FAILURE, flag)
+        self.quiet = bool(flag) and self.failed > 0
+        return quiet
+
+    def reset(self, listeners=(), max_output=None):
+        """
+        Clear counters and state left by previous runs, and set new ``listeners``
+        and ``max_output`` limit of characters printed by one example.
+        """
+        self.listeners = list(listeners)
+        if max_output:
+            self._fakeout = CappedOut(max_output)
+        elif isinstance(self._fakeout, CappedOut):
+            self._fakeout = _SpoofOut()
+        self.optionflags = self.original_optionflags
+        self.tries = self.failures = 0
+        if hasattr(self, 'skips'):  # Python 3.13+
+            self.skips = 0
+        if hasattr(self, '_stats'):  # Python 3.13+
+            self._stats.clear()
+        else:
+            self._name2ft.clear()
+        self.test = None
+
+    def _failure_header(self, test, example):
+        # show original source of examples rewritten by `doctestcase.aio.rewrite`
+        example = getattr(example, 'original', example)
+        return DocTestRunner._failure_header(self, test, example)
+
+    def _DocTestRunner__patched_linecache_getlines(self, filename, module_globals=None):
+        # same for source lines in tracebacks
+        match = self._DocTestRunner__LINECACHE_FILENAME_RE.match(filename)
+        if match and match.group('name') == self.test.name:
+            example = self.test.examples[int(match.group('examplenum'))]
+            if hasattr(example, 'original'):
+                return example.original.source.splitlines(True)
+        return DocTestRunner._DocTestRunner__patched_linecache_getlines(
+            self, filename, module_globals
+        )
+
+
+class OutputLimitExceeded(BaseException):
+    """
+    Raised by `CappedOut` to abort doctest example; not a subclass of `Exception`,
+    so that it is not caught by example code.
+    """
+
+    def __init__(self, message, got):
+        BaseException.__init__(self, message)
+        self.got = got
+
+
+class CappedOut(_SpoofOut):
+    """
+    Doctest output capture that keeps at most ``limit`` characters and raises
+    `OutputLimitExceeded` when the limit is exceeded. If expected output can only
+    match exactly, i.e. without `doctest.ELLIPSIS` and
+    `doctest.NORMALIZE_WHITESPACE` options, every completed line is compared with
+    expected line, and `OutputLimitExceeded` is raised at the first difference.
+    """
+
+    def __init__(self, limit):
+        _SpoofOut.__init__(self)
+        self.limit = limit
+        self.size = 0
+        self.expected = None
+        self.blankline = False
+        self.lineno = 0
+        self.pending = ''
+
+    def expect(self, example, optionflags, checker):
+        """
+        Set expected output of the next ``example``, if it can only match exactly.
+        """
+        self.expected = None
+        if optionflags & (ELLIPSIS | NORMALIZE_WHITESPACE):
+            return
+        if example.exc_msg is not None or checker.__class__ not in EXACT_CHECKERS:
+            return
+        want = example.want
+        if not optionflags & DONT_ACCEPT_TRUE_FOR_1 and want in ('1\n', '0\n'):
+            return
+        self.blankline = not optionflags & DONT_ACCEPT_BLANKLINE
+        self.expected = want.split('\n')[:-1]
+
+    def write(self, s):
+        if self.size + len(s) > self.limit:
+            _SpoofOut.write(self, s[: self.limit - self.size])
+            self.size = self.limit
+            self.abort('Output exceeds {} characters, truncated'.format(self.limit))
+        _SpoofOut.write(self, s)
+        self.size += len(s)
+        if self.expected is not None and '\n' in s:
+            lines = (self.pending + s).split('\n')
+            self.pending = lines.pop()
+            for line in lines:
+                if not self.matches(line):
+                    self.abort(
+                        'Output differs from expected at line {}, truncated'.format(
+                            self.lineno + 1
+                        )
+                    )
+                self.lineno += 1
+        elif self.expected is not None:
+            self.pending += s
+        return len(s)
+
+    def matches(self, line):
+        # lines must be equal as is, or after blank line handling of OutputChecker
+        if self.lineno >= len(self.expected):
+            return False
+        expected = self.expected[self.lineno]
+        if line == expected:
+            return True
+        if self.blankline:
+            if is_blankline_marker(expected):
+                expected = ''
+            return (line if line.strip() else '') == expected
+        return False
+
+    def truncate(self, size=None):
+        _SpoofOut.truncate(self, size)
+        self.size = self.lineno = 0
+        self.pending = ''
+        self.expected = None
+
+    def abort(self, message):
+        self.expected = None  # writes from exception handlers are not checked
+        raise OutputLimitExceeded(message, self.getvalue())
+
+
+class RunnerPool(object):
+    """
+    Idle `Runner` objects, reused by ``test_docstring`` runs with the same options.
+
+    Creating `doctest.DocTestRunner` allocates output checker and fake stdout, which
+    is comparable to running a short docstring. Runners are taken from the pool for
+    the duration of a run, so nested and concurrent runs get separate runners, and
+    the number of idle runners never exceeds the number of concurrent runs.
+    """
+
+    def __init__(self):
+        self.idle = {}
+
+    # fmt: off
+    def acquire(
+        self,
+        listeners=(),
+        optionflags=0,
+        checker=OutputChecker,
+        max_output=None
+    ):
+        # fmt: on
+        """
+        Return idle runner with given ``optionflags`` and ``checker`` class, or a new
+        one, notifying ``listeners`` and limiting output to ``max_output``.
+        """
+        try:
+            runner = self.idle[optionflags, checker].pop()
+        except (KeyError, IndexError):
+            runner = Runner(optionflags=optionflags, checker=checker(), verbose=False)
+        runner.reset(listeners, max_output)
+        return runner
+
+    def release(self, runner):
+        """
+        Return ``runner`` obtained from :py:meth:`acquire` to the pool.
+        """
+        runner.reset()
+        key = (runner.options, runner._checker.__class__)
+        self.idle.setdefault(key, []).append(runner)
+
+
+RUNNERS = RunnerPool()
+
+# checkers that accept only exact output without ELLIPSIS and NORMALIZE_WHITESPACE
+EXACT_CHECKERS = (OutputChecker, FastOutputChecker)
+
+
+def is_blankline_marker(line):
+    return (
+        line.startswith(BLANKLINE_MARKER) and not line[len(BLANKLINE_MARKER) :].strip()
+    )
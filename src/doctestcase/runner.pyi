@@ -0,0 +1,88 @@
+from doctest import DocTest, DocTestRunner, Example, OutputChecker, TestResults
+from io import StringIO
+from collections.abc import Callable, Iterable
+from types import TracebackType
+from typing import Any, NoReturn, Optional
+
+from .listener import Listener as Listener, Outcome as Outcome
+
+ExcInfo = tuple[type[BaseException], BaseException, TracebackType]
+
+class Runner(DocTestRunner):
+    listeners: list[Listener]
+    options: int
+    failed: int
+    quiet: bool
+    def __init__(
+        self, listeners: Iterable[Listener] = ..., optionflags: int = ..., **kwargs: Any
+    ) -> None: ...
+    def run(
+        self,
+        test: DocTest,
+        compileflags: Optional[int] = ...,
+        out: Optional[Callable[[str], object]] = ...,
+        clear_globs: bool = ...,
+    ) -> TestResults: ...
+    def report_start(
+        self, out: Callable[[str], object], test: DocTest, example: Example
+    ) -> None: ...
+    def report_success(
+        self, out: Callable[[str], object], test: DocTest, example: Example, got: str
+    ) -> None: ...
+    def report_failure(
+        self, out: Callable[[str], object], test: DocTest, example: Example, got: str
+    ) -> None: ...
+    def report_unexpected_exception(
+        self,
+        out: Callable[[str], object],
+        test: DocTest,
+        example: Example,
+        exc_info: ExcInfo,
+    ) -> None: ...
+    def end_example(
+        self, test: DocTest, example: Example, outcome: Outcome, got: str
+    ) -> bool: ...
+    def _failure_header(self, test: DocTest, example: Example) -> str: ...
+    def _DocTestRunner__patched_linecache_getlines(
+        self, filename: str, module_globals: Optional[dict[str, Any]] = None
+    ) -> list[str]: ...
+    def reset(
+        self, listeners: Iterable[Listener] = ..., max_output: Optional[int] = ...
+    ) -> None: ...
+
+class OutputLimitExceeded(BaseException):
+    got: str
+    def __init__(self, message: str, got: str) -> None: ...
+
+class CappedOut(StringIO):  # doctest._SpoofOut
+    limit: int
+    size: int
+    expected: Optional[list[str]]
+    blankline: bool
+    lineno: int
+    pending: str
+    def __init__(self, limit: int) -> None: ...
+    def expect(
+        self, example: Example, optionflags: int, checker: OutputChecker
+    ) -> None: ...
+    def write(self, s: str) -> int: ...
+    def matches(self, line: str) -> bool: ...
+    def truncate(self, size: Optional[int] = ...) -> int: ...
+    def abort(self, message: str) -> NoReturn: ...
+
+class RunnerPool:
+    idle: dict[tuple[int, type[OutputChecker]], list[Runner]]
+    def __init__(self) -> None: ...
+    def acquire(
+        self,
+        listeners: Iterable[Listener] = ...,
+        optionflags: int = ...,
+        checker: type[OutputChecker] = ...,
+        max_output: Optional[int] = ...,
+    ) -> Runner: ...
+    def release(self, runner: Runner) -> None: ...
+
+RUNNERS: RunnerPool
+EXACT_CHECKERS: tuple[type[OutputChecker], ...]
+
+def is_blankline_marker(line: str) -> bool: ...
@@ -0,0 +1,153 @@
+from collections import OrderedDict
+import heapq
+import json
+import os
+
+from .cache import write_atomic
+from .parallel import is_loader_error, iter_tests
+
+
+def load_timings(path):
+    """
+    Load durations of test cases saved by `TimingReport`.
+
+    Returns:
+        ``dict``: test id to duration in seconds; empty if file does not exist.
+    """
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return json.load(f)
+
+
+def merge_timings(paths):
+    """
+    Merge timings files written by `TimingReport` on different shards; durations
+    from later files take precedence.
+
+    Returns:
+        ``dict``: test id to duration in seconds.
+    """
+    timings = {}
+    for path in paths:
+        timings.update(load_timings(path))
+    return timings
+
+
+def save_timings(path, timings):
+    """
+    Atomically write ``timings`` to JSON file.
+    """
+    write_atomic(os.path.abspath(path), json.dumps(timings, indent=1, sort_keys=True))
+
+
+def split_shards(tests, count, timings=None):
+    """
+    Deterministically split tests into ``count`` shards of equal expected runtime.
+
+    Tests are split by class, so that every class is run on one shard only. Classes
+    are taken from the longest, and every class goes to the shard with the least
+    total runtime (longest processing time first). Runtime of test is taken from
+    ``timings``; tests without timings are estimated by the number of doctest
+    examples, multiplied by mean duration of example in timed tests.
+
+    Args:
+        tests (`unittest.TestSuite` | iterable of `unittest.TestCase`):
+            tests to split, usually obtained from
+            `~doctestcase.parallel.discover`.
+        count (``int``):
+            number of shards.
+        timings (``dict`` | ``None``, optional):
+            test id to duration in seconds, as returned by :py:func:`load_timings`.
+
+    Returns:
+        ``list`` of ``list`` of `unittest.TestCase`: shards, tests of every shard
+        in original order.
+    """
+    timings = timings or {}
+    groups = OrderedDict()
+    for test in iter_tests(tests):
+        groups.setdefault(test.__class__, []).append(test)
+
+    # duration of one example, to estimate tests without timings
+    timed = [t for group in groups.values() for t in group if t.id() in timings]
+    examples = sum(count_examples(t) for t in timed)
+    per_example = sum(timings[t.id()] for t in timed) / examples if examples else 1.0
+
+    def weight(test):
+        if test.id() in timings:
+            return timings[test.id()]
+        return count_examples(test) * per_example
+
+    order = dict((cls, i) for i, cls in enumerate(groups))
+    jobs = [(sum(weight(t) for t in ts), ts[0].id(), cls) for cls, ts in groups.items()]
+    jobs.sort(key=lambda job: (-job[0], job[1]))
+    heap = [(0.0, i) for i in range(count)]
+    assigned = [[] for _ in range(count)]
+    for load, _, cls in jobs:
+        total, i = heapq.heappop(heap)
+        assigned[i].append(cls)
+        heapq.heappush(heap, (total + load, i))
+    return [
+        [t for cls in sorted(classes, key=order.get) for t in groups[cls]]
+        for classes in assigned
+    ]
+
+
+def parse_shard(value):
+    """
+    Parse shard specification ``'I/N'`` (``I`` is 1-based) to ``(I - 1, N)``.
+
+    Raises:
+        ValueError: if specification is invalid.
+    """
+    index, sep, count = value.partition('/')
+    if not sep or not index.isdigit() or not count.isdigit():
+        raise ValueError('Shard must be I/N, got {!r}'.format(value))
+    index, count = int(index), int(count)
+    if not 1 <= index <= count:
+        raise ValueError('Shard index must be from 1 to {}'.format(count))
+    return index - 1, count
+
+
+class TimingReport(object):
+    """
+    Report that records total duration of doctest examples of every test and
+    merges them into JSON file on :py:meth:`close`, to be used by
+    :py:func:`split_shards` in next runs. Tests that did not run keep previous
+    durations.
+
+    Shards must be split by the same timings on every node, so the file must not
+    be the one the shards were split by: every node writes its own file, and the
+    files are merged with :py:func:`merge_timings` after all shards finish.
+
+    Args:
+        path (``str``):
+            timings file path.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.timings = {}
+
+    def add(self, test, results):
+        self.timings[test.id()] = round(sum(r.duration for r in results), 6)
+
+    def close(self):
+        if not self.timings:
+            return
+        timings = load_timings(self.path)
+        timings.update(self.timings)
+        save_timings(self.path, timings)
+
+
+# helpers
+
+
+def count_examples(test):
+    props = getattr(test, '__doctestcase__', None)
+    if props is None or is_loader_error(test):
+        return 1
+    if test._testMethodName != 'test_docstring':
+        return 1
+    return max(1, sum(len(t.examples) for t in props.doctests))
@@ -0,0 +1,24 @@
+from collections.abc import Iterable
+from typing import Optional, Tuple, Union
+from unittest import TestCase, TestSuite
+
+from .report import ExampleResult
+
+def load_timings(path: str) -> dict[str, float]: ...
+def merge_timings(paths: Iterable[str]) -> dict[str, float]: ...
+def save_timings(path: str, timings: dict[str, float]) -> None: ...
+def split_shards(
+    tests: Union[TestSuite, Iterable[TestCase]],
+    count: int,
+    timings: Optional[dict[str, float]] = ...,
+) -> list[list[TestCase]]: ...
+def parse_shard(value: str) -> Tuple[int, int]: ...
+
+class TimingReport:
+    path: str
+    timings: dict[str, float]
+    def __init__(self, path: str) -> None: ...
+    def add(self, test: TestCase, results: list[ExampleResult]) -> None: ...
+    def close(self) -> None: ...
+
+def count_examples(test: TestCase) -> int: ...
@@ -0,0 +1,177 @@
+import ctypes
+import re
+import signal
+import sys
+import threading
+import traceback
+
+from .listener import Listener
+from .timing import wall_time
+
+
+# example directive, e.g. ``>>> wait()  # doctestcase: timeout=5``
+RX_DIRECTIVE = re.compile(r'#\s*doctestcase:\s*timeout\s*=\s*(\d+(?:\.\d*)?)')
+
+
+class ExampleTimeout(BaseException):
+    """
+    Raised in the thread running doctest example that timed out; not a subclass of
+    `Exception`, so that it is not caught by example code. The message contains
+    stack traces of all threads at the moment of timeout.
+    """
+
+
+class Timeout(Listener):
+    """
+    Listener that interrupts doctest examples running longer than allowed.
+
+    Every example is limited by ``# doctestcase: timeout=SECONDS`` directive in
+    its source, if any, and by the time left from the ``timeout`` of the whole
+    run. When time is out, `ExampleTimeout` is raised in the thread running the
+    example, and the example is reported as failed with stack traces of all
+    threads.
+
+    In the main thread, timeouts are enforced with ``SIGALRM``, interrupting
+    blocking calls; interval timer set by others is suspended meanwhile and
+    restored with remaining time, or, if it expires earlier, is left alone.
+    In other threads, if ``SIGALRM`` is not available, or the interval timer is
+    left alone, the exception is set asynchronously, and is raised when the
+    thread executes Python code again.
+
+    Args:
+        timeout (``float`` | ``None``, optional):
+            time limit for all examples notified, in seconds, counted from
+            creation of the listener; defaults to ``None`` (no limit).
+    """
+
+    def __init__(self, timeout=None):
+        self.timeout = timeout
+        self.deadline = None if timeout is None else wall_time() + timeout
+        self.limit = None  # reported limit of the running example
+        self.timer = None
+        self.handler = None
+        self.outer = None  # interval timer set by others, suspended while armed
+        self.lock = threading.Lock()
+        self.fired = None  # ident of thread, until async exception is raised
+
+    def start_example(self, test, example):
+        seconds = limit = get_example_timeout(example)
+        if self.deadline is not None:
+            left = self.deadline - wall_time()
+            if seconds is None or left < seconds:
+                seconds, limit = left, self.timeout
+        if seconds is not None:
+            self.arm(max(seconds, 0.001), limit)
+
+    def end_example(self, test, example, outcome, got):
+        self.disarm()
+
+    def close(self):
+        """
+        Stop waiting for the running example, if any.
+        """
+        self.disarm()
+
+    def arm(self, seconds, limit):
+        self.disarm()
+        self.limit = limit
+        # interval timer that expires earlier, e.g. of pytest-timeout, is left alone
+        if can_alarm() and not 0 < signal.getitimer(signal.ITIMER_REAL)[0] <= seconds:
+            self.handler = signal.signal(signal.SIGALRM, self.on_alarm)
+            delay, interval = signal.setitimer(signal.ITIMER_REAL, seconds)
+            if delay:
+                self.outer = (wall_time() + delay, interval)
+        else:
+            ident = threading.current_thread().ident
+            self.timer = timer = threading.Timer(seconds, self.on_timer)
+            timer.args = (ident, timer)
+            timer.daemon = True
+            timer.start()
+
+    def disarm(self):
+        if self.handler is not None:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.handler)
+            self.handler = None
+            if self.outer is not None:
+                deadline, interval = self.outer
+                delay = max(deadline - wall_time(), 0.001)
+                signal.setitimer(signal.ITIMER_REAL, delay, interval)
+                self.outer = None
+        with self.lock:
+            if self.timer is not None:
+                self.timer.cancel()
+                self.timer = None
+        if self.fired is not None:
+            # example has just finished, and exception set by timer is not raised
+            # yet; it is raised at the next bytecode instruction of this thread
+            try:
+                while self.fired is not None:
+                    pass
+            except ExampleTimeout:
+                pass
+
+    def on_alarm(self, signum, frame):
+        raise ExampleTimeout(self.get_message(current=frame))
+
+    def on_timer(self, ident, timer):
+        message = self.get_message(exclude=threading.current_thread().ident)
+        listener = self
+
+        # async exception can only be set as a class, so it gets its own class
+        def init(exc, *args):
+            listener.fired = None
+            ExampleTimeout.__init__(exc, message)
+
+        exc = type('ExampleTimeout', (ExampleTimeout,), {'__init__': init})
+        with self.lock:
+            if self.timer is timer:  # not disarmed in the meantime
+                self.fired = ident  # before the exception can be raised
+                if not set_async_exc(ident, exc):
+                    self.fired = None
+
+    def get_message(self, exclude=None, current=None):
+        return 'Example timed out after {:g} seconds\n\n{}'.format(
+            self.limit, format_stacks(exclude, current)
+        )
+
+
+# helpers
+
+
+def get_example_timeout(example):
+    example = getattr(example, 'original', example)
+    match = RX_DIRECTIVE.search(example.source)
+    return None if match is None else float(match.group(1))
+
+
+def has_timeouts(test):
+    return RX_DIRECTIVE.search(test.docstring or '') is not None
+
+
+def can_alarm():
+    main = isinstance(threading.current_thread(), threading._MainThread)
+    return main and hasattr(signal, 'setitimer')
+
+
+def set_async_exc(ident, exc):
+    # returns number of threads affected
+    set_exc = ctypes.pythonapi.PyThreadState_SetAsyncExc
+    return set_exc(ctypes.c_ulong(ident), ctypes.py_object(exc))
+
+
+def format_stacks(exclude=None, current=None):
+    # stack of current thread starts at ``current`` frame, if given
+    frames = sys._current_frames()
+    if current is not None:
+        frames[threading.current_thread().ident] = current
+    chunks = []
+    for thread in threading.enumerate():
+        frame = frames.get(thread.ident)
+        if frame is None or thread.ident == exclude:
+            continue
+        stack = ''.join(traceback.format_stack(frame))
+        chunks.append(
+            'Thread {!r} (most recent call last):\n{}'.format(thread.name, stack)
+        )
+    return '\n'.join(chunks)
@@ -0,0 +1,42 @@
+from doctest import DocTest, Example
+from types import FrameType
+import re
+import threading
+from typing import Any, Optional
+
+from .listener import Listener, Outcome
+
+RX_DIRECTIVE: re.Pattern[str]
+
+class ExampleTimeout(BaseException): ...
+
+class Timeout(Listener):
+    timeout: Optional[float]
+    deadline: Optional[float]
+    limit: Optional[float]
+    timer: Optional[threading.Timer]
+    handler: Any
+    outer: Optional[tuple[float, float]]
+    lock: threading.Lock
+    fired: Optional[int]
+    def __init__(self, timeout: Optional[float] = ...) -> None: ...
+    def start_example(self, test: DocTest, example: Example) -> None: ...
+    def end_example(
+        self, test: DocTest, example: Example, outcome: Outcome, got: str
+    ) -> None: ...
+    def close(self) -> None: ...
+    def arm(self, seconds: float, limit: Optional[float]) -> None: ...
+    def disarm(self) -> None: ...
+    def on_alarm(self, signum: int, frame: Optional[FrameType]) -> None: ...
+    def on_timer(self, ident: int, timer: threading.Timer) -> None: ...
+    def get_message(
+        self, exclude: Optional[int] = ..., current: Optional[FrameType] = ...
+    ) -> str: ...
+
+def get_example_timeout(example: Example) -> Optional[float]: ...
+def has_timeouts(test: DocTest) -> bool: ...
+def can_alarm() -> bool: ...
+def set_async_exc(ident: int, exc: type[BaseException]) -> int: ...
+def format_stacks(
+    exclude: Optional[int] = ..., current: Optional[FrameType] = ...
+) -> str: ...
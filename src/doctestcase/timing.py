@@ -0,0 +1,157 @@
+from collections import namedtuple
+import cProfile
+from operator import attrgetter
+import pstats
+import time
+
+from .listener import Listener
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None
+
+wall_time = getattr(time, 'perf_counter', None) or time.time
+cpu_time = getattr(time, 'process_time', None) or time.clock  # Python 2
+
+
+Timing = namedtuple('Timing', 'name lineno source outcome wall cpu memory peak profile')
+
+
+class Timer(Listener):
+    """
+    Listener that measures every executed doctest example.
+
+    Pass the same instance to several `doctestcase` decorators, or to the base
+    decorated class, to collect timings of all examples in a run.
+
+    Args:
+        memory (``bool``, optional):
+            if ``True``, measure memory allocated by every example with
+            `tracemalloc`; defaults to ``False``. Requires Python 3.4+.
+        profile (``bool``, optional):
+            if ``True``, profile every example with `cProfile`; defaults to
+            ``False``.
+
+    Attributes:
+        records (``list`` of `Timing`):
+            measurements of executed examples, in order of execution. Every
+            record has fields ``name`` (doctest name), ``lineno`` (line number
+            of the example in the docstring, 1-based), ``source``, ``outcome``
+            (``'success'``, ``'failure'`` or ``'error'``), ``wall`` and ``cpu``
+            (seconds), ``memory`` (bytes allocated by the example and not
+            released by its end), ``peak`` (peak bytes allocated by the
+            example), ``profile``
+            (`cProfile.Profile`). Fields of measurements that are turned off
+            are ``None``.
+
+    Example:
+
+        .. code:: python
+
+            timer = Timer(memory=True)
+
+
+            @doctestcase(listeners=[timer])
+            class SlowCase(TestCase):
+                \"\"\"
+                >>> import time
+                ...
+                ... time.sleep(0.1)
+                \"\"\"
+
+
+            def tearDownModule():
+                print(timer.summary(count=5))
+    """
+
+    def __init__(self, memory=False, profile=False):
+        if memory and tracemalloc is None:
+            raise ValueError('Memory measurement requires tracemalloc')
+        self.memory = memory
+        self.profile = profile
+        self.records = []
+        self.current = None
+
+    def start_example(self, test, example):
+        tracing = memory = profile = None
+        if self.memory:
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start()
+            elif hasattr(tracemalloc, 'reset_peak'):  # Python 3.9+
+                tracemalloc.reset_peak()
+            memory = tracemalloc.get_traced_memory()[0]
+        if self.profile:
+            profile = cProfile.Profile()
+            profile.enable()
+        self.current = (example, tracing, memory, profile, wall_time(), cpu_time())
+
+    def end_example(self, test, example, outcome, got):
+        wall, cpu = wall_time(), cpu_time()
+        if self.current is None or self.current[0] is not example:
+            return
+        _, tracing, memory, profile, wall_start, cpu_start = self.current
+        self.current = None
+        if profile is not None:
+            profile.disable()
+        peak = None
+        if memory is not None:
+            current, peak = tracemalloc.get_traced_memory()
+            memory = current - memory
+            if not tracing:
+                tracemalloc.stop()
+            elif not hasattr(tracemalloc, 'reset_peak'):
+                peak = None  # peak of the whole trace, not of the example
+        self.records.append(
+            Timing(
+                test.name,
+                example.lineno + 1,
+                getattr(example, 'original', example).source,
+                outcome,
+                wall - wall_start,
+                cpu - cpu_start,
+                memory,
+                peak,
+                profile,
+            )
+        )
+
+    def slowest(self, count=10, key='wall'):
+        """
+        Return ``count`` records with the largest value of field ``key``.
+        """
+        records = sorted(self.records, key=attrgetter(key), reverse=True)
+        return records[:count]
+
+    def stats(self):
+        """
+        Return `pstats.Stats` aggregated from profiles of all examples, or ``None``
+        if profiling is turned off or no examples were executed.
+        """
+        profiles = [r.profile for r in self.records if r.profile is not None]
+        if not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        return stats
+
+    def summary(self, count=10, key='wall'):
+        """
+        Return text table of ``count`` slowest examples, ordered by field ``key``.
+        """
+        total = sum(r.wall for r in self.records)
+        lines = [
+            '{} slowest of {} examples, {:.3f}s total'.format(
+                min(count, len(self.records)), len(self.records), total
+            )
+        ]
+        for r in self.slowest(count, key):
+            line = '{:>9.3f}s wall {:>9.3f}s cpu'.format(r.wall, r.cpu)
+            if r.memory is not None:
+                line += ' {:>12,} B'.format(r.memory)
+            source = r.source.strip().split('\n')[0]
+            line += '  {}:{} {}'.format(r.name, r.lineno, source[:60])
+            lines.append(line)
+        return '\n'.join(lines)
@@ -0,0 +1,38 @@
+from cProfile import Profile
+from doctest import DocTest, Example
+from pstats import Stats
+from types import ModuleType
+from typing import Callable, NamedTuple, Optional
+
+from .listener import Listener, Outcome
+
+tracemalloc: Optional[ModuleType]
+wall_time: Callable[[], float]
+cpu_time: Callable[[], float]
+
+class Timing(NamedTuple):
+    name: str
+    lineno: int
+    source: str
+    outcome: Outcome
+    wall: float
+    cpu: float
+    memory: Optional[int]
+    peak: Optional[int]
+    profile: Optional[Profile]
+
+class Timer(Listener):
+    memory: bool
+    profile: bool
+    records: list[Timing]
+    current: Optional[
+        tuple[Example, Optional[bool], Optional[int], Optional[Profile], float, float]
+    ]
+    def __init__(self, memory: bool = ..., profile: bool = ...) -> None: ...
+    def start_example(self, test: DocTest, example: Example) -> None: ...
+    def end_example(
+        self, test: DocTest, example: Example, outcome: Outcome, got: str
+    ) -> None: ...
+    def slowest(self, count: int = ..., key: str = ...) -> list[Timing]: ...
+    def stats(self) -> Optional[Stats]: ...
+    def summary(self, count: int = ..., key: str = ...) -> str: ...
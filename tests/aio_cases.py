@@ -0,0 +1,21 @@
+"""Test cases for `doctestcase.aio`, with syntax of Python 3.8+."""
+
+import asyncio
+from unittest import IsolatedAsyncioTestCase
+
+from doctestcase import doctestcase
+
+
+async def get_loop():  # type: () -> asyncio.AbstractEventLoop
+    return asyncio.get_running_loop()
+
+
+@doctestcase(globals={'get_loop': get_loop}, asyncio=True)
+class Isolated(IsolatedAsyncioTestCase):
+    """
+    >>> (await get_loop()) is SETUP_LOOP
+    True
+    """
+
+    async def asyncSetUp(self):  # type: () -> None
+        self.__doctestcase__.globals['SETUP_LOOP'] = await get_loop()  # type: ignore
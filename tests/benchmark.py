@@ -0,0 +1,207 @@
+"""
+Benchmarks of decoration, execution and formatting hot paths.
+
+Usage::
+
+    $ python -m tests.benchmark
+    $ python -m tests.benchmark --json .tmp/bench-main.json
+    $ python -m tests.benchmark --compare .tmp/bench-main.json
+
+Every benchmark is run repeatedly for at least ``--min-time`` seconds, the best
+throughput of ``--repeat`` rounds is reported. Peak memory of a single call is
+measured with `tracemalloc` on Python 3.4+.
+"""
+
+import argparse
+from doctest import ELLIPSIS, OutputChecker
+from functools import partial
+import gc
+import json
+import subprocess
+import sys
+import timeit
+from unittest import TestCase, TestResult
+
+from doctestcase import doctestcase, to_markdown, to_rest
+from doctestcase.checker import FastOutputChecker
+from doctestcase.execute import _examples
+from doctestcase.format import PARSED, parse_body_bounds, parse_title_body
+
+try:
+    import tracemalloc
+except ImportError:  # Python 2
+    tracemalloc = None  # type: ignore[assignment]
+
+try:
+    from typing import Any, Callable, Dict, List, Optional, Tuple  # noqa: F401  # used for typing
+except ImportError:  # Python 2
+    pass
+
+
+# corpora
+
+
+def make_doc(sections):  # type: (int) -> str
+    chunks = ['\n    Title of the test case\n\n']
+    for i in range(sections):
+        chunks.append(
+            '    Paragraph {i} describing the example.\n'
+            '    Second line of the paragraph.\n'
+            '\n'
+            '    >>> X{m} = {i}\n'
+            '    >>> X{m} + 1\n'
+            '    {j}\n'
+            '\n'
+            '\n'
+            '    >>> [X{m}] * 2\n'
+            '    [{i}, {i}]\n'
+            '\n'.format(i=i, j=i + 1, m=i % 10)
+        )
+    return ''.join(chunks)
+
+
+DOCS = {
+    'small': make_doc(1),
+    'medium': make_doc(20),
+    'huge': make_doc(1000),
+}
+TABLE = ''.join('| {:5} | {} |\n'.format(i, 'x' * 40) for i in range(3000))
+TABLE_WANT = TABLE.splitlines(True)[0] + '...\n'
+IMPORT_PACKAGE = [sys.executable, '-c', 'import doctestcase']
+WIDE_GLOBALS = dict(('G{}'.format(i), i) for i in range(10000))
+
+
+def make_case(doc, globals=None, layered=None):
+    # type: (str, Optional[Dict[str, Any]], Optional[bool]) -> Any
+    cls = type('Case', (TestCase,), {'__doc__': doc})
+    return doctestcase(globals=globals or {}, layered=layered)(cls)
+
+
+def make_chain(depth):  # type: (int) -> Any
+    cls = make_case(DOCS['small'])
+    for i in range(depth):
+        deco = doctestcase(globals={'L{}'.format(i): i})
+        cls = deco(type('Case{}'.format(i), (cls,), {'__doc__': DOCS['small']}))
+    return cls
+
+
+def run_case(cls):  # type: (type) -> None
+    result = TestResult()
+    cls('test_docstring').run(result)
+    assert result.wasSuccessful()
+
+
+def uncached(func):  # type: (Callable[[], object]) -> Callable[[], object]
+    def wrapper():  # type: () -> object
+        PARSED.clear()
+        _examples.clear()
+        return func()
+
+    return wrapper
+
+
+def get_benchmarks():  # type: () -> List[Tuple[str, Callable[[], object]]]
+    body = parse_title_body(DOCS['huge'], parse_title=True)[1]
+    stdlib_checker = OutputChecker().check_output
+    fast_checker = FastOutputChecker().check_output
+    cases = dict((k, make_case(v)) for k, v in DOCS.items())
+    wide = make_case(DOCS['small'], globals=WIDE_GLOBALS)
+    wide_layered = make_case(DOCS['small'], globals=WIDE_GLOBALS, layered=True)
+    chain = make_chain(50)
+    benchmarks = []  # type: List[Tuple[str, Callable[[], object]]]
+    benchmarks += [
+        ('decorate.small', lambda: make_case(DOCS['small'])),
+        ('decorate.huge', lambda: make_case(DOCS['huge'])),
+        ('decorate.wide_globals', lambda: make_case(DOCS['small'], WIDE_GLOBALS)),
+        ('decorate.chain_50', lambda: make_chain(50)),
+        ('run.small', lambda: run_case(cases['small'])),
+        ('run.medium', lambda: run_case(cases['medium'])),
+        ('run.wide_globals', lambda: run_case(wide)),
+        ('run.wide_globals_layered', lambda: run_case(wide_layered)),
+        ('run.chain_50', lambda: run_case(chain)),
+        # first run of a new class, e.g. parametrized from a template docstring
+        ('run.first.medium', lambda: run_case(make_case(DOCS['medium']))),
+        (
+            'run.first.medium.uncached',
+            uncached(lambda: run_case(make_case(DOCS['medium']))),
+        ),
+        ('parse.title_body.huge', lambda: parse_title_body(DOCS['huge'], True)),
+        ('parse.body_bounds.huge', lambda: parse_body_bounds(body)),
+        ('check.table', partial(stdlib_checker, TABLE_WANT, TABLE, ELLIPSIS)),
+        ('check.table.fast', partial(fast_checker, TABLE_WANT, TABLE, ELLIPSIS)),
+        ('import.python', partial(subprocess.check_call, [sys.executable, '-c', ''])),
+        ('import.package', partial(subprocess.check_call, IMPORT_PACKAGE)),
+    ]
+    for name, doc in sorted(DOCS.items()):
+        benchmarks.extend(
+            [
+                ('markdown.' + name, uncached(partial(to_markdown, doc))),
+                ('markdown.cached.' + name, partial(to_markdown, doc)),
+                ('rest.' + name, uncached(partial(to_rest, doc))),
+            ]
+        )
+    return benchmarks
+
+
+# measurement
+
+
+def measure(func, repeat, min_time):  # type: (Callable[[], object], int, float) -> Dict[str, Any]
+    timer = timeit.Timer(func)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    best = min(timer.repeat(repeat=repeat, number=number)) / number
+    stats = {'ops': 1 / best if best else float('inf'), 'peak': None}
+    if tracemalloc is not None:
+        gc.collect()
+        tracemalloc.start()
+        func()
+        stats['peak'] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return stats
+
+
+def report(name, stats, base):  # type: (str, Dict[str, Any], Optional[Dict[str, Any]]) -> str
+    line = '{:<32} {:>14,.1f} ops/s'.format(name, stats['ops'])
+    line += '  {:>12} peak'.format(
+        '-' if stats['peak'] is None else '{:,} B'.format(stats['peak'])
+    )
+    if base is not None:
+        line += '  {:>+7.1%} ops'.format(stats['ops'] / base['ops'] - 1)
+        if stats['peak'] and base.get('peak'):
+            line += '  {:>+7.1%} peak'.format(stats['peak'] / base['peak'] - 1)
+    return line
+
+
+def main(argv=None):  # type: (Optional[List[str]]) -> int
+    parser = argparse.ArgumentParser(prog='python -m tests.benchmark')
+    parser.add_argument('-k', dest='select', default='', help='run matching only')
+    parser.add_argument('--repeat', type=int, default=5, help='number of rounds')
+    parser.add_argument('--min-time', type=float, default=0.2, help='round time')
+    parser.add_argument('--json', help='save results to JSON file')
+    parser.add_argument('--compare', help='compare with results from JSON file')
+    args = parser.parse_args(argv)
+
+    base = {}
+    if args.compare:
+        with open(args.compare) as f:
+            base = json.load(f)['results']
+
+    results = {}
+    for name, func in get_benchmarks():
+        if args.select not in name:
+            continue
+        results[name] = measure(func, args.repeat, args.min_time)
+        print(report(name, results[name], base.get(name)))
+        sys.stdout.flush()
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            meta = {'python': sys.version.split()[0]}
+            json.dump({'meta': meta, 'results': results}, f, indent=2, sort_keys=True)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
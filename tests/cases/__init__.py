@@ -0,0 +1 @@
+# this file is only needed for Python 2
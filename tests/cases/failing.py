@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from doctestcase import doctestcase
+
+
+@doctestcase()
+class First(TestCase):
+    """
+    >>> 1
+    0
+    """
+
+
+@doctestcase()
+class Second(TestCase):
+    """
+    >>> 2
+    0
+    """
+
+
+@doctestcase()
+class Third(TestCase):
+    """
+    >>> 3
+    0
+    """
@@ -0,0 +1,30 @@
+from unittest import TestCase
+
+from doctestcase import doctestcase
+
+
+@doctestcase(globals={'X': 1})
+class Passing(TestCase):
+    """
+    >>> X + VALUE
+    3
+    """
+
+    def setUp(self):
+        self.__doctestcase__.globals['VALUE'] = 2  # type: ignore
+
+    def test_method(self):
+        self.assertTrue(True)
+
+
+@doctestcase()
+class Failing(TestCase):
+    """
+    >>> True
+    False
+    """
+
+
+class Undecorated(TestCase):
+    def test_method(self):
+        self.assertTrue(True)
@@ -1,6 +1,9 @@
 from docsub import click
-from doctestcase import to_markdown
-from importloc import Location
+from doctestcase.render import Renderer
+
+
+# index is updated on demand for every path location, without importing test cases
+renderer = Renderer([])
 
 
 @click.group()
@@ -11,5 +14,6 @@ def x() -> None:
 @x.command()
 @click.argument('case')
 def case(case: str) -> None:
-    text = to_markdown(Location(case).load(), title_depth=2)
+    (entry,) = renderer.find(case)
+    text = renderer.render(entry.doc, 'markdown', title_depth=2)
     click.echo(text, nl=False)
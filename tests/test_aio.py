@@ -0,0 +1,113 @@
+import unittest
+from unittest import TestCase, skipIf, skipUnless
+
+from doctestcase import doctestcase
+from doctestcase.aio import TOP_LEVEL_AWAIT
+
+from tests.util import assertFail, assertPass
+
+if TOP_LEVEL_AWAIT:
+    import asyncio
+
+    from tests.aio_cases import Isolated, get_loop
+
+
+@skipUnless(TOP_LEVEL_AWAIT, 'requires Python 3.8+')
+class TestAsyncio(TestCase):
+    def test_top_level_await(self):
+        @doctestcase(globals={'asyncio': asyncio}, asyncio=True)
+        class Decorated(TestCase):
+            """
+            >>> await asyncio.sleep(0, result=5)
+            5
+            >>> x = await asyncio.sleep(0, result=1)
+            >>> x + 1
+            2
+            >>> async def double(v):
+            ...     return v * 2
+            >>> [await double(i) for i in range(3)]
+            [0, 2, 4]
+            """
+
+        assertPass(self, Decorated)
+
+    def test_shared_loop(self):
+        loops = []  # type: list[asyncio.AbstractEventLoop]
+
+        @doctestcase(globals={'get_loop': get_loop, 'loops': loops}, asyncio=True)
+        class Decorated(TestCase):
+            """
+            >>> loops.append(await get_loop())
+            >>> loops.append(await get_loop())
+            """
+
+        assertPass(self, Decorated)
+        self.assertIs(loops[0], loops[1])
+        self.assertTrue(loops[0].is_closed())
+        assertPass(self, Decorated)
+        self.assertIsNot(loops[0], loops[2])
+
+    def test_failure_shows_source(self):
+        @doctestcase(globals={'asyncio': asyncio}, asyncio=True)
+        class Decorated(TestCase):
+            """
+            >>> await asyncio.sleep(0, result=5)
+            6
+            """
+
+        result = unittest.TestResult()
+        Decorated('test_docstring').run(result)
+        text = result.failures[0][1]
+        self.assertIn('    await asyncio.sleep(0, result=5)\nExpected:', text)
+
+    def test_traceback(self):
+        doc = '>>> async def f():\n...     return 1 / 0\n>>> await f()\n'
+        deco = doctestcase(asyncio=True)
+        First = deco(type('First', (TestCase,), {'__doc__': doc}))
+        Second = deco(type('Second', (TestCase,), {'__doc__': doc}))
+
+        assertFail(self, First)  # type: ignore
+        result = unittest.TestResult()
+        Second('test_docstring').run(result)  # type: ignore
+        text = result.failures[0][1]
+        self.assertIn('File "<doctest Second[1]>", line 1, in <module>\n', text)
+        self.assertIn('        await f()\n      File "<doctest Second[0]>"', text)
+        self.assertIn('return 1 / 0', text)
+        self.assertNotIn('First', text)
+        self.assertNotIn('aio.py', text)
+        self.assertNotIn('run_until_complete', text)
+
+    def test_exception(self):
+        @doctestcase(asyncio=True)
+        class Decorated(TestCase):
+            """
+            >>> async def fail():
+            ...     raise ValueError('message')
+            >>> await fail()
+            Traceback (most recent call last):
+            ValueError: message
+            """
+
+        assertPass(self, Decorated)
+
+    def test_off(self):
+        @doctestcase(globals={'asyncio': asyncio})
+        class Decorated(TestCase):
+            """
+            >>> await asyncio.sleep(0)
+            """
+
+        assertFail(self, Decorated)
+
+    def test_isolated_asyncio_test_case(self):
+        assertPass(self, Isolated)
+
+
+@skipIf(TOP_LEVEL_AWAIT, 'requires Python 3.7 and earlier')
+class TestUnsupported(TestCase):
+    def test_error(self):
+        with self.assertRaises(ValueError):
+
+            @doctestcase(asyncio=True)
+            class Decorated(TestCase):
+                """>>> None"""
@@ -0,0 +1,201 @@
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase
+
+from doctestcase import cache, doctestcase
+from doctestcase.__main__ import main
+
+from tests.util import run
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.environ = os.environ.get(cache.ENV_VAR)
+        os.environ[cache.ENV_VAR] = os.path.join(self.tmp, 'cache')
+
+    def tearDown(self):
+        if self.environ is None:
+            os.environ.pop(cache.ENV_VAR, None)
+        else:
+            os.environ[cache.ENV_VAR] = self.environ
+        shutil.rmtree(self.tmp)
+
+    def test_skip_unchanged(self):
+        @doctestcase(globals={'X': 1})
+        class Decorated(TestCase):
+            """
+            >>> X
+            1
+            """
+
+        self.assertEqual(0, len(run(Decorated).skipped))
+        result = run(Decorated)
+        self.assertTrue(result.wasSuccessful())
+        self.assertEqual(1, len(result.skipped))
+        self.assertIn('unchanged', result.skipped[0][1])
+
+    def test_failed_not_cached(self):
+        @doctestcase()
+        class Decorated(TestCase):
+            """
+            >>> 1
+            2
+            """
+
+        self.assertFalse(run(Decorated).wasSuccessful())
+        self.assertFalse(run(Decorated).wasSuccessful())
+
+    def test_changed_parameters(self):
+        @doctestcase(globals={'X': 1})
+        class Decorated(TestCase):
+            """
+            >>> X
+            1
+            """
+
+        run(Decorated)
+        Decorated.__doctestcase__.globals['Y'] = 2  # type: ignore
+        self.assertEqual(0, len(run(Decorated).skipped))
+        self.assertEqual(1, len(run(Decorated).skipped))
+
+    def test_changed_kwargs(self):
+        @doctestcase(paths=['a'])
+        class Decorated(TestCase):
+            """
+            >>> None
+            """
+
+        run(Decorated)
+        self.assertEqual(1, len(run(Decorated).skipped))
+        Decorated.__doctestcase__.kwargs['paths'] = ['b']  # type: ignore
+        self.assertEqual(0, len(run(Decorated).skipped))
+
+    def test_fingerprint_kwargs(self):
+        @doctestcase(paths=['a'], obj=object(), mixed={1: 1, 'a': 2})
+        class Decorated(TestCase):
+            pass
+
+        before = cache.fingerprint(Decorated('test_docstring'))
+        Decorated.__doctestcase__.kwargs['obj'] = object()  # type: ignore
+        self.assertEqual(before, cache.fingerprint(Decorated('test_docstring')))
+
+    def test_changed_dependency(self):
+        path = os.path.join(self.tmp, 'cachedep.py')
+        with open(path, 'w') as f:
+            f.write('VALUE = 1\n')
+        sys.path.insert(0, self.tmp)
+        try:
+
+            @doctestcase()
+            class Decorated(TestCase):
+                """
+                >>> from cachedep import VALUE
+                >>> VALUE > 0
+                True
+                """
+
+            run(Decorated)
+            self.assertEqual(1, len(run(Decorated).skipped))
+            with open(path, 'w') as f:
+                f.write('VALUE = 100\n')
+            self.assertEqual(0, len(run(Decorated).skipped))
+        finally:
+            sys.path.remove(self.tmp)
+            sys.modules.pop('cachedep', None)
+
+    def test_shared_dependency(self):
+        path = os.path.join(self.tmp, 'shareddep.py')
+        with open(path, 'w') as f:
+            f.write('VALUE = 1\n')
+        sys.path.insert(0, self.tmp)
+        try:
+            doc = '>>> import shareddep\n>>> shareddep.VALUE\n1\n'
+            deco = doctestcase()
+            First = deco(type('First', (TestCase,), {'__doc__': doc}))
+            Second = deco(type('Second', (TestCase,), {'__doc__': doc}))
+
+            # the second case runs when the module is already imported
+            self.assertTrue(run(First).wasSuccessful())
+            self.assertTrue(run(Second).wasSuccessful())
+            with open(path, 'w') as f:
+                f.write('VALUE = 100\n')
+            sys.modules.pop('shareddep')
+            self.assertFalse(run(First).wasSuccessful())
+            self.assertFalse(run(Second).wasSuccessful())
+        finally:
+            sys.path.remove(self.tmp)
+            sys.modules.pop('shareddep', None)
+
+    def test_indirect_dependency(self):
+        pkg = os.path.join(self.tmp, 'cachepkg')
+        os.mkdir(pkg)
+        files = {
+            '__init__.py': '',
+            'api.py': 'from cachepkg._impl import double\n\n'
+            'def compute(x):\n    return double(x)\n',
+            '_impl.py': 'def double(x):\n    return x * 2\n',
+        }
+        for name, text in files.items():
+            with open(os.path.join(pkg, name), 'w') as f:
+                f.write(text)
+        sys.path.insert(0, self.tmp)
+        try:
+            from cachepkg import api  # type: ignore
+
+            @doctestcase(globals={'api': api})
+            class Decorated(TestCase):
+                """
+                >>> api.compute(2)
+                4
+                """
+
+            run(Decorated)
+            self.assertEqual(1, len(run(Decorated).skipped))
+            with open(os.path.join(pkg, '_impl.py'), 'w') as f:
+                f.write('def double(x):\n    return x * 3\n')
+            self.assertEqual(0, len(run(Decorated).skipped))
+        finally:
+            sys.path.remove(self.tmp)
+            for name in ('cachepkg', 'cachepkg.api', 'cachepkg._impl'):
+                sys.modules.pop(name, None)
+
+    def test_stdlib_not_recorded(self):
+        paths = cache.get_loaded_paths()
+        self.assertNotIn(os.path.abspath(os.__file__.replace('.pyc', '.py')), paths)
+        self.assertIn(os.path.abspath(cache.__file__.replace('.pyc', '.py')), paths)
+
+    def test_clear(self):
+        @doctestcase()
+        class Decorated(TestCase):
+            """
+            >>> None
+            """
+
+        run(Decorated)
+        cache.get_cache().clear()  # type: ignore
+        self.assertEqual(0, len(run(Decorated).skipped))
+
+    def test_main(self):
+        del os.environ[cache.ENV_VAR]
+        stderr, sys.stderr = sys.stderr, open(os.devnull, 'w')
+        try:
+            argv = ['run', '-q', '--cache-dir', self.tmp, '--cache-clear']
+            self.assertEqual(0, main(argv + ['tests.cases.parallel.Passing']))
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
+        self.assertEqual(self.tmp, os.environ[cache.ENV_VAR])
+        self.assertEqual(1, len(os.listdir(self.tmp)))
+
+
+class TestDisabled(TestCase):
+    def test_no_cache(self):
+        environ = os.environ.pop(cache.ENV_VAR, None)
+        try:
+            self.assertIsNone(cache.get_cache())
+        finally:
+            if environ is not None:
+                os.environ[cache.ENV_VAR] = environ
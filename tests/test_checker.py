@@ -0,0 +1,83 @@
+from doctest import (
+    DONT_ACCEPT_BLANKLINE,
+    DONT_ACCEPT_TRUE_FOR_1,
+    ELLIPSIS,
+    NORMALIZE_WHITESPACE,
+    OutputChecker,
+)
+import random
+from unittest import TestCase
+
+from doctestcase import doctestcase
+from doctestcase.checker import MATCHERS, FastOutputChecker
+
+from tests.util import assertFail, assertPass
+
+
+FLAGS = (DONT_ACCEPT_BLANKLINE, DONT_ACCEPT_TRUE_FOR_1, ELLIPSIS, NORMALIZE_WHITESPACE)
+TOKENS = ('...', '<BLANKLINE>', 'a', 'b', 'ab', ' ', '  ', '\t', '\n', '\n', '.')
+
+
+class Differential(TestCase):
+    def assertSame(self, want, got):  # type: (str, str) -> None
+        for mask in range(1 << len(FLAGS)):
+            flags = 0
+            for i, flag in enumerate(FLAGS):
+                if mask & (1 << i):
+                    flags |= flag
+            self.assertEqual(
+                OutputChecker().check_output(want, got, flags),
+                FastOutputChecker().check_output(want, got, flags),
+                (want, got, flags),
+            )
+
+    def test_random(self):
+        rnd = random.Random(0)  # noqa: S311
+        for _ in range(2000):
+            want = ''.join(rnd.choice(TOKENS) for _ in range(rnd.randint(0, 12)))
+            got = ''.join(rnd.choice(TOKENS[2:]) for _ in range(rnd.randint(0, 12)))
+            if rnd.random() < 0.3:  # make it likely to match
+                got = want.replace('...', rnd.choice(('', 'a', ' b\n')))
+            self.assertSame(want + '\n', got + '\n')
+
+    def test_edge_cases(self):
+        for want, got in (
+            ('', ''),
+            ('1\n', 'True\n'),
+            ('0\n', 'False\n'),
+            ('...\n', '\n'),
+            ('a...a\n', 'a\n'),
+            ('a...b...c\n', 'abc\n'),
+            ('a...b...c\n', 'acb\n'),
+            ('<BLANKLINE>\n', '\n'),
+            ('<BLANKLINE>  \n', '   \n'),
+            ('a  b\n', 'a\nb\n'),
+            ("'yzyz...'\n", "'" + 'yz' * 100 + "'\n"),
+        ):
+            self.assertSame(want, got)
+
+    def test_cached(self):
+        checker = FastOutputChecker()
+        checker.check_output('a...\n', 'ab\n', ELLIPSIS)
+        self.assertIsNotNone(MATCHERS.get(('a...\n', 0)))
+
+
+class TestDecorator(TestCase):
+    def test_checker(self):
+        @doctestcase(globals={'X': 'yz'}, options=ELLIPSIS, checker=FastOutputChecker)
+        class Passing(TestCase):
+            """
+            >>> X * 100
+            'yzyz...'
+            """
+
+        @doctestcase(checker=FastOutputChecker)
+        class Failing(TestCase):
+            """
+            >>> "yz"
+            'y...'
+            """
+
+        assertPass(self, Passing)
+        assertFail(self, Failing)
+        self.assertIs(FastOutputChecker, Passing.__doctestcase__.checker)  # type: ignore
@@ -0,0 +1,131 @@
+import sys
+from unittest import TestCase, skipIf
+
+from doctestcase import doctestcase, execute
+
+from tests.util import assertPass
+
+
+class TestParsing(TestCase):
+    def test_parsed_on_first_use(self):
+        @doctestcase()
+        class Decorated(TestCase):
+            """
+            Title
+
+            >>> True
+            True
+
+            >>> None
+            """
+
+        self.assertIsNone(Decorated.__doctestcase__._doctests)  # type: ignore
+        doctests = Decorated.__doctestcase__.doctests  # type: ignore
+        self.assertEqual(1, len(doctests))
+        self.assertEqual(2, len(doctests[0].examples))
+        self.assertEqual('Decorated', doctests[0].name)
+
+    def test_no_examples(self):
+        @doctestcase()
+        class Decorated(TestCase):
+            """Title"""
+
+        self.assertEqual([], Decorated.__doctestcase__.doctests)  # type: ignore
+
+    def test_not_parsed_on_next_run(self):
+        @doctestcase()
+        class Decorated(TestCase):
+            """>>> True\nTrue\n"""
+
+        assertPass(self, Decorated)
+        parser = execute.DocTestParser  # type: ignore
+        execute.DocTestParser = None  # type: ignore
+        try:
+            assertPass(self, Decorated)
+        finally:
+            execute.DocTestParser = parser  # type: ignore
+
+    def test_examples_shared(self):
+        doc = """>>> True\nTrue\n"""
+        deco = doctestcase()
+        Case1 = deco(type('Case1', (TestCase,), {'__doc__': doc}))
+        Case2 = deco(type('Case2', (TestCase,), {'__doc__': doc}))
+
+        test1 = Case1.__doctestcase__.doctests[0]  # type: ignore
+        test2 = Case2.__doctestcase__.doctests[0]  # type: ignore
+        self.assertIs(test1.examples, test2.examples)
+        self.assertEqual(('Case1', 'Case2'), (test1.name, test2.name))
+        assertPass(self, Case1)  # type: ignore
+        assertPass(self, Case2)  # type: ignore
+
+    def test_globals_isolated_between_runs(self):
+        @doctestcase(globals={'X': 1})
+        class Decorated(TestCase):
+            """
+            >>> 'Y' in globals()
+            False
+            >>> X, Y = 2, 2
+            """
+
+        assertPass(self, Decorated)
+        assertPass(self, Decorated)
+        self.assertEqual({'X': 1}, Decorated.__doctestcase__.globals)  # type: ignore
+
+    def test_main_module_name(self):
+        doc = ">>> __name__\n'__main__'\n>>> class C: pass\n>>> C.__module__\n'__main__'\n"
+        for layered in (False, True):
+            deco = doctestcase(layered=layered)
+            Decorated = deco(type('Decorated', (TestCase,), {'__doc__': doc}))
+            assertPass(self, Decorated)  # type: ignore
+        Named = doctestcase(globals={'__name__': 'mod'})(
+            type('Named', (TestCase,), {'__doc__': ">>> __name__\n'mod'\n"})
+        )
+        assertPass(self, Named)  # type: ignore
+
+
+class TestLayeredGlobals(TestCase):
+    def test_layered(self):
+        @doctestcase(globals={'X': [1]}, layered=True)
+        class Decorated(TestCase):
+            """
+            >>> X
+            [1]
+            >>> def f():
+            ...     return X
+            >>> f()
+            [1]
+            >>> X = 2
+            >>> f()
+            2
+            """
+
+        assertPass(self, Decorated)
+        assertPass(self, Decorated)
+        self.assertEqual({'X': [1]}, Decorated.__doctestcase__.globals)  # type: ignore
+
+    @skipIf(sys.version_info < (3,), 'Python 3 only')
+    def test_not_copied(self):
+        @doctestcase(globals={'X': 1}, layered=True)
+        class Decorated(TestCase):
+            """
+            >>> 'X' in globals()
+            False
+            """
+
+        assertPass(self, Decorated)
+
+    def test_inherited(self):
+        @doctestcase(layered=True)
+        class Base(TestCase):
+            pass
+
+        @doctestcase()
+        class Child1(Base):
+            pass
+
+        @doctestcase(layered=False)
+        class Child2(Base):
+            pass
+
+        self.assertTrue(Child1.__doctestcase__.layered)  # type: ignore
+        self.assertFalse(Child2.__doctestcase__.layered)  # type: ignore
@@ -1,6 +1,19 @@
-from unittest import TestCase
+import sys
+import tempfile
+from unittest import TestCase, skipIf
 
-from doctestcase import get_body, get_title, to_markdown, to_rest
+from doctestcase import (
+    get_body,
+    get_title,
+    iter_cases,
+    iter_markdown,
+    iter_rest,
+    to_markdown,
+    to_rest,
+)
+from doctestcase.format import LRUCache, parse_doc
+
+from tests.cases import failing, parallel
 
 
 class Comoponents(TestCase):
@@ -175,3 +188,63 @@ class Formatting(TestCase):
             'Title\n-----\n\nText1\n\n>>> 0 / 0\n' + exc + '\nText2\n',
             to_rest(t),
         )
+
+
+class Batch(TestCase):
+    items = ('\nA\n\nText.\n', None, '', 'B', '>>> None')
+
+    def test_iter_markdown(self):
+        self.assertEqual(
+            '## A\n\nText.\n\n## B\n\n```pycon\n>>> None\n```\n',
+            ''.join(iter_markdown(self.items)),
+        )
+
+    def test_iter_rest(self):
+        self.assertEqual(
+            'A\n---\n\nText.\n\nB\n---\n\n>>> None\n',
+            ''.join(iter_rest(self.items)),
+        )
+
+    def test_write(self):
+        with tempfile.TemporaryFile('w+') as f:
+            f.writelines(iter_markdown(self.items, include_title=False))
+            f.seek(0)
+            self.assertEqual('Text.\n\n```pycon\n>>> None\n```\n', f.read())
+
+    @skipIf(sys.version_info < (3, 6), 'sorted by name')
+    def test_iter_cases(self):
+        cases = [parallel.Passing, parallel.Failing]
+        self.assertEqual(cases, list(iter_cases(parallel)))
+        self.assertEqual(cases, list(iter_cases('tests.cases.parallel')))
+        package = [failing.First, failing.Second, failing.Third] + cases
+        self.assertEqual(package, list(iter_cases('tests.cases')))
+
+    @skipIf(sys.version_info < (3, 6), 'sorted by name')
+    def test_modules(self):
+        self.assertEqual(
+            '```pycon\n>>> X + VALUE\n3\n```\n\n```pycon\n>>> True\nFalse\n```\n',
+            ''.join(iter_markdown([parallel])),
+        )
+
+
+class Caching(TestCase):
+    def test_parsed_once(self):
+        doc = '\nTitle\n\n>>> None\n'
+        parsed = parse_doc(doc, dedent=True, parse_title=True)
+        self.assertIs(parsed, parse_doc(doc, dedent=True, parse_title=True))
+        self.assertIsNot(parsed, parse_doc(doc, dedent=True, parse_title=False))
+        self.assertEqual('Title', parsed.title)
+        self.assertEqual('>>> None\n', parsed.body)
+        self.assertIs(parsed.bounds, parsed.bounds)
+        self.assertEqual([(0, 9, True)], list(parsed.spans()))
+
+    def test_lru(self):
+        cache = LRUCache(maxsize=2)  # type: LRUCache[int]
+        cache.set('a', 1)
+        cache.set('b', 2)
+        self.assertEqual(1, cache.get('a'))
+        cache.set('c', 3)
+        self.assertEqual(2, len(cache))
+        self.assertEqual((1, None, 3), (cache.get('a'), cache.get('b'), cache.get('c')))
+        cache.clear()
+        self.assertEqual(0, len(cache))
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+from unittest import TestCase
+
+import doctestcase
+
+
+HEAVY = ('doctest', 'inspect', 'pdb', 'difflib', 'unittest', 'asyncio')
+
+SCRIPT = """
+import sys
+from unittest import TestCase
+
+before = set(sys.modules)
+from doctestcase import doctestcase, to_markdown
+
+@doctestcase()
+class Case(TestCase):
+    '''
+    Title
+
+    >>> 1
+    1
+    '''
+
+to_markdown(Case)
+print(' '.join(m for m in {heavy!r} if m in set(sys.modules) - before))
+"""
+
+
+def imported(script):  # type: (str) -> list[str]
+    env = dict(os.environ)
+    path = os.path.dirname(os.path.dirname(doctestcase.__file__))
+    env['PYTHONPATH'] = os.pathsep.join([path, env.get('PYTHONPATH', '')])
+    output = subprocess.check_output([sys.executable, '-c', script], env=env)
+    return output.decode().split()
+
+
+class TestImport(TestCase):
+    def test_package(self):
+        # site may import some of them on its own, e.g. inspect on Python 3.13
+        script = (
+            'import sys\n'
+            'before = set(sys.modules)\n'
+            'import doctestcase\n'
+            'print(" ".join(sorted(set(sys.modules) - before)))'
+        )
+        modules = imported(script)
+        self.assertEqual([], [m for m in HEAVY if m in modules])
+
+    def test_index(self):
+        script = (
+            'import sys\n'
+            'before = set(sys.modules)\n'
+            'import doctestcase.index\n'
+            'print(" ".join(sorted(set(sys.modules) - before)))'
+        )
+        modules = imported(script)
+        self.assertEqual([], [m for m in HEAVY if m in modules])
+
+    def test_decorate_and_render(self):
+        self.assertEqual([], imported(SCRIPT.format(heavy=HEAVY)))
@@ -0,0 +1,96 @@
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase
+
+from doctestcase import get_body, get_title
+from doctestcase.__main__ import main
+from doctestcase.index import Index, build_index
+
+from tests.usage.simple import SimpleCase
+
+
+SOURCE = '''
+from doctestcase import doctestcase as dc
+
+deco = dc(globals={'X': 1})
+
+
+@dc()
+class First(object):
+    """
+    Title
+
+    >>> X
+    1
+    """
+
+    @deco
+    class Nested(object):
+        """>>> None"""
+
+
+@First.__doctestcase__
+class Second(object):
+    pass
+
+
+class Plain(object):
+    """>>> None"""
+'''
+
+
+class TestIndex(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'indexed.py')
+        with open(self.path, 'w') as f:
+            f.write(SOURCE)
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_scan(self):
+        index = build_index([self.tmp])
+        self.assertNotIn('indexed', sys.modules)
+        self.assertEqual(
+            ['indexed.First', 'indexed.First.Nested', 'indexed.Second'],
+            [e.name for e in index],
+        )
+        first = index['indexed.First']
+        self.assertEqual((7, 1), (first.lineno, first.examples))
+        if sys.version_info >= (3, 8):
+            self.assertEqual(18, first.end_lineno)
+        self.assertEqual('Title', first.title)
+        self.assertEqual('>>> X\n1\n', first.body)
+        self.assertEqual('', index['indexed.Second'].doc)
+        self.assertEqual(['indexed.First.Nested'], [e.name for e in index.find('*.N*')])
+
+    def test_package(self):
+        index = build_index(['tests/usage'])
+        entry = index['tests.usage.simple.SimpleCase']
+        self.assertEqual(get_title(SimpleCase), entry.title)
+        self.assertEqual(get_body(SimpleCase), entry.body)
+        self.assertIn('tests.usage.reuse.AnotherCase', index)
+
+    def test_save_load_update(self):
+        path = os.path.join(self.tmp, 'index.json')
+        build_index([self.path]).save(path)
+        index = Index.load(path)
+        self.assertEqual(3, len(index))
+        self.assertEqual(1, index['indexed.First'].examples)
+
+        with open(self.path, 'w') as f:
+            f.write(SOURCE.replace('class Second', 'class Third') + '\n')
+        index.update([self.tmp])
+        self.assertIn('indexed.Third', index)
+        self.assertNotIn('indexed.Second', index)
+
+        os.remove(self.path)
+        self.assertEqual(0, len(index.update([])))
+
+    def test_main(self):
+        output = os.path.join(self.tmp, 'index.json')
+        self.assertEqual(0, main(['index', self.tmp, '-o', output]))
+        self.assertEqual(3, len(Index.load(output)))
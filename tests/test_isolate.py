@@ -0,0 +1,87 @@
+import os
+import sys
+from unittest import TestCase, skipUnless
+
+from doctestcase import doctestcase
+from doctestcase.fork import CAN_FORK, ChildError, fork_call
+
+from tests.util import run
+
+
+class State(object):
+    value = 'initial'
+
+
+@skipUnless(CAN_FORK, 'requires os.fork')
+class TestIsolate(TestCase):
+    def test_state_not_leaked(self):
+        shared = {}  # type: dict[str, int]
+
+        @doctestcase(globals={'State': State, 'shared': shared}, isolate=True)
+        class Mutating(TestCase):
+            """
+            >>> import os
+            >>> shared['pid'] = os.getpid()
+            >>> State.value = 'changed'
+            >>> State.value
+            'changed'
+            """
+
+        test = Mutating('test_docstring')
+        result = run(test)
+        self.assertTrue(result.wasSuccessful(), result.failures)
+        self.assertEqual('initial', State.value)
+        self.assertEqual({}, shared)
+        results = test.doctest_results  # type: ignore
+        self.assertEqual([2, 3, 4, 5], [r.lineno for r in results])
+
+    def test_setup_inherited(self):
+        @doctestcase(globals={'State': State}, isolate=True)
+        class WithSetUp(TestCase):
+            """
+            >>> State.value
+            'set up'
+            """
+
+            def setUp(self):
+                State.value = 'set up'
+
+            def tearDown(self):
+                State.value = 'initial'
+
+        result = run(WithSetUp)
+        self.assertTrue(result.wasSuccessful(), result.failures)
+
+    def test_failure(self):
+        @doctestcase(isolate=True)
+        class Failing(TestCase):
+            """
+            >>> 1
+            2
+            """
+
+        result = run(Failing)
+        self.assertEqual(1, len(result.failures))
+        self.assertIn('Line 2, in Failing', result.failures[0][1])
+
+    def test_update(self):
+        @doctestcase(isolate=True)
+        class Base(TestCase):
+            pass
+
+        @doctestcase(options=0)
+        class Child(Base):
+            pass
+
+        self.assertTrue(Child.__doctestcase__.isolate)  # type: ignore
+
+
+@skipUnless(CAN_FORK, 'requires os.fork')
+class TestForkCall(TestCase):
+    def test_result(self):
+        self.assertNotEqual(os.getpid(), fork_call(lambda _: os.getpid(), None))
+
+    def test_error(self):
+        with self.assertRaises(ChildError) as ctx:
+            fork_call(sys.exit, 3)
+        self.assertIn('SystemExit', str(ctx.exception))
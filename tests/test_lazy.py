@@ -0,0 +1,111 @@
+from unittest import TestCase, skipUnless
+
+from doctestcase import doctestcase, lazy
+from doctestcase.globs import LAYERED
+
+from tests.util import assertPass
+
+
+try:
+    from typing import Callable, Iterator  # noqa: F401  # used for typing
+except ImportError:  # Python 2
+    pass
+
+
+class TestLazy(TestCase):
+    def setUp(self):
+        self.log = []
+
+    def factory(self, name):  # type: (str) -> Callable[[], Iterator[str]]
+        def create():
+            self.log.append('create ' + name)
+            yield name
+            self.log.append('teardown ' + name)
+
+        return create
+
+    @skipUnless(LAYERED, 'values are created eagerly')
+    def test_class_scope(self):
+        @doctestcase(
+            globals={'A': lazy(self.factory('a')), 'B': lazy(self.factory('b'))}
+        )
+        class Decorated(TestCase):
+            """
+            >>> A
+            'a'
+            >>> A
+            'a'
+            """
+
+        self.assertEqual([], self.log)
+        assertPass(self, Decorated)
+        self.assertEqual(['create a', 'teardown a'], self.log)
+        assertPass(self, Decorated)
+        self.assertEqual(['create a', 'teardown a'] * 2, self.log)
+
+    @skipUnless(LAYERED, 'values are created eagerly')
+    def test_example_scope(self):
+        value = lazy(self.factory('a'), scope='example')
+
+        @doctestcase(globals={'A': value})
+        class Decorated(TestCase):
+            """
+            >>> A + A
+            'aa'
+            >>> None
+            >>> A
+            'a'
+            """
+
+        assertPass(self, Decorated)
+        self.assertEqual(['create a', 'teardown a'] * 2, self.log)
+
+    def test_session_scope(self):
+        def create():  # type: () -> list[int]
+            self.log.append('create')
+            return []
+
+        value = lazy(create, scope='session')
+
+        @doctestcase(globals={'A': value})
+        class Decorated(TestCase):
+            """
+            >>> A.append(1)
+            >>> len(A) > 0
+            True
+            """
+
+        assertPass(self, Decorated)
+        assertPass(self, Decorated)
+        self.assertEqual(['create'], self.log)
+        self.assertEqual([1, 1], value.get_session())
+
+    def test_layered(self):
+        @doctestcase(globals={'A': lazy(lambda: 'a')}, layered=True)
+        class Decorated(TestCase):
+            """
+            >>> def f():
+            ...     return A
+            >>> f()
+            'a'
+            """
+
+        assertPass(self, Decorated)
+
+    @skipUnless(LAYERED, 'values are created eagerly')
+    def test_not_layered(self):
+        @doctestcase(globals={'A': lazy(lambda: 'a'), 'B': 'b'})
+        class Decorated(TestCase):
+            """
+            >>> sorted(k for k in globals() if not k.startswith('__'))
+            ['B']
+            >>> A
+            'a'
+            >>> del B
+            """
+
+        assertPass(self, Decorated)
+
+    def test_unknown_scope(self):
+        with self.assertRaises(ValueError):
+            lazy(list, scope='module')  # type: ignore[arg-type]
@@ -1,5 +1,5 @@
 import doctest
-from unittest import TestCase
+from unittest import TestCase, skipUnless
 
 from doctestcase import doctestcase
 
@@ -26,3 +26,21 @@ class DefaultOptions(TestCase):
             """
 
         assertPass(self, WithEllipsis)
+
+
+class FailFast(TestCase):
+    @skipUnless(hasattr(doctest, 'FAIL_FAST'), 'requires Python 3.4+')
+    def test_stops_at_first_failure(self):
+        log = []  # type: list[int]
+
+        @doctestcase(globals={'log': log}, options=doctest.FAIL_FAST)
+        class Decorated(TestCase):
+            """
+            >>> log.append(1)
+            >>> True
+            False
+            >>> log.append(2)
+            """
+
+        assertFail(self, Decorated)
+        self.assertEqual([1], log)
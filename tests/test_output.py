@@ -0,0 +1,84 @@
+from doctest import ELLIPSIS
+from unittest import TestCase
+
+from doctestcase import doctestcase
+from doctestcase.runner import RUNNERS, CappedOut
+
+from tests.util import run
+
+
+class TestMaxOutput(TestCase):
+    def test_passing(self):
+        @doctestcase(max_output=100)
+        class Passing(TestCase):
+            """
+            >>> for i in range(3):
+            ...     print(i)
+            0
+            1
+            2
+            >>> print('')
+            <BLANKLINE>
+            >>> print(' ')
+            <BLANKLINE>
+            >>> print('<BLANKLINE>')
+            <BLANKLINE>
+            >>> True
+            1
+            """
+
+        self.assertTrue(run(Passing).wasSuccessful())
+
+    def test_limit(self):
+        @doctestcase(max_output=20, options=ELLIPSIS)
+        class Endless(TestCase):
+            """
+            >>> while True:
+            ...     print('x' * 8)
+            x...
+            >>> print('next')
+            next
+            """
+
+        result = run(Endless)
+        message = result.failures[0][1]
+        self.assertIn('Output exceeds 20 characters, truncated', message)
+        self.assertIn('Got:\n    xxxxxxxx\n    xxxxxxxx\n    xx\n', message)
+        self.assertNotIn('next', message)
+
+    def test_diverged(self):
+        printed = []  # type: list[int]
+
+        @doctestcase(globals={'printed': printed}, max_output=1000)
+        class Diverged(TestCase):
+            """
+            >>> for i in range(100):
+            ...     printed.append(i)
+            ...     print(i)
+            0
+            1
+            3
+            """
+
+        message = run(Diverged).failures[0][1]
+        self.assertIn('Output differs from expected at line 3, truncated', message)
+        self.assertEqual([0, 1, 2], printed)
+
+    def test_not_caught(self):
+        @doctestcase(max_output=5)
+        class Caught(TestCase):
+            """
+            >>> try:
+            ...     print('x' * 10)
+            ... except Exception:
+            ...     print('caught')
+            xxxxxxxxxx
+            """
+
+        self.assertIn('Output exceeds', run(Caught).failures[0][1])
+
+    def test_runner_restored(self):
+        runner = RUNNERS.acquire(max_output=10)
+        self.assertIsInstance(runner._fakeout, CappedOut)  # type: ignore
+        RUNNERS.release(runner)
+        self.assertNotIsInstance(runner._fakeout, CappedOut)  # type: ignore
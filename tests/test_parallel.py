@@ -0,0 +1,69 @@
+import os
+import sys
+import unittest
+from unittest import TestCase
+
+from doctestcase.__main__ import main
+from doctestcase.parallel import ParallelSuite, RemoteError, discover
+
+from tests.cases import failing, parallel
+
+
+class TestParallelSuite(TestCase):
+    def run_suite(self, processes):  # type: (int) -> unittest.TestResult
+        tests = unittest.TestLoader().loadTestsFromModule(parallel)
+        result = unittest.TestResult()
+        ParallelSuite(tests, processes=processes).run(result)
+        return result
+
+    def test_parallel(self):
+        for processes in (1, 2):
+            result = self.run_suite(processes)
+            self.assertEqual(3, result.testsRun)
+            self.assertEqual([], result.errors)
+            self.assertEqual(1, len(result.failures))
+            test, text = result.failures[0]
+            self.assertIsInstance(test, parallel.Failing)
+            self.assertIn('Failed example:\n    True\nExpected:\n    False', text)
+
+    def test_remote_error(self):
+        result = self.run_suite(2)
+        self.assertIn(RemoteError.__name__, result.failures[0][1])
+
+    def test_undecorated_excluded(self):
+        suite = ParallelSuite(unittest.TestLoader().loadTestsFromModule(parallel))
+        self.assertEqual(3, suite.countTestCases())
+        self.assertNotIn(parallel.Undecorated, [t.__class__ for t in suite])
+
+    def test_maxfail(self):
+        tests = unittest.TestLoader().loadTestsFromModule(failing)
+        for processes in (1, 2):
+            result = unittest.TestResult()
+            ParallelSuite(tests, processes=processes, maxfail=2).run(result)
+            self.assertEqual(2, result.testsRun)
+            self.assertEqual(2, len(result.failures))
+            self.assertTrue(result.shouldStop)
+
+    def test_discover(self):
+        suite = discover(['tests.cases.parallel.Passing'])
+        self.assertEqual(2, suite.countTestCases())
+
+
+class TestMain(TestCase):
+    def setUp(self):
+        self.stderr = sys.stderr
+        sys.stderr = open(os.devnull, 'w')
+
+    def tearDown(self):
+        sys.stderr.close()
+        sys.stderr = self.stderr
+
+    def test_pass(self):
+        self.assertEqual(0, main(['run', '-q', 'tests.cases.parallel.Passing']))
+
+    def test_fail(self):
+        self.assertEqual(1, main(['run', '-q', 'tests.cases.parallel']))
+
+    def test_maxfail(self):
+        argv = ['run', '-q', '--maxfail', '1', 'tests.cases.failing']
+        self.assertEqual(1, main(argv))
@@ -0,0 +1,90 @@
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase
+
+from doctestcase import to_markdown, to_rest
+from doctestcase.__main__ import main
+from doctestcase.render import Renderer
+
+from tests.usage.simple import SimpleCase
+
+
+class TestRenderer(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_find(self):
+        renderer = Renderer(['tests/usage'])
+        (entry,) = renderer.find('tests.usage.simple.SimpleCase')
+        self.assertEqual(to_markdown(SimpleCase), to_markdown(entry.doc))
+        self.assertIn(entry, renderer.find('tests.usage.*'))
+        with self.assertRaises(ValueError):
+            renderer.find('tests.usage.Missing')
+
+    def test_find_path(self):
+        renderer = Renderer([])
+        (entry,) = renderer.find('tests/usage/simple.py:SimpleCase')
+        self.assertEqual('tests.usage.simple.SimpleCase', entry.name)
+        with self.assertRaises(ValueError):
+            renderer.find('tests/usage/simple.py:Missing')
+
+    def test_render(self):
+        renderer = Renderer([])
+        doc = SimpleCase.__doc__ or ''
+        self.assertEqual(to_markdown(doc), renderer.render(doc))
+        self.assertEqual(
+            to_rest(doc, title_char='='), renderer.render(doc, 'rest', title_char='=')
+        )
+
+    def test_cache(self):
+        renderer = Renderer([], cache_dir=self.tmp)
+        text = renderer.render('Title\n\n>>> 1\n1\n', title_depth=3)
+        self.assertEqual(1, len(os.listdir(self.tmp)))
+        self.assertEqual('### Title\n\n```pycon\n>>> 1\n1\n```\n', text)
+        (name,) = os.listdir(self.tmp)
+        with open(os.path.join(self.tmp, name), 'w') as f:
+            f.write('cached')
+        self.assertEqual(
+            'cached', renderer.render('Title\n\n>>> 1\n1\n', title_depth=3)
+        )
+        renderer.render('Title\n\n>>> 1\n1\n', title_depth=3, include_title=False)
+        self.assertEqual(2, len(os.listdir(self.tmp)))
+
+
+class TestMain(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_output_dir(self):
+        argv = ['render', 'tests.usage.simple.*', '-s', 'tests/usage', '-f', 'rest']
+        self.assertEqual(0, main(argv + ['-o', self.tmp]))
+        path = os.path.join(self.tmp, 'tests.usage.simple.SimpleCase.rst')
+        with open(path) as f:
+            self.assertEqual(to_rest(SimpleCase), f.read())
+
+    def test_index_file(self):
+        index = os.path.join(self.tmp, 'index.json')
+        stdout, sys.stdout = sys.stdout, open(os.devnull, 'w')
+        try:
+            argv = ['render', 'tests/usage/simple.py:SimpleCase', '-s', 'tests/usage']
+            self.assertEqual(0, main(argv + ['--index', index]))
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+        self.assertTrue(os.path.exists(index))
+
+    def test_not_found(self):
+        stderr, sys.stderr = sys.stderr, open(os.devnull, 'w')
+        try:
+            self.assertEqual(1, main(['render', 'missing.Case', '-s', 'tests/usage']))
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
@@ -0,0 +1,84 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import TestCase
+from xml.etree import ElementTree
+
+from doctestcase import doctestcase
+from doctestcase.__main__ import main
+
+
+class TestResults(TestCase):
+    def setUp(self):
+        @doctestcase()
+        class Mixed(TestCase):
+            """
+            Title
+
+            >>> 1
+            1
+            >>> 2
+            3
+            >>> 1 / 0
+            """
+
+        self.case = Mixed
+
+    def test_doctest_results(self):
+        case = self.case('test_docstring')
+        result = unittest.TestResult()
+        case.run(result)
+        results = case.doctest_results  # type: ignore
+        self.assertEqual([4, 6, 8], [r.lineno for r in results])
+        self.assertEqual(['success', 'failure', 'error'], [r.outcome for r in results])
+        self.assertEqual(('2\n', '3\n', '2\n'), results[1][1:4])
+        self.assertIn('ZeroDivisionError', results[2].got)
+        self.assertTrue(all(r.duration >= 0 for r in results))
+
+    def test_failure_message(self):
+        result = unittest.TestResult()
+        self.case('test_docstring').run(result)
+        text = result.failures[0][1]
+        self.assertIn('Failed example:\n    2\nExpected:\n    3\nGot:\n    2', text)
+        self.assertIn('ZeroDivisionError', text)
+
+
+class TestReports(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.stderr = sys.stderr
+        sys.stderr = open(os.devnull, 'w')
+
+    def tearDown(self):
+        sys.stderr.close()
+        sys.stderr = self.stderr
+        shutil.rmtree(self.tmp)
+
+    def test_reports(self):
+        jsonl = os.path.join(self.tmp, 'results.jsonl')
+        junit = os.path.join(self.tmp, 'results.xml')
+        for jobs in ('1', '2'):
+            argv = ['run', '-q', '-j', jobs, '--jsonl', jsonl, '--junit-xml', junit]
+            self.assertEqual(1, main(argv + ['tests.cases.parallel']))
+
+            with open(jsonl) as f:
+                lines = [json.loads(line) for line in f]
+            self.assertEqual(
+                [
+                    ('tests.cases.parallel.Failing.test_docstring', 'failure'),
+                    ('tests.cases.parallel.Passing.test_docstring', 'success'),
+                ],
+                [(r['case'], r['outcome']) for r in lines],
+            )
+            self.assertEqual('False\n', lines[0]['want'])
+            self.assertEqual('True\n', lines[0]['got'])
+
+            root = ElementTree.parse(junit).getroot()  # noqa: S314  # written by test
+            suite = root.find('testsuite')
+            cases = suite.findall('testcase')  # type: ignore
+            self.assertEqual(2, len(cases))
+            self.assertEqual('True', cases[0].find('failure').get('message'))  # type: ignore
+            self.assertIsNone(cases[1].find('failure'))
@@ -0,0 +1,127 @@
+import doctest
+import sys
+import unittest
+from unittest import TestCase
+
+from doctestcase import doctestcase
+from doctestcase.listener import Listener
+from doctestcase.runner import RUNNERS, RunnerPool
+
+from tests.util import assertFail, assertPass
+
+
+class TestRunnerPool(TestCase):
+    def test_reused(self):
+        pool = RunnerPool()
+        runner = pool.acquire(optionflags=doctest.ELLIPSIS)
+        runner.tries = runner.failures = 1
+        pool.release(runner)
+        self.assertIs(runner, pool.acquire(optionflags=doctest.ELLIPSIS))
+        self.assertEqual((0, 0), (runner.tries, runner.failures))
+        self.assertIsNone(runner.test)
+
+    def test_keyed_by_options(self):
+        pool = RunnerPool()
+        runner = pool.acquire()
+        pool.release(runner)
+        other = pool.acquire(optionflags=doctest.ELLIPSIS)
+        self.assertIsNot(runner, other)
+        self.assertEqual(doctest.ELLIPSIS, other.optionflags)
+
+    def test_report_only_first_failure(self):
+        pool = RunnerPool()
+        runner = pool.acquire(optionflags=doctest.REPORT_ONLY_FIRST_FAILURE)
+        self.assertEqual(0, runner.optionflags)
+        pool.release(runner)
+        flags = doctest.REPORT_ONLY_FIRST_FAILURE
+        self.assertIs(runner, pool.acquire(optionflags=flags))
+
+    def test_not_verbose(self):
+        argv, sys.argv = sys.argv, sys.argv + ['-v']  # verbose doctest default
+        try:
+            runner = RunnerPool().acquire()
+        finally:
+            sys.argv = argv
+        self.assertFalse(runner._verbose)  # type: ignore
+
+    def test_nested(self):
+        pool = RunnerPool()
+        runner = pool.acquire()
+        self.assertIsNot(runner, pool.acquire())
+
+
+class TestPooledRuns(TestCase):
+    def test_failures_not_carried(self):
+        @doctestcase()
+        class Failing(TestCase):
+            """
+            >>> 1
+            2
+            """
+
+        @doctestcase()
+        class Passing(TestCase):
+            """
+            >>> 1
+            1
+            """
+
+        assertFail(self, Failing)
+        assertPass(self, Passing)
+
+    def test_nested_runs(self):
+        @doctestcase()
+        class Inner(TestCase):
+            """
+            >>> 1
+            1
+            """
+
+        @doctestcase(globals={'Inner': Inner, 'assertPass': assertPass})
+        class Outer(TestCase):
+            """
+            >>> assertPass(self, Inner)
+            >>> 2
+            2
+            """
+
+        Outer.__doctestcase__.globals['self'] = self  # type: ignore
+        assertPass(self, Outer)
+        self.assertTrue(
+            all(r.test is None for r in RUNNERS.idle[0, doctest.OutputChecker])
+        )
+
+
+class Outcomes(Listener):
+    def __init__(self):  # type: () -> None
+        self.outcomes = []  # type: list[str]
+
+    def end_example(self, test, example, outcome, got):
+        self.outcomes.append(outcome)
+
+
+class TestReportOnlyFirstFailure(TestCase):
+    def test_listeners_notified(self):
+        listener = Outcomes()
+
+        @doctestcase(options=doctest.REPORT_ONLY_FIRST_FAILURE, listeners=[listener])
+        class Failing(TestCase):
+            """
+            >>> 1
+            2
+            >>> 2
+            3
+            >>> raise ValueError
+            >>> 3
+            3
+            """
+
+        test = Failing('test_docstring')
+        result = unittest.TestResult()
+        test.run(result)
+        message = result.failures[0][1]
+        self.assertEqual(['failure', 'failure', 'error', 'success'], listener.outcomes)
+        self.assertEqual(4, len(test.doctest_results))  # type: ignore
+        self.assertIn('Line 2, in Failing', message)
+        self.assertNotIn('Line 4', message)
+        self.assertNotIn('ValueError', message)
@@ -0,0 +1,110 @@
+import random
+import re
+from unittest import TestCase
+
+from doctestcase.format import ParsedDoc, get_doc, parse_title_body
+
+
+try:
+    from typing import Iterator, List, Tuple  # noqa: F401  # used for typing
+except ImportError:  # Python 2
+    pass
+
+
+# regular expressions replaced by scanner, used as reference implementation
+
+RX_DOCSTRING = re.compile(
+    r"""\A
+    (?P<title> (?!\s*>>> ) .+?)           # not PS1 line
+    ( (?:\n[ \t]*$)+ \n (?P<body>.*?) )?
+    \Z""",
+    flags=re.DOTALL | re.MULTILINE | re.VERBOSE,
+)
+RX_EXAMPLE_BLOCK = re.compile(
+    r"""
+    # Example block consists of a PS1 line followed by non-blank line
+    #   or a series of blank lines followed by PS1 line.
+    ^(?= [ ]* >>> )  # starts with PS1 line
+    (?:
+       [ ]* >>> .*                       $  # PS1 line
+      |\n (?![ ]*$) .+                   $  # non-blank line
+      |(?: \n [ ]* $)+ (?= \n [ ]* >>> ) $  # blank lines followed by PS1 line
+    )*
+    \n
+    """,
+    flags=re.MULTILINE | re.VERBOSE,
+)
+
+
+def reference_title_body(doc, parse_title):  # type: (str, bool) -> Tuple[str, str]
+    title, body = '', doc
+    if parse_title:
+        match = RX_DOCSTRING.match(doc)
+        if match is not None:
+            title = ' '.join((t.strip() for t in match.group('title').splitlines()))
+            body = match.group('body')
+    if body is not None:
+        body = body.strip()
+        if body:
+            body += '\n'
+    return title, body
+
+
+def reference_body_items(body):  # type: (str) -> Iterator[Tuple[str, bool]]
+    charno = 0
+    for m in RX_EXAMPLE_BLOCK.finditer(body):
+        yield body[charno : m.start()], False
+        yield body[m.start() : m.end()], True
+        charno = m.end()
+    yield body[charno:], False
+
+
+def body_items(body):  # type: (str) -> List[Tuple[str, bool]]
+    parsed = ParsedDoc('', body)
+    return [(parsed.body[i:j], example) for i, j, example in parsed.spans()]
+
+
+TOKENS = ('>>> ', '>>>', '... ', 'a', 'b c', ' ', '  ', '\t', '\n', '\n', '\n', '\r')
+
+
+class Equivalence(TestCase):
+    def assertEquivalent(self, doc):  # type: (str) -> None
+        for parse_title in (True, False):
+            self.assertEqual(
+                reference_title_body(doc, parse_title),
+                parse_title_body(doc, parse_title),
+                repr(doc),
+            )
+        expected = [i for i in reference_body_items(doc) if i[0]]
+        self.assertEqual(expected, body_items(doc), repr(doc))
+
+    def test_random(self):
+        rnd = random.Random(0)  # noqa: S311
+        for _ in range(3000):
+            doc = ''.join(rnd.choice(TOKENS) for _ in range(rnd.randint(0, 30)))
+            self.assertEquivalent(doc)
+            self.assertEquivalent(get_doc(doc, dedent=True))
+            self.assertEquivalent(get_doc(doc, dedent=False))
+
+    def test_edge_cases(self):
+        for doc in (
+            '',
+            '\n',
+            '\n\n',
+            'T',
+            '>>> x',
+            ' >>> x\n',
+            'T\n\n>>> x\n\n\n>>> y\ny\n\n \nz\n',
+            'T\n\t\n>>> x\n\t\n>>> y',
+            '>>> x\n1\n>>> y',
+            '>>> x\n\n>>> y',
+        ):
+            self.assertEquivalent(doc)
+
+
+class Complexity(TestCase):
+    def test_many_blank_lines(self):
+        body = '>>> x\n' + ' \n' * 100000 + 'text\n'
+        self.assertEqual(
+            [('>>> x\n', True), (' \n' * 100000 + 'text\n', False)], body_items(body)
+        )
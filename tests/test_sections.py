@@ -0,0 +1,108 @@
+from doctest import DocTest, DocTestParser
+import os
+from unittest import TestCase, skipUnless
+
+from doctestcase import doctestcase
+from doctestcase.execute import split_sections
+from doctestcase.fork import CAN_FORK, ChildError, fork_map
+
+from tests.util import run
+
+
+DOC = """
+Title
+
+>>> X = 1
+>>> X
+1
+
+>>> X + 1
+2
+
+Text.
+
+>>> Y = 2
+>>> 'X' in globals()
+False
+"""
+
+
+def make_test(doc):  # type: (str) -> DocTest
+    parser = DocTestParser()
+    return DocTest(parser.get_examples(doc), {}, 'Test', None, 0, doc)
+
+
+class TestSplit(TestCase):
+    def test_split(self):
+        sections = split_sections(make_test(DOC))
+        self.assertEqual(
+            [['X = 1\n', 'X\n', 'X + 1\n'], ['Y = 2\n', "'X' in globals()\n"]],
+            [[e.source for e in s.examples] for s in sections],
+        )
+
+    def test_no_text(self):
+        sections = split_sections(make_test('>>> 1\n1\n>>> 2\n2\n'))
+        self.assertEqual(1, len(sections))
+
+
+class TestSections(TestCase):
+    def check(self, sections):  # type: (int) -> dict[str, int]
+        shared = {}  # type: dict[str, int]
+
+        @doctestcase(globals={'shared': shared}, sections=sections)
+        class Sections(TestCase):
+            """
+            >>> shared['pid'] = __import__('os').getpid()
+            >>> X = 1
+
+            Text.
+
+            >>> X
+            Traceback (most recent call last):
+            ...
+            NameError: name 'X' is not defined
+            """
+
+        test = Sections('test_docstring')
+        result = run(test)
+        self.assertTrue(result.wasSuccessful(), result.failures)
+        results = test.doctest_results  # type: ignore
+        self.assertEqual([2, 3, 7], [r.lineno for r in results])
+        return shared
+
+    def test_serial(self):
+        shared = self.check(1)
+        self.assertEqual(os.getpid(), shared['pid'])
+
+    @skipUnless(CAN_FORK, 'requires os.fork')
+    def test_forked(self):
+        self.assertEqual({}, self.check(2))
+
+    def test_failures_joined(self):
+        @doctestcase(sections=2)
+        class Failing(TestCase):
+            """
+            >>> 1
+            2
+
+            Text.
+
+            >>> 3
+            4
+            """
+
+        result = run(Failing)
+        message = result.failures[0][1]
+        self.assertIn('Line 2, in Failing', message)
+        self.assertIn('Line 7, in Failing', message)
+
+
+@skipUnless(CAN_FORK, 'requires os.fork')
+class TestForkMap(TestCase):
+    def test_order(self):
+        self.assertEqual([0, 1, 4, 9, 16], fork_map(lambda x: x * x, range(5), 2))
+
+    def test_error(self):
+        with self.assertRaises(ChildError) as ctx:
+            fork_map(lambda x: 1 // x, [1, 0], 2)
+        self.assertIn('ZeroDivisionError', str(ctx.exception))
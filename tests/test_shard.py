@@ -0,0 +1,141 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+from unittest import TestCase
+
+from doctestcase import doctestcase
+from doctestcase.__main__ import main
+from doctestcase.shard import (
+    TimingReport,
+    load_timings,
+    merge_timings,
+    parse_shard,
+    split_shards,
+)
+
+from tests.cases import parallel
+
+
+try:
+    from typing import List  # noqa: F401  # used for typing
+except ImportError:  # Python 2
+    pass
+
+
+def make_case(name, examples):  # type: (str, int) -> TestCase
+    cls = type(name, (TestCase,), {'__doc__': '>>> None\n' * examples})
+    return doctestcase()(cls)('test_docstring')  # type: ignore
+
+
+def names(shards):  # type: (List[List[TestCase]]) -> List[List[str]]
+    return [[t.__class__.__name__ for t in shard] for shard in shards]
+
+
+class TestSplit(TestCase):
+    def setUp(self):
+        self.tests = [
+            make_case('A', 1),
+            make_case('B', 4),
+            make_case('C', 2),
+            make_case('D', 2),
+            make_case('E', 1),
+        ]
+
+    def test_by_examples(self):
+        shards = split_shards(self.tests, 2)
+        self.assertEqual([['A', 'B'], ['C', 'D', 'E']], names(shards))
+
+    def test_by_timings(self):
+        timings = dict((t.id(), 1.0) for t in self.tests)
+        timings[self.tests[0].id()] = 10.0
+        shards = split_shards(self.tests, 2, timings)
+        self.assertEqual([['A'], ['B', 'C', 'D', 'E']], names(shards))
+
+    def test_estimated_from_timings(self):
+        # one example of A takes 3 seconds, so B is estimated to take 12
+        timings = {self.tests[0].id(): 3.0}
+        shards = split_shards(self.tests, 3, timings)
+        self.assertEqual([['B'], ['A', 'C'], ['D', 'E']], names(shards))
+
+    def test_deterministic(self):
+        shards = split_shards(list(reversed(self.tests)), 2)
+        self.assertEqual([['B', 'A'], ['E', 'D', 'C']], names(shards))
+
+    def test_classes_not_split(self):
+        tests = [
+            parallel.Passing('test_docstring'),
+            parallel.Failing('test_docstring'),
+            parallel.Passing('test_method'),
+        ]
+        shards = split_shards(tests, 2)
+        self.assertEqual([['Passing', 'Passing'], ['Failing']], names(shards))
+
+    def test_more_shards_than_tests(self):
+        shards = split_shards(self.tests[:1], 3)
+        self.assertEqual([['A'], [], []], names(shards))
+
+
+class TestParse(TestCase):
+    def test_parse(self):
+        self.assertEqual((0, 4), parse_shard('1/4'))
+        self.assertEqual((3, 4), parse_shard('4/4'))
+        for value in ('0/4', '5/4', '1', 'a/b', '-1/2'):
+            with self.assertRaises(ValueError):
+                parse_shard(value)
+
+
+class TestTimings(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmp, 'timings.json')
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp)
+
+    def test_report(self):
+        self.assertEqual({}, load_timings(self.path))
+        with open(self.path, 'w') as f:
+            json.dump({'old': 1.0, 'tests.Case.test_docstring': 2.0}, f)
+        report = TimingReport(self.path)
+        case = make_case('Case', 1)
+        case.run()
+        report.add(case, case.doctest_results)  # type: ignore
+        report.close()
+        timings = load_timings(self.path)
+        self.assertEqual(1.0, timings['old'])
+        self.assertLess(timings[case.id()], 1.0)
+
+    def test_merge(self):
+        paths = [os.path.join(self.tmp, n) for n in ('1.json', '2.json')]
+        with open(paths[0], 'w') as f:
+            json.dump({'a': 1.0, 'b': 2.0}, f)
+        with open(paths[1], 'w') as f:
+            json.dump({'b': 3.0}, f)
+        self.assertEqual({'a': 1.0, 'b': 3.0}, merge_timings(paths))
+
+    def test_main(self):
+        stderr, sys.stderr = sys.stderr, open(os.devnull, 'w')
+        try:
+            argv = ['run', '-q', '-j', '1', 'tests.cases.parallel']
+            self.assertEqual(1, main(argv + ['--timings-out', self.path]))
+            timings = load_timings(self.path)
+            self.assertEqual(2, len(timings))
+            # shards are split by the same timings file, which is not changed
+            results, outputs = [], []
+            for shard in ('1/2', '2/2'):
+                outputs.append(os.path.join(self.tmp, shard[0] + '.json'))
+                opts = ['--timings', self.path, '--timings-out', outputs[-1]]
+                results.append(main(argv + opts + ['--shard', shard]))
+            self.assertEqual([0, 1], sorted(results))  # Failing is on one shard
+            self.assertEqual(timings, load_timings(self.path))
+            merged = os.path.join(self.tmp, 'merged.json')
+            self.assertEqual(0, main(['timings', '-o', merged] + outputs))
+            self.assertEqual(sorted(timings), sorted(load_timings(merged)))
+            with self.assertRaises(SystemExit):
+                opts = ['--timings', self.path, '--timings-out', self.path]
+                main(argv + opts + ['--shard', '1/2'])
+        finally:
+            sys.stderr.close()
+            sys.stderr = stderr
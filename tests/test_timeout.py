@@ -0,0 +1,134 @@
+from doctest import REPORT_ONLY_FIRST_FAILURE
+import signal
+import threading
+import time
+from unittest import TestCase, skipUnless
+
+from doctestcase import doctestcase
+
+from tests.util import run
+
+
+class TestTimeout(TestCase):
+    def assertTimedOut(self, case, seconds):  # type: (type[TestCase], str) -> str
+        started = time.time()
+        result = run(case)
+        self.assertLess(time.time() - started, 5)
+        self.assertEqual(1, len(result.failures), result.errors)
+        message = result.failures[0][1]
+        self.assertIn('Example timed out after {} seconds'.format(seconds), message)
+        return message
+
+    @skipUnless(hasattr(signal, 'setitimer'), 'requires SIGALRM')
+    def test_case_timeout(self):
+        handler = signal.getsignal(signal.SIGALRM)
+
+        @doctestcase(globals={'time': time}, timeout=0.2)
+        class Sleeping(TestCase):
+            """
+            >>> 1
+            1
+            >>> time.sleep(10)
+            """
+
+        message = self.assertTimedOut(Sleeping, '0.2')
+        self.assertIn('Failed example:\n    time.sleep(10)', message)
+        self.assertIn("Thread 'MainThread'", message)
+        self.assertIs(handler, signal.getsignal(signal.SIGALRM))
+
+    @skipUnless(hasattr(signal, 'setitimer'), 'requires SIGALRM')
+    def test_outer_timer_restored(self):
+        @doctestcase(timeout=5)
+        class Passing(TestCase):
+            """
+            >>> 1
+            1
+            """
+
+        signal.setitimer(signal.ITIMER_REAL, 30, 10)
+        try:
+            self.assertTrue(run(Passing).wasSuccessful())
+            delay, interval = signal.getitimer(signal.ITIMER_REAL)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+        self.assertTrue(25 < delay <= 30, delay)
+        self.assertEqual(10, interval)
+
+    @skipUnless(hasattr(signal, 'setitimer'), 'requires SIGALRM')
+    def test_outer_timer_earlier(self):
+        @doctestcase(globals={'time': time}, timeout=5)
+        class Sleeping(TestCase):
+            """
+            >>> while True:
+            ...     time.sleep(0.01)
+            """
+
+        class OuterAlarm(Exception):
+            pass
+
+        def on_alarm(signum, frame):
+            raise OuterAlarm()
+
+        handler = signal.signal(signal.SIGALRM, on_alarm)
+        signal.setitimer(signal.ITIMER_REAL, 0.2)
+        try:
+            result = run(Sleeping)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, handler)
+        self.assertIn('OuterAlarm', result.failures[0][1])
+
+    @skipUnless(hasattr(signal, 'setitimer'), 'requires SIGALRM')
+    def test_directive(self):
+        @doctestcase(globals={'time': time})
+        class Sleeping(TestCase):
+            """
+            >>> time.sleep(0.01)  # doctestcase: timeout=5
+            >>> time.sleep(10)  # doctestcase: timeout=0.1
+            """
+
+        self.assertTimedOut(Sleeping, '0.1')
+
+    def test_after_first_failure(self):
+        @doctestcase(
+            globals={'time': time}, options=REPORT_ONLY_FIRST_FAILURE, timeout=0.2
+        )
+        class Sleeping(TestCase):
+            """
+            >>> 1
+            2
+            >>> while True:
+            ...     time.sleep(0.01)
+            """
+
+        started = time.time()
+        result = run(Sleeping)
+        self.assertLess(time.time() - started, 5)
+        self.assertEqual(1, len(result.failures))
+
+    def test_thread(self):
+        messages = []  # type: list[str]
+        thread = threading.Thread(
+            target=lambda: messages.append(self.assertTimedOut(Sleeping, '0.2'))
+        )
+
+        @doctestcase(globals={'time': time}, timeout=0.2)
+        class Sleeping(TestCase):
+            """
+            >>> while True:
+            ...     time.sleep(0.01)
+            """
+
+        thread.start()
+        thread.join()
+        self.assertEqual(1, len(messages))
+
+    def test_passing(self):
+        @doctestcase(timeout=5)
+        class Passing(TestCase):
+            """
+            >>> 1
+            1
+            """
+
+        self.assertTrue(run(Passing).wasSuccessful())
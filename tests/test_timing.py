@@ -0,0 +1,127 @@
+from unittest import TestCase, skipIf
+
+from doctestcase import doctestcase
+from doctestcase.runner import Listener
+from doctestcase.timing import Timer, tracemalloc
+
+from tests.util import assertFail, assertPass
+
+
+class Log(Listener):
+    def __init__(self):  # type: () -> None
+        self.events = []  # type: list[tuple[str, str]]
+
+    def start_example(self, test, example):
+        self.events.append(('start', example.source.strip()))
+
+    def end_example(self, test, example, outcome, got):
+        self.events.append((outcome, example.source.strip()))
+
+
+class TestListeners(TestCase):
+    def test_outcomes(self):
+        log = Log()
+
+        @doctestcase(listeners=[log])
+        class Decorated(TestCase):
+            """
+            >>> 1
+            1
+            >>> 2
+            3
+            >>> 1 / 0
+            """
+
+        assertFail(self, Decorated)
+        self.assertEqual(
+            [
+                ('start', '1'),
+                ('success', '1'),
+                ('start', '2'),
+                ('failure', '2'),
+                ('start', '1 / 0'),
+                ('error', '1 / 0'),
+            ],
+            log.events,
+        )
+
+    def test_inherited(self):
+        log1, log2 = Log(), Log()
+
+        @doctestcase(listeners=[log1])
+        class Base(TestCase):
+            pass
+
+        @doctestcase(listeners=[log2, log1])
+        class Child(Base):
+            """
+            >>> None
+            """
+
+        self.assertEqual([log1], Base.__doctestcase__.listeners)  # type: ignore
+        self.assertEqual([log1, log2], Child.__doctestcase__.listeners)  # type: ignore
+        assertPass(self, Child)
+        self.assertEqual(2, len(log1.events))
+        self.assertEqual(2, len(log2.events))
+
+
+class TestTimer(TestCase):
+    def test_records(self):
+        timer = Timer()
+
+        @doctestcase(listeners=[timer])
+        class Decorated(TestCase):
+            """
+            Title
+
+            >>> x = sum(range(100000))
+            >>> x
+            4999950000
+            """
+
+        assertPass(self, Decorated)
+        self.assertEqual(2, len(timer.records))
+        first, second = timer.records
+        self.assertEqual(('Decorated', 4, 'success'), first[:2] + first[3:4])
+        self.assertEqual('x\n', second.source)
+        self.assertGreater(first.wall, 0)
+        self.assertIsNone(first.memory)
+        self.assertIsNone(first.profile)
+        self.assertEqual([first], timer.slowest(1))
+        summary = timer.summary(count=1)
+        self.assertTrue(summary.startswith('1 slowest of 2 examples'))
+        self.assertIn('Decorated:4 x = sum(range(100000))', summary)
+
+    @skipIf(tracemalloc is None, 'requires tracemalloc')
+    def test_memory(self):
+        timer = Timer(memory=True)
+
+        @doctestcase(listeners=[timer])
+        class Decorated(TestCase):
+            """
+            >>> data = list(range(100000))
+            >>> del data
+            """
+
+        assertPass(self, Decorated)
+        allocated, released = timer.records
+        self.assertGreater(allocated.memory, 400000)  # type: ignore
+        self.assertGreaterEqual(allocated.peak, allocated.memory)  # type: ignore
+        self.assertLess(released.memory, 1000)  # type: ignore
+        self.assertFalse(tracemalloc.is_tracing())  # type: ignore
+
+    def test_profile(self):
+        timer = Timer(profile=True)
+
+        @doctestcase(globals={'sorted': sorted}, listeners=[timer])
+        class Decorated(TestCase):
+            """
+            >>> sorted([2, 1])
+            [1, 2]
+            """
+
+        self.assertIsNone(timer.stats())
+        assertPass(self, Decorated)
+        stats = timer.stats()
+        self.assertIsNotNone(stats)
+        self.assertTrue(any('sorted' in f[2] for f in stats.stats))  # type: ignore
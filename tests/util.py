@@ -1,6 +1,12 @@
 from unittest import TestCase, TestResult  # noqa: F401  # used for typing
 
 
+try:
+    from typing import Union  # noqa: F401  # used for typing
+except ImportError:  # Python 2
+    pass
+
+
 def assertIndepend(self, deco1, deco2):
     self.assertIsNot(deco1, deco2)
     self.assertIsNot(deco1.globals, deco2.globals)
@@ -26,21 +32,26 @@ def assertExtended(self, deco1, deco2, deco3):
     self.assertEqual(kwargs, deco3.kwargs)
 
 
-def assertError(self, case, errmsg):  # type: (TestCase, type[TestCase], str) -> None
+def run(case):  # type: (Union[type[TestCase], TestCase]) -> TestResult
+    # test_docstring of test case class, or test case itself
+    test = case('test_docstring') if isinstance(case, type) else case
     result = TestResult()
-    case('test_docstring').run(result)
+    test.run(result)
+    return result
+
+
+def assertError(self, case, errmsg):  # type: (TestCase, type[TestCase], str) -> None
+    result = run(case)
     self.assertIn(errmsg, str(result.errors[0][1]))
 
 
 def assertFail(self, case):  # type: (TestCase, type[TestCase]) -> None
-    result = TestResult()
-    case('test_docstring').run(result)
+    result = run(case)
     self.assertIsNot(result, None)
     self.assertFalse(result.wasSuccessful())
 
 
 def assertPass(self, case):  # type: (TestCase, type[TestCase]) -> None
-    result = TestResult()
-    case('test_docstring').run(result)
+    result = run(case)
     self.assertIsNot(result, None)
     self.assertTrue(result.wasSuccessful())